@@ -0,0 +1,100 @@
+# actor_store.py
+# NOTE: Struct-of-arrays storage for enemy populations. Hot per-enemy fields
+# (health, stealth, size, zone, alive) live in numpy columns; Enemy
+# objects attached to a store are thin views onto one row. The store only
+# holds the values: "living enemies in room X" is answered by the room's
+# map_utils.RoomIndex, which enemies keep current through their setters.
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from enemy import Enemy
+
+
+class ActorStore:
+    """
+    Columns of the enemies of one world or session, one row per enemy. Rows
+    freed by remove() are reused by later adds.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.health = np.zeros(capacity, dtype=np.int32)
+        self.stealth = np.zeros(capacity, dtype=np.int16)
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self.zone = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.actors: List[Optional[Enemy]] = []
+        self._free: List[int] = []  # rows released by remove()
+
+        # Interned zone names; the zone column holds their indexes
+        self.zone_names: List[str] = []
+        self._zone_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self.count - len(self._free)
+
+    def zone_index(self, zone_name: str) -> int:
+        index = self._zone_index.get(zone_name)
+        if index is None:
+            index = self._zone_index[zone_name] = len(self.zone_names)
+            self.zone_names.append(zone_name)
+        return index
+
+    def _grow(self):
+        capacity = max(64, len(self.health) * 2)
+        for column in ("health", "stealth", "size", "zone", "alive"):
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, column, new)
+
+    # Membership
+
+    def add(self, enemy: Enemy, zone_name: Optional[str] = None) -> int:
+        """
+        Move an enemy's hot fields into a row (a freed one if any) and turn it into a view.
+
+        Args:
+            enemy (Enemy): A detached enemy (not yet in any store).
+            zone_name (Optional[str]): Zone within the room; defaults to enemy.current_zone.
+
+        Returns:
+            int: The enemy's row.
+        """
+        if enemy._store is not None:
+            raise ValueError(f"{enemy.name} already belongs to a store")
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self.count == len(self.health):
+                self._grow()
+            slot = self.count
+            self.count += 1
+            self.actors.append(None)
+        self.health[slot] = enemy._health
+        self.alive[slot] = enemy._health > 0
+        self.stealth[slot] = enemy._stealth
+        self.size[slot] = enemy._size
+        self.zone[slot] = self.zone_index(zone_name or enemy._current_zone)
+        self.actors[slot] = enemy
+        enemy._store, enemy._slot = self, slot
+        return slot
+
+    def add_room(self, room):
+        """Add every enemy in a room's zones (in zone order) and attach the room to this store."""
+        for zone_name, zone in room.zones.items():
+            for enemy in zone.enemies:
+                self.add(enemy, zone_name)
+        room.actors = self
+
+    def remove(self, enemy: Enemy):
+        """Detach an enemy: its row is cleared and the object keeps its own values again."""
+        slot = enemy._slot
+        enemy._health, enemy._stealth, enemy._size = int(self.health[slot]), int(self.stealth[slot]), int(self.size[slot])
+        enemy._current_zone = self.zone_names[self.zone[slot]]
+        enemy._store = enemy._slot = None
+        self.alive[slot] = False
+        self.actors[slot] = None
+        self._free.append(slot)
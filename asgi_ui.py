@@ -0,0 +1,144 @@
+# asgi_ui.py
+# NOTE: Async front end. Each player keeps one WebSocket open and every command
+# gets back only the lines it produced, instead of a full page re-render.
+# Plain ASGI with no framework; serve with `uvicorn asgi_ui:app`.
+
+import json
+from typing import Optional, Tuple
+
+from engine import build_game, run_command
+from messaging import render_events
+from session_store import SessionStore
+
+sessions = SessionStore()
+
+PAGE = """<!doctype html>
+<meta charset="utf-8">
+<title>Dungeon Crawler</title>
+<h1>🧱 Dungeon Crawler</h1>
+<form id="form">
+    <input id="input" placeholder="Enter your name" required autofocus>
+    <button>Go</button>
+</form>
+<pre id="log"></pre>
+<script>
+const log = document.getElementById("log");
+const input = document.getElementById("input");
+const ws = new WebSocket((location.protocol === "https:" ? "wss://" : "ws://") + location.host + "/ws");
+let session = sessionStorage.getItem("session");
+ws.onopen = () => { if (session) ws.send(JSON.stringify({command: "resume", session})); };
+ws.onmessage = (msg) => {
+    const data = JSON.parse(msg.data);
+    if ("session" in data) {
+        session = data.session;
+        session ? sessionStorage.setItem("session", session) : sessionStorage.removeItem("session");
+        input.placeholder = session ? "Enter command (exit name/a/r/look/go <place>/quit)" : "Enter your name";
+    }
+    for (const line of data.lines || []) log.textContent += line + "\\n";
+    if (data.error) log.textContent += data.error + "\\n";
+    window.scrollTo(0, document.body.scrollHeight);
+};
+document.getElementById("form").onsubmit = (e) => {
+    e.preventDefault();
+    const text = input.value.trim();
+    ws.send(JSON.stringify(session ? {command: text.toLowerCase()} : {command: "start", name: text}));
+    input.value = "";
+};
+</script>
+"""
+
+
+def handle_message(session_id: Optional[str], message: dict) -> Tuple[dict, Optional[str]]:
+    """
+    Apply one client message to the player's session.
+
+    Args:
+        session_id (Optional[str]): Session bound to this connection, if any.
+        message (dict): {"command": ..., plus "name" for start or "session" for resume}.
+
+    Returns:
+        tuple: (reply dict to send back, session id bound to the connection afterwards).
+    """
+    cmd = str(message.get("command", "")).strip().lower()
+
+    if cmd == "start":
+        sessions.discard(session_id)
+        session_id = sessions.create(build_game(str(message.get("name") or "Adventurer")))
+        with sessions.session(session_id) as game:
+            return {"session": session_id, "lines": render_events(game.look())}, session_id
+
+    if cmd == "resume":
+        resumed = message.get("session")
+        with sessions.session(resumed) as game:
+            if game is None:
+                return {"session": None, "error": "Session expired, enter your name to start again."}, None
+            return {"session": resumed, "lines": render_events(game.look())}, resumed
+
+    if cmd == "quit":
+        sessions.discard(session_id)
+        return {"session": None, "lines": ["Thanks for playing!"]}, None
+
+    with sessions.session(session_id) as game:
+        if game is None:
+            return {"session": None, "error": "No game in progress."}, None
+        reply = {"lines": render_events(run_command(game, cmd))}
+        if game.is_game_over():
+            reply["lines"] += game.get_game_over_message()
+        return reply, session_id
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "websocket":
+        await _websocket(receive, send)
+    elif scope["type"] == "http":
+        await _http(scope, send)
+    elif scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+
+
+async def _websocket(receive, send):
+    event = await receive()
+    if event["type"] != "websocket.connect":
+        return
+    await send({"type": "websocket.accept"})
+
+    # The session outlives the socket, so a dropped client can resume it
+    session_id = None
+    while True:
+        event = await receive()
+        if event["type"] == "websocket.disconnect":
+            return
+        if event["type"] != "websocket.receive":
+            continue
+        try:
+            message = json.loads(event.get("text") or event.get("bytes") or "{}")
+        except ValueError:
+            message = None
+        if isinstance(message, dict):
+            reply, session_id = handle_message(session_id, message)
+        else:
+            reply = {"error": "Messages must be JSON objects."}
+        await send({"type": "websocket.send", "text": json.dumps(reply, ensure_ascii=False)})
+
+
+async def _http(scope, send):
+    if scope["method"] == "GET" and scope["path"] == "/":
+        status, body, content_type = 200, PAGE.encode(), b"text/html; charset=utf-8"
+    else:
+        status, body, content_type = 404, b"Not found", b"text/plain"
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive, send):
+    while True:
+        event = await receive()
+        if event["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif event["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
@@ -0,0 +1,208 @@
+# batch_runner.py
+# NOTE: Soak-test runner. Plays many complete seeded games built by
+# engine.build_game across a process pool, driven by a pluggable policy, and
+# merges compact per-game summaries into aggregate statistics.
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from engine import Game, build_game
+from item_data import get_basic_weapons
+from rng import Seed, spawn_seeds
+
+# A policy looks at the game and returns ("attack", None), ("flee", None),
+# ("move", exit_key) or None to end the run. It gets its own RNG stream so
+# its choices never shift the game's combat rolls.
+Action = Optional[Tuple[str, Optional[str]]]
+Policy = Callable[[Game, object], Action]
+
+
+def explore_policy(game: Game, rng) -> Action:
+    """Keep walking: finish the current move, otherwise pick a random exit."""
+    if game.target_direction:
+        return "move", game.target_direction
+    if not game.room.exits:
+        return None
+    return "move", rng.choice(sorted(game.room.exits))
+
+
+def attack_policy(game: Game, rng) -> Action:
+    """Fight anything in the room, explore when it is clear."""
+    if game.room.visible_enemies():
+        return "attack", None
+    return explore_policy(game, rng)
+
+
+def cautious_policy(game: Game, rng) -> Action:
+    """Like attack_policy, but flee once health drops below a third."""
+    if game.room.visible_enemies() and game.previous_key:
+        if game.player.health * 3 < game.player.max_health:
+            return "flee", None
+    return attack_policy(game, rng)
+
+
+@dataclass(frozen=True)
+class GameSummary:
+    seed: Seed
+    turns: int
+    died: bool
+    damage_dealt: int
+    damage_taken: int
+    enemies_killed: int
+    rooms_visited: int
+
+
+@dataclass
+class BatchStats:
+    games: int = 0
+    deaths: int = 0
+    turns: int = 0
+    damage_dealt: int = 0
+    damage_taken: int = 0
+    enemies_killed: int = 0
+    rooms_visited: int = 0
+    turns_histogram: Counter = field(default_factory=Counter)
+    summaries: List[GameSummary] = field(default_factory=list)  # only filled with keep_summaries
+
+    def add(self, summary: GameSummary, keep: bool = False):
+        self.games += 1
+        self.deaths += summary.died
+        self.turns += summary.turns
+        self.damage_dealt += summary.damage_dealt
+        self.damage_taken += summary.damage_taken
+        self.enemies_killed += summary.enemies_killed
+        self.rooms_visited += summary.rooms_visited
+        self.turns_histogram[summary.turns] += 1
+        if keep:
+            self.summaries.append(summary)
+
+    def merge(self, other: "BatchStats"):
+        self.games += other.games
+        self.deaths += other.deaths
+        self.turns += other.turns
+        self.damage_dealt += other.damage_dealt
+        self.damage_taken += other.damage_taken
+        self.enemies_killed += other.enemies_killed
+        self.rooms_visited += other.rooms_visited
+        self.turns_histogram.update(other.turns_histogram)
+        self.summaries.extend(other.summaries)
+
+    @property
+    def death_rate(self) -> float:
+        return self.deaths / self.games if self.games else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        return self.turns / self.games if self.games else 0.0
+
+    @property
+    def mean_damage_dealt(self) -> float:
+        return self.damage_dealt / self.games if self.games else 0.0
+
+    @property
+    def mean_rooms_visited(self) -> float:
+        return self.rooms_visited / self.games if self.games else 0.0
+
+
+def run_game(seed: Seed, policy: Policy = attack_policy, max_turns: int = 500,
+             weapon: Optional[str] = "knife") -> GameSummary:
+    """
+    Play one seeded game to completion with `policy`.
+
+    Args:
+        seed (Seed): Seed passed to build_game; the policy uses a child stream.
+        policy (Policy): Decides each action.
+        max_turns (int): Stop after this many game turns.
+        weapon (Optional[str]): Key from get_basic_weapons to equip, or None.
+
+    Returns:
+        GameSummary: Compact outcome of the run.
+    """
+    game = build_game("Bot", seed=seed)
+    if weapon:
+        game.player.weapon = get_basic_weapons()[weapon]
+    policy_rng = game.rng.spawn()[0]
+
+    dealt = taken = killed = 0
+    visited = {game.current_key}
+    actions = {"attack": lambda _: game.attack(), "flee": lambda _: game.flee(), "move": game.move}
+
+    while game.turns < max_turns and not game.is_game_over():
+        action = policy(game, policy_rng)
+        if action is None:
+            break
+        enemies = game.room.visible_enemies()
+        before = [e.health for e in enemies]
+        health = game.player.health
+
+        kind, arg = action
+        actions[kind](arg)
+
+        for enemy, hp in zip(enemies, before):
+            dealt += max(0, hp - max(enemy.health, 0))
+            killed += not enemy.is_alive()
+        taken += max(0, health - max(game.player.health, 0))
+        visited.add(game.current_key)
+
+    return GameSummary(
+        seed=seed,
+        turns=game.turns,
+        died=game.is_game_over(),
+        damage_dealt=dealt,
+        damage_taken=taken,
+        enemies_killed=killed,
+        rooms_visited=len(visited),
+    )
+
+
+def _run_chunk(seeds: List[Seed], policy: Policy, max_turns: int,
+               weapon: Optional[str], keep_summaries: bool) -> BatchStats:
+    stats = BatchStats()
+    for seed in seeds:
+        stats.add(run_game(seed, policy, max_turns, weapon), keep=keep_summaries)
+    return stats
+
+
+def run_batch(games: int, policy: Policy = attack_policy, root_seed: Seed = 0,
+              workers: Optional[int] = None, chunk_size: int = 250, max_turns: int = 500,
+              weapon: Optional[str] = "knife", keep_summaries: bool = False) -> BatchStats:
+    """
+    Play `games` seeded games across a process pool and aggregate the results.
+
+    Each worker receives a chunk of seeds and sends back one merged BatchStats,
+    so only a few small objects cross the process boundary per chunk. Results
+    are identical for any worker count because every game's seed is derived
+    from `root_seed` and its index.
+
+    Args:
+        games (int): Number of games to play.
+        policy (Policy): Module-level policy function (it must be picklable).
+        root_seed (Seed): Root of the per-game seed tree.
+        workers (Optional[int]): Pool size; defaults to os.cpu_count(). 1 runs inline.
+        chunk_size (int): Games per task sent to a worker.
+        max_turns (int): Turn cap per game.
+        weapon (Optional[str]): Key from get_basic_weapons to equip, or None.
+        keep_summaries (bool): Also return every GameSummary.
+
+    Returns:
+        BatchStats: Aggregated statistics over all games.
+    """
+    seeds = spawn_seeds(root_seed, games)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, games, chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    total = BatchStats()
+
+    if workers == 1:
+        for chunk in chunks:
+            total.merge(_run_chunk(chunk, policy, max_turns, weapon, keep_summaries))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        n = len(chunks)
+        for partial in pool.map(_run_chunk, chunks, [policy] * n, [max_turns] * n,
+                                [weapon] * n, [keep_summaries] * n):
+            total.merge(partial)
+    return total
@@ -0,0 +1,248 @@
+# bench_engine.py
+# NOTE: Benchmarks of the engine's hot paths and of a web_ui request, compared
+# against stored baselines. `python bench_engine.py` prints a report and exits
+# with status 1 if any case got slower than its baseline by more than the
+# threshold; `python bench_engine.py --save` records the current timings as
+# the new baselines. Baselines are per machine and interpreter: when the stored
+# ones were recorded elsewhere the report warns and flags no regressions.
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from combat import resolve_attack
+from engine import build_game
+from enemy_data import make_goblin, make_spider
+from item_data import get_basic_weapons
+from rng import GameRNG
+from status_effects import process_effects
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baselines.json")
+DEFAULT_THRESHOLD = 1.25  # slower than baseline by more than this factor is a regression
+MIN_RUN_TIME = 0.1  # seconds per timing run (the call count is calibrated to reach it)
+REPEATS = 7
+RETRIES = 2  # extra measurements of a case that looks regressed, to rule out a noisy run
+UNKILLABLE = 10 ** 9  # health that keeps a fight going for the whole benchmark
+
+
+def _armed_game(seed: int = 1):
+    """A test-map game where nobody dies, so every call does the same work."""
+    game = build_game("Bench", seed=seed)
+    game.player.weapon = get_basic_weapons()["knife"]
+    game.player.health = UNKILLABLE
+    for enemy in game.room.visible_enemies():
+        enemy.health = UNKILLABLE
+    return game
+
+
+def case_resolve_attack() -> Callable[[], object]:
+    attacker, target, rng = make_spider(), make_goblin(), GameRNG(1)
+    target.health = UNKILLABLE
+    return lambda: resolve_attack(attacker, target, roll_mod=0, half=True, rng=rng)
+
+
+def case_process_effects() -> Callable[[], object]:
+    target = make_goblin()
+    target.health = UNKILLABLE
+    for effect in ({"type": "poison", "damage": 2}, {"type": "poison", "damage": 1},
+                   {"type": "burn", "damage": 1}, {"type": "bleed", "damage": 1}, {"type": "regen", "heal": 3}):
+        target.status_effects.append(effect)
+    return lambda: process_effects(target)
+
+
+def case_advance_turn() -> Callable[[], object]:
+    game = _armed_game()
+    for enemy in game.room.visible_enemies():
+        enemy.status_effects.append({"type": "poison", "damage": 1})
+    return game.advance_turn
+
+
+def case_attack() -> Callable[[], object]:
+    return _armed_game().attack
+
+
+def case_build_game() -> Callable[[], object]:
+    return lambda: build_game("Bench", seed=1)
+
+
+def case_visible_enemies() -> Callable[[], object]:
+    return _armed_game().room.visible_enemies
+
+
+def case_web_round_trip() -> Optional[Callable[[], object]]:
+    """POST /api/command 'look' through the Flask test client (None if Flask is not installed)."""
+    try:
+        from web_ui import app
+    except ImportError:
+        return None
+    client = app.test_client()
+    client.post("/api/command", json={"command": "start", "name": "Bench"})
+
+    def round_trip():
+        response = client.post("/api/command", json={"command": "look"})
+        assert response.status_code == 200
+        return response.get_json()
+    return round_trip
+
+
+CASES: Dict[str, Callable[[], Optional[Callable[[], object]]]] = {
+    "resolve_attack": case_resolve_attack,
+    "process_effects": case_process_effects,
+    "advance_turn": case_advance_turn,
+    "attack": case_attack,
+    "build_game": case_build_game,
+    "visible_enemies": case_visible_enemies,
+    "web_round_trip": case_web_round_trip,
+}
+
+
+def measure(func: Callable[[], object]) -> float:
+    """Best time per call, in microseconds, over REPEATS runs of a calibrated number of calls."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_RUN_TIME:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(MIN_RUN_TIME / elapsed) + 1))
+    best = elapsed
+    for _ in range(REPEATS - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def environment() -> Dict[str, str]:
+    """What timings depend on besides the code: the hardware and the interpreter."""
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "implementation": platform.python_implementation(),
+        "python": platform.python_version(),
+    }
+
+
+def _python_series(version: str) -> str:
+    return ".".join(version.split(".")[:2])
+
+
+def environment_mismatches(recorded: Dict[str, str], current: Dict[str, str]) -> List[str]:
+    """
+    Fields of the baseline file's environment that differ from this one's
+    (Python compared by major.minor). A file without environment fields
+    matches nothing.
+    """
+    mismatches = []
+    for key, value in current.items():
+        stored = recorded.get(key)
+        if key == "python" and stored is not None:
+            stored, value = _python_series(stored), _python_series(value)
+        if stored != value:
+            mismatches.append(f"{key} {stored!r} (now {value!r})")
+    return mismatches
+
+
+def load_baselines(path: str = BASELINE_FILE) -> dict:
+    """The baseline file: environment fields plus "cases" (empty if there is no file)."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(results: Dict[str, float], path: str = BASELINE_FILE):
+    data = {
+        **environment(),
+        "unit": "us/call",
+        "cases": {name: round(value, 3) for name, value in results.items()},
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def report(results: Dict[str, Optional[float]], baselines: Dict[str, float], threshold: float,
+           flag: bool = True) -> bool:
+    """
+    Print current vs baseline timings; returns True if anything regressed past
+    the threshold. With flag=False (foreign baselines) slowdowns are shown as
+    "slower" and never count as regressions.
+    """
+    regressed = False
+    print(f"{'case':<18}{'baseline':>12}{'current':>12}{'ratio':>8}  status")
+    for name, current in results.items():
+        baseline = baselines.get(name)
+        if current is None:
+            print(f"{name:<18}{'':>12}{'':>12}{'':>8}  skipped")
+            continue
+        if baseline is None:
+            print(f"{name:<18}{'-':>12}{current:>10.2f}us{'':>8}  new")
+            continue
+        ratio = current / baseline
+        if ratio > threshold and not flag:
+            status = "slower"
+        elif ratio > threshold:
+            status, regressed = "REGRESSION", True
+        elif ratio < 1 / threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        print(f"{name:<18}{baseline:>10.2f}us{current:>10.2f}us{ratio:>8.2f}  {status}")
+    return regressed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Engine benchmarks with a baseline regression report.")
+    parser.add_argument("cases", nargs="*", help=f"cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--save", action="store_true", help="store the timings as the new baselines")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown factor reported as a regression (default %(default)s)")
+    parser.add_argument("--baselines", default=BASELINE_FILE, help="baseline file (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    record = load_baselines(args.baselines)
+    baselines = record.get("cases", {})
+    mismatches = environment_mismatches(record, environment()) if baselines else []
+    if mismatches:
+        print(f"warning: baselines in {args.baselines} were recorded elsewhere: {'; '.join(mismatches)}.",
+              file=sys.stderr)
+        print("warning: timings are not comparable, so no regressions are flagged; re-record with --save.",
+              file=sys.stderr)
+    results: Dict[str, Optional[float]] = {}
+    for name in args.cases or CASES:
+        func = CASES[name]()
+        if func is None:
+            results[name] = None
+            continue
+        results[name] = measure(func)
+        for _ in range(RETRIES):
+            if mismatches or name not in baselines or results[name] <= baselines[name] * args.threshold:
+                break
+            results[name] = min(results[name], measure(func))
+
+    regressed = report(results, baselines, args.threshold, flag=not mismatches)
+    if args.save:
+        if mismatches:
+            baselines = {}  # do not mix in timings from another machine or interpreter
+        baselines.update({name: value for name, value in results.items() if value is not None})
+        save_baselines(baselines, args.baselines)
+        print(f"baselines saved to {args.baselines}")
+        return 0
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+# bench_snapshot.py
+# NOTE: Measures snapshot size and encode/decode time for mid-game sessions.
+# Run with `python bench_snapshot.py [sessions]`.
+
+import os
+import sys
+import tempfile
+import time
+
+import snapshot
+from engine import build_game, run_command
+
+
+def _played_game(seed: int):
+    game = build_game(f"Player{seed}", seed=seed)
+    for cmd in ("look", "a", "a", "a", "look"):
+        if game.is_game_over():
+            break
+        run_command(game, cmd)
+    return game
+
+
+def main(count: int = 2000):
+    games = [_played_game(seed) for seed in range(count)]
+
+    for compress in (False, True):
+        start = time.perf_counter()
+        blobs = [snapshot.dumps(game, compress) for game in games]
+        encoded = time.perf_counter()
+        restored = [snapshot.loads(blob) for blob in blobs]
+        decoded = time.perf_counter()
+        assert all(snapshot.dumps(g, compress) == b for g, b in zip(restored, blobs))
+
+        sizes = sorted(len(b) for b in blobs)
+        label = "zlib" if compress else "raw"
+        print(f"[{label}] {count} sessions: mean {sum(sizes) / count:.0f} B, "
+              f"max {sizes[-1]} B, total {sum(sizes) / 1024:.1f} KiB")
+        print(f"[{label}] encode {(encoded - start) / count * 1e3:.3f} ms/session, "
+              f"decode {(decoded - encoded) / count * 1e3:.3f} ms/session")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        for i, game in enumerate(games):
+            snapshot.save(game, os.path.join(tmp, f"{i}.snap"))
+        saved = time.perf_counter()
+        for i in range(count):
+            snapshot.load(os.path.join(tmp, f"{i}.snap"))
+        loaded = time.perf_counter()
+    print(f"[disk] spill {(saved - start) * 1e3:.0f} ms, restore {(loaded - saved) * 1e3:.0f} ms "
+          f"for {count} sessions")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,267 @@
+# combat_sim.py
+# NOTE: Headless, NumPy-batched combat simulator for balance sweeps.
+# Mirrors the rules of combat.resolve_attack + status_effects.process_effects
+# as driven by Game.attack/advance_turn, without building any messages. Turn
+# order is fixed (player, then each enemy, then effects), which is what the
+# initiative queue produces when every actor has the same speed; fights with
+# mixed speeds are rejected rather than simulated wrongly.
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from combat_utils import roll_multiplier
+from initiative_utils import DEFAULT_SPEED
+
+MIN_TOTAL = 2    # lowest possible 2d6 roll
+MAX_TOTAL = 12   # highest possible 2d6 roll
+HIT_THRESHOLD = 6  # totals below this never apply on-hit traits
+
+
+@dataclass
+class SimulationResult:
+    fights: int
+    wins: int
+    losses: int
+    timeouts: int
+    turns_histogram: np.ndarray     # index = turns taken, value = fight count
+    hp_left_histogram: np.ndarray   # index = player HP left after a win
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def loss_rate(self) -> float:
+        return self.losses / self.fights if self.fights else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        counts = self.turns_histogram
+        total = counts.sum()
+        return float((np.arange(len(counts)) * counts).sum() / total) if total else 0.0
+
+
+@dataclass
+class _AttackProfile:
+    """Flattened attack data for one attacker: one row per attack mode."""
+    damage_min: np.ndarray
+    damage_max: np.ndarray
+    probability: np.ndarray     # chance of picking each mode
+    poison_chance: np.ndarray   # 0.0 when the mode has no poison_on_hit
+    poison_damage: np.ndarray
+    poison_duration: np.ndarray
+    penalized: bool = False
+
+
+def _poison_columns(traits_list):
+    chance, damage, duration = [], [], []
+    for traits in traits_list:
+        poison = traits.get("poison_on_hit")
+        if poison is None:
+            chance.append(0.0)
+            damage.append(0)
+            duration.append(0)
+        else:
+            chance.append(poison.get("chance", 1.0))
+            damage.append(poison.get("damage", 2))
+            duration.append(poison.get("duration", 3))
+    return (np.array(chance, dtype=float),
+            np.array(damage, dtype=np.int64),
+            np.array(duration, dtype=np.int64))
+
+
+def _profile_for(entity) -> _AttackProfile:
+    """Build the attack profile that resolve_attack would use for an entity."""
+    modes = getattr(entity, "attack_modes", None)
+    if modes:
+        weights = np.array([m.get("weight", 1) for m in modes], dtype=float)
+        chance, damage, duration = _poison_columns([m.get("traits", {}) for m in modes])
+        return _AttackProfile(
+            damage_min=np.array([m["damage_min"] for m in modes], dtype=np.int64),
+            damage_max=np.array([m["damage_max"] for m in modes], dtype=np.int64),
+            probability=weights / weights.sum(),
+            poison_chance=chance,
+            poison_damage=damage,
+            poison_duration=duration,
+        )
+
+    weapon = getattr(entity, "weapon", None)
+    if weapon:
+        penalized = any(
+            getattr(entity, "stats", {}).get(stat, 0) < required
+            for stat, required in weapon.get("requirements", {}).items()
+        )
+        low, high, traits = weapon.get("damage_min", 1), weapon.get("damage_max", 2), weapon.get("traits", {})
+    elif getattr(entity, "is_player", False):
+        penalized, low, high, traits = False, 0, 0, {}
+    else:
+        penalized = False
+        low, high, traits = getattr(entity, "attack_min", 1), getattr(entity, "attack_max", 2), {}
+
+    chance, damage, duration = _poison_columns([traits])
+    return _AttackProfile(
+        damage_min=np.array([low], dtype=np.int64),
+        damage_max=np.array([high], dtype=np.int64),
+        probability=np.array([1.0]),
+        poison_chance=chance,
+        poison_damage=damage,
+        poison_duration=duration,
+        penalized=penalized,
+    )
+
+
+def _multiplier_table(roll_mod: int) -> np.ndarray:
+    """roll_multiplier() for every reachable 2d6 total, indexed by base roll."""
+    table = np.zeros(MAX_TOTAL + 1)
+    for base in range(MIN_TOTAL, MAX_TOTAL + 1):
+        table[base] = roll_multiplier(base + roll_mod)
+    return table
+
+
+def _swing(rng, profile: _AttackProfile, roll_mod: int, table: np.ndarray, count: int):
+    """
+    Resolve `count` independent swings.
+
+    Returns:
+        tuple: (damage, poison_damage, poison_duration) arrays; poison_damage
+        is 0 where no poison stack was applied.
+    """
+    base = rng.integers(1, 7, count) + rng.integers(1, 7, count)
+    if len(profile.probability) > 1:
+        mode = rng.choice(len(profile.probability), size=count, p=profile.probability)
+    else:
+        mode = np.zeros(count, dtype=np.int64)
+
+    raw = rng.integers(profile.damage_min[mode], profile.damage_max[mode] + 1)
+    if profile.penalized:
+        raw = np.maximum(1, (raw * 0.5).astype(np.int64))
+    damage = np.maximum(0, (raw * table[base]).astype(np.int64))
+
+    # apply_status_effects draws random() for each poison_on_hit trait
+    chance = profile.poison_chance[mode]
+    poisoned = (chance > 0) & (base + roll_mod >= HIT_THRESHOLD) & (rng.random(count) <= chance)
+    poison_damage = np.where(poisoned, profile.poison_damage[mode], 0)
+    return damage, poison_damage, profile.poison_duration[mode]
+
+
+def _add_poison(schedule, index, slot, damage, duration):
+    """
+    Spread new poison stacks over the next `duration` ticks (at least one) of
+    a ring-buffer damage schedule. `index` selects one schedule row per stack.
+    """
+    length = schedule.shape[-1]
+    ticks = np.maximum(duration, 1)
+    for offset in range(int(ticks.max(initial=0))):
+        live = ticks > offset
+        schedule[tuple(i[live] for i in index) + ((slot + offset) % length,)] += damage[live]
+
+
+def simulate_fights(
+    player,
+    enemy_factory: Callable,
+    n: int = 100_000,
+    enemy_count: int = 1,
+    max_turns: int = 200,
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """
+    Run `n` independent fights of `player` against `enemy_count` enemies built
+    by `enemy_factory`, in the order Game.attack's initiative queue gives
+    equal-speed actors: the player swings at the first living enemy, every
+    living enemy retaliates, then stacking effects tick on the player and on
+    the surviving enemies. Player and enemies must share one speed.
+
+    The player object is only read; each fight starts from its current health
+    and buffs with no active status effects.
+
+    Args:
+        player: Player instance (weapon, stats, skill and buffs are used).
+        enemy_factory: Callable returning a fresh Enemy, e.g. make_spider.
+        n (int): Number of fights to run in parallel.
+        enemy_count (int): Enemies per fight.
+        max_turns (int): Fights still running after this many turns time out.
+        seed (Optional[int]): Seed for the NumPy generator.
+
+    Returns:
+        SimulationResult: Win/loss counts plus turn and HP-left histograms.
+
+    Raises:
+        ValueError: If the player's and the enemies' speeds differ.
+    """
+    rng = np.random.default_rng(seed)
+    template = enemy_factory()
+    player_speed = getattr(player, "speed", DEFAULT_SPEED)
+    enemy_speed = getattr(template, "speed", DEFAULT_SPEED)
+    if player_speed != enemy_speed:
+        raise ValueError(f"simulate_fights assumes equal speeds (player {player_speed}, enemy {enemy_speed})")
+
+    player_mod = player.skill + player.buffs.get("attack_bonus", 0)
+    player_profile = _profile_for(player)
+    enemy_profile = _profile_for(template)
+    player_table = _multiplier_table(player_mod)
+    # resolve_attack ignores `half`, so enemy swings use the plain roll table
+    enemy_table = _multiplier_table(0)
+
+    longest = 1 + max(
+        int(player_profile.poison_duration.max(initial=0)),
+        int(enemy_profile.poison_duration.max(initial=0)),
+    )
+
+    player_hp = np.full(n, player.health, dtype=np.int64)
+    enemy_hp = np.full((n, enemy_count), template.health, dtype=np.int64)
+    player_poison = np.zeros((n, longest), dtype=np.int64)
+    enemy_poison = np.zeros((n, enemy_count, longest), dtype=np.int64)
+
+    turns = np.zeros(n, dtype=np.int64)
+    active = np.arange(n)
+
+    for turn in range(max_turns):
+        if active.size == 0:
+            break
+        slot = turn % longest
+        hp = enemy_hp[active]
+        alive = hp > 0
+
+        # Player strikes the first living enemy
+        target = alive.argmax(axis=1)
+        damage, poison, duration = _swing(rng, player_profile, player_mod, player_table, active.size)
+        enemy_hp[active, target] -= damage
+        hit = poison > 0
+        _add_poison(enemy_poison, (active[hit], target[hit]), slot, poison[hit], duration[hit])
+
+        # Every living enemy retaliates in zone order
+        for col in range(enemy_count):
+            standing = active[enemy_hp[active, col] > 0]
+            if standing.size == 0:
+                continue
+            damage, poison, duration = _swing(rng, enemy_profile, 0, enemy_table, standing.size)
+            player_hp[standing] -= damage
+            hit = poison > 0
+            _add_poison(player_poison, (standing[hit],), slot, poison[hit], duration[hit])
+
+        # advance_turn: tick the player, then enemies that are still alive
+        player_hp[active] -= player_poison[active, slot]
+        player_poison[active, slot] = 0
+        ticking = enemy_hp[active] > 0
+        enemy_hp[active] -= np.where(ticking, enemy_poison[active, :, slot], 0)
+        enemy_poison[active, :, slot] = 0
+
+        turns[active] = turn + 1
+        finished = (player_hp[active] <= 0) | ~(enemy_hp[active] > 0).any(axis=1)
+        active = active[~finished]
+
+    won = (player_hp > 0) & ~(enemy_hp > 0).any(axis=1)
+    lost = player_hp <= 0
+    timed_out = ~(won | lost)
+    done = ~timed_out
+
+    return SimulationResult(
+        fights=n,
+        wins=int(won.sum()),
+        losses=int(lost.sum()),
+        timeouts=int(timed_out.sum()),
+        turns_histogram=np.bincount(turns[done], minlength=1),
+        hp_left_histogram=np.bincount(player_hp[won], minlength=1),
+    )
@@ -2,11 +2,13 @@
 import random
 from typing import Tuple, List
 
-def roll_d6() -> int:
-    return random.randint(1, 6)
+from events import StatusEvent
 
-def roll_2d6() -> Tuple[int, int]:
-    return roll_d6(), roll_d6()
+def roll_d6(rng=random) -> int:
+    return rng.randint(1, 6)
+
+def roll_2d6(rng=random) -> Tuple[int, int]:
+    return roll_d6(rng), roll_d6(rng)
 
 def roll_multiplier(total: int, half: bool = False, crit_fail_softener: float = 0.0) -> float:
     if total <= 2:
@@ -33,10 +35,21 @@ def roll_multiplier(total: int, half: bool = False, crit_fail_softener: float =
         return 1.5
     return 0.0
 
+def classify_roll(total: int) -> str:
+    if total <= 2:
+        return "critfail"
+    elif total <= 5:
+        return "miss"
+    elif total <= 7:
+        return "glancing"
+    elif total <= 13:
+        return "hit"
+    return "crit"
+
 def calculate_damage(base: int, multiplier: float, attacker, target) -> int:
     return max(0, int(base * multiplier))
 
-def get_weapon_stats(entity) -> Tuple[int, str, dict, bool, str]:
+def get_weapon_stats(entity, rng=random) -> Tuple[int, str, dict, bool, str]:
     weapon = getattr(entity, "weapon", None)
     if not weapon:
         if getattr(entity, "is_player", False):
@@ -46,7 +59,7 @@ def get_weapon_stats(entity) -> Tuple[int, str, dict, bool, str]:
             # Fallback for legacy enemies using attack_min/max
             damage_min = getattr(entity, "attack_min", 1)
             damage_max = getattr(entity, "attack_max", 2)
-            base = random.randint(damage_min, damage_max)
+            base = rng.randint(damage_min, damage_max)
             return base, "blunt", {}, False, "unarmed strike"
 
     traits = weapon.get("traits", {})
@@ -62,28 +75,24 @@ def get_weapon_stats(entity) -> Tuple[int, str, dict, bool, str]:
             penalized = True
             break
 
-    base = random.randint(damage_min, damage_max)
+    base = rng.randint(damage_min, damage_max)
     if penalized:
         base = max(1, int(base * 0.5))
 
     return base, damage_type, traits, penalized, name
 
-def apply_status_effects(attacker, target, roll: int, traits: dict) -> List[dict]:
+def apply_status_effects(attacker, target, roll: int, traits: dict, rng=random) -> List[StatusEvent]:
     effects = []
     for trait, data in traits.items():
         if trait == "poison_on_hit":
             chance = data.get("chance", 1.0)
-            if roll >= 6 and random.random() <= chance:
+            if roll >= 6 and rng.random() <= chance:
                 dmg = data.get("damage", 2)
                 dur = data.get("duration", 3)
                 effect = {"type": "poison", "damage": dmg, "duration": dur}
                 if hasattr(target, "status_effects"):
                     target.status_effects.append(effect)
-                effects.append({
-                    "type": "poison",
-                    "target": target,
-                    "amount": dmg
-                })
+                effects.append(StatusEvent("poison", target, amount=dmg))
     return effects
 
 def generate_attack_log(attacker, target, damage: int, hit_type: str) -> List[str]:
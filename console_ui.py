@@ -1,5 +1,6 @@
 # console_ui.py
 from engine import build_game
+from messaging import render_events
 
 def main():
     name = "Bob"
@@ -10,7 +11,7 @@ def main():
     game.player.weapon = get_basic_weapons()["knife"]
 
     def print_room():
-        for line in game.look():
+        for line in render_events(game.look()):
             print(line)
 
     print_room()
@@ -28,14 +29,14 @@ def main():
             cmd = input(f"\n({available_dirs}, q=quit) > ").lower().strip()[:1]
 
         if cmd in "nesw":
-            for line in game.move(cmd):
+            for line in render_events(game.move(cmd)):
                 print(line)
             print_room()
         elif cmd == "a":
-            for line in game.attack():
+            for line in render_events(game.attack()):
                 print(line)
         elif cmd == "r":
-            for line in game.flee():
+            for line in render_events(game.flee()):
                 print(line)
         elif cmd == "q":
             break
@@ -0,0 +1,176 @@
+# damage_tables.py
+# NOTE: Exact per-attack outcome tables. Enumerates every 2d6 roll against every
+# damage value instead of sampling roll_2d6/get_weapon_stats, so balance
+# questions ("expected Iron Mace damage at +2") become table lookups.
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from combat_utils import classify_roll, roll_multiplier
+
+# Number of ways to roll each 2d6 base total
+TWO_D6 = {base: 6 - abs(base - 7) for base in range(2, 13)}
+HIT_THRESHOLD = 6  # apply_status_effects only fires traits on totals >= 6
+
+
+@dataclass(frozen=True)
+class AttackDistribution:
+    damage_pmf: Dict[int, float]                            # damage -> probability
+    hit_types: Dict[str, float]                             # classify_roll type -> probability
+    trait_chances: Dict[str, float] = field(default_factory=dict)  # trait -> chance it is applied
+
+    @property
+    def expected_damage(self) -> float:
+        return sum(dmg * p for dmg, p in self.damage_pmf.items())
+
+    def chance_at_least(self, damage: int) -> float:
+        return sum(p for dmg, p in self.damage_pmf.items() if dmg >= damage)
+
+
+def _freeze(value):
+    """Turn nested dict/list weapon data into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _mode_key(damage_min: int, damage_max: int, traits: dict, weight: float = 1) -> tuple:
+    return damage_min, damage_max, _freeze(traits), weight
+
+
+@lru_cache(maxsize=None)
+def _distribution(modes: Tuple[tuple, ...], penalized: bool, roll_mod: int, half: bool) -> AttackDistribution:
+    total_weight = sum(mode[3] for mode in modes)
+    pmf = defaultdict(float)
+    hit_types = defaultdict(float)
+    trait_chances = defaultdict(float)
+
+    for base, ways in TWO_D6.items():
+        total = base + roll_mod
+        p_roll = ways / 36
+        multiplier = roll_multiplier(total, half=half)
+        hit_types[classify_roll(total)] += p_roll
+
+        for damage_min, damage_max, traits, weight in modes:
+            p_mode = p_roll * weight / total_weight
+            values = range(damage_min, damage_max + 1)
+            for raw in values:
+                if penalized:
+                    raw = max(1, int(raw * 0.5))
+                pmf[max(0, int(raw * multiplier))] += p_mode / len(values)
+
+            if total >= HIT_THRESHOLD:
+                for trait, data in traits:
+                    if trait == "poison_on_hit":
+                        trait_chances[trait] += p_mode * min(1.0, dict(data).get("chance", 1.0))
+
+    return AttackDistribution(
+        damage_pmf=dict(sorted(pmf.items())),
+        hit_types=dict(hit_types),
+        trait_chances=dict(trait_chances),
+    )
+
+
+@lru_cache(maxsize=None)
+def _outcomes(modes: Tuple[tuple, ...], penalized: bool, roll_mod: int, half: bool) -> Tuple[tuple, ...]:
+    total_weight = sum(mode[3] for mode in modes)
+    joint = defaultdict(float)
+
+    for base, ways in TWO_D6.items():
+        total = base + roll_mod
+        multiplier = roll_multiplier(total, half=half)
+
+        for damage_min, damage_max, traits, weight in modes:
+            p_mode = ways / 36 * weight / total_weight
+            traits = dict(traits)
+            poison = dict(traits.get("poison_on_hit", ()))
+            chance = 0.0
+            if "poison_on_hit" in traits and total >= HIT_THRESHOLD and poison.get("damage", 2):
+                chance = max(0.0, min(1.0, poison.get("chance", 1.0)))
+            values = range(damage_min, damage_max + 1)
+            for raw in values:
+                if penalized:
+                    raw = max(1, int(raw * 0.5))
+                damage = max(0, int(raw * multiplier))
+                share = p_mode / len(values)
+                if chance > 0:
+                    joint[(damage, poison.get("damage", 2), poison.get("duration", 3))] += share * chance
+                if chance < 1:
+                    joint[(damage, 0, 0)] += share * (1 - chance)
+
+    return tuple((*key, p) for key, p in sorted(joint.items()) if p > 0)
+
+
+def _attack_key(attacker) -> Tuple[Tuple[tuple, ...], bool]:
+    """Attack modes and requirement penalty that resolve_attack would use for `attacker`."""
+    attack_modes = getattr(attacker, "attack_modes", None)
+    if attack_modes:
+        modes = tuple(
+            _mode_key(m["damage_min"], m["damage_max"], m.get("traits", {}), m.get("weight", 1))
+            for m in attack_modes
+        )
+        return modes, False
+
+    weapon = getattr(attacker, "weapon", None)
+    if weapon:
+        stats = getattr(attacker, "stats", {})
+        penalized = any(stats.get(stat, 0) < req for stat, req in weapon.get("requirements", {}).items())
+        mode = _mode_key(weapon.get("damage_min", 1), weapon.get("damage_max", 2), weapon.get("traits", {}))
+        return (mode,), penalized
+
+    if getattr(attacker, "is_player", False):
+        return (_mode_key(0, 0, {}),), False
+
+    return (_mode_key(getattr(attacker, "attack_min", 1), getattr(attacker, "attack_max", 2), {}),), False
+
+
+def weapon_distribution(weapon: dict, roll_mod: int = 0, half: bool = False,
+                        penalized: bool = False) -> AttackDistribution:
+    """
+    Exact outcome table for one swing of a weapon dict from item_data.
+
+    Args:
+        weapon (dict): Weapon as built by item_data.make_weapon.
+        roll_mod (int): Modifier added to the 2d6 roll.
+        half (bool): Passed through to roll_multiplier.
+        penalized (bool): Apply the 0.5x unmet-requirement penalty.
+
+    Returns:
+        AttackDistribution: Damage PMF, hit-type and trait probabilities.
+    """
+    mode = _mode_key(weapon.get("damage_min", 1), weapon.get("damage_max", 2), weapon.get("traits", {}))
+    return _distribution((mode,), penalized, roll_mod, half)
+
+
+def attack_distribution(attacker, roll_mod: int = 0, half: bool = False) -> AttackDistribution:
+    """
+    Exact outcome table for one resolve_attack swing by `attacker`, choosing
+    between attack modes, weapon stats and legacy attack_min/max exactly as
+    resolve_attack and get_weapon_stats do.
+
+    Args:
+        attacker: Player or Enemy instance.
+        roll_mod (int): Modifier added to the 2d6 roll.
+        half (bool): Passed through to roll_multiplier.
+
+    Returns:
+        AttackDistribution: Damage PMF, hit-type and trait probabilities.
+    """
+    modes, penalized = _attack_key(attacker)
+    return _distribution(modes, penalized, roll_mod, half)
+
+
+def attack_outcomes(attacker, roll_mod: int = 0, half: bool = False) -> Tuple[tuple, ...]:
+    """
+    Joint outcome table for one resolve_attack swing by `attacker`.
+
+    Returns:
+        tuple: (damage, poison_damage, poison_duration, probability) rows;
+        poison_damage is 0 when no poison stack is applied.
+    """
+    modes, penalized = _attack_key(attacker)
+    return _outcomes(modes, penalized, roll_mod, half)
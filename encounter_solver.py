@@ -0,0 +1,267 @@
+# encounter_solver.py
+# NOTE: Exact encounter odds. Models a Game.attack fight as an absorbing Markov
+# chain over (player HP, enemy HPs, pending stacking-effect damage) and pushes
+# the probability mass forward turn by turn, so room difficulty needs no sampling.
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from damage_tables import attack_outcomes
+from maps import MapRoom
+from status_effects import STACKING_EFFECTS
+
+WIN = "win"
+LOSS = "loss"
+
+# A schedule is the stacking-effect damage due on each upcoming tick,
+# index 0 being the tick at the end of the current turn.
+Schedule = Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class EncounterOdds:
+    win: float
+    loss: float
+    unresolved: float  # mass still fighting at max_turns or pruned away
+    turns: Dict[int, float] = field(default_factory=dict)  # turn the fight ended -> probability
+
+    @property
+    def expected_turns(self) -> float:
+        """Mean fight length over the fights that ended."""
+        resolved = self.win + self.loss
+        return sum(t * p for t, p in self.turns.items()) / resolved if resolved else 0.0
+
+
+def _add_stack(schedule: Schedule, damage: int, duration: int) -> Schedule:
+    """Add a stack that ticks `damage` for `duration` turns (at least one)."""
+    ticks = max(duration, 1)
+    merged = list(schedule) + [0] * (ticks - len(schedule))
+    for i in range(ticks):
+        merged[i] += damage
+    return tuple(merged)
+
+
+def _initial_schedule(entity) -> Schedule:
+    schedule: Schedule = ()
+    for effect in entity.status_effects:
+        if effect["type"] in STACKING_EFFECTS and "duration" in effect:
+            schedule = _add_stack(schedule, effect.get("damage", 1), effect["duration"])
+    return schedule
+
+
+def _tick_enemy(hp: int, schedule: Schedule) -> Tuple[int, Schedule]:
+    """Apply one stacking-effect tick; dead enemies collapse to (0, ())."""
+    if hp > 0 and schedule:
+        hp, schedule = hp - schedule[0], schedule[1:]
+    return (hp, schedule) if hp > 0 else (0, ())
+
+
+class _Chain:
+    """
+    Sparse transition model for one encounter line-up. States are numbered as
+    they are discovered and each is expanded once; the per-turn propagation is
+    then a single weighted bincount over the recorded edges.
+    """
+
+    def __init__(self, player_table, enemy_tables):
+        self.player_table = player_table
+        self.enemy_tables = enemy_tables
+        self.index = {WIN: 0, LOSS: 1}
+        self.states = [WIN, LOSS]
+        self.expanded = [True, True]  # absorbing states have no outgoing edges
+        self._pending = ([], [], [])
+        self.src = np.zeros(0, dtype=np.int64)
+        self.dst = np.zeros(0, dtype=np.int64)
+        self.prob = np.zeros(0)
+        self._strikes = {}
+        self._retaliations = {}
+
+    def state_id(self, state) -> int:
+        idx = self.index.get(state)
+        if idx is None:
+            idx = self.index[state] = len(self.states)
+            self.states.append(state)
+            self.expanded.append(False)
+        return idx
+
+    def expand(self, idx: int):
+        src, dst, prob = self._pending
+        for nxt, p in self.successors(self.states[idx]):
+            src.append(idx)
+            dst.append(self.state_id(nxt))
+            prob.append(p)
+        self.expanded[idx] = True
+
+    def flush(self):
+        """Move edges recorded by expand() into the NumPy edge arrays."""
+        src, dst, prob = self._pending
+        if src:
+            self.src = np.concatenate([self.src, np.array(src, dtype=np.int64)])
+            self.dst = np.concatenate([self.dst, np.array(dst, dtype=np.int64)])
+            self.prob = np.concatenate([self.prob, np.array(prob)])
+            self._pending = ([], [], [])
+
+    def strike(self, enemies) -> List[tuple]:
+        """
+        Player strikes the first living enemy.
+
+        Returns:
+            list: (alive mask before ticks, line-up after the enemy tick, p) rows.
+        """
+        cached = self._strikes.get(enemies)
+        if cached is not None:
+            return cached
+
+        target = next(i for i, (hp, _) in enumerate(enemies) if hp > 0)
+        hp, schedule = enemies[target]
+        outcomes = defaultdict(float)
+        for damage, poison, duration, p in self.player_table:
+            new_schedule = _add_stack(schedule, poison, duration) if poison else schedule
+            slot = _tick_enemy(hp - damage, new_schedule) if hp - damage > 0 else (0, ())
+            outcomes[(hp - damage > 0, slot)] += p
+
+        rows = []
+        for (target_alive, slot), p in outcomes.items():
+            alive = tuple(h > 0 for h, _ in enemies[:target]) + (target_alive,) + tuple(h > 0 for h, _ in enemies[target + 1:])
+            ticked = tuple(_tick_enemy(h, sched) for h, sched in enemies[:target]) + (slot,) + \
+                tuple(_tick_enemy(h, sched) for h, sched in enemies[target + 1:])
+            rows.append((alive, ticked, p))
+        self._strikes[enemies] = rows
+        return rows
+
+    def retaliation(self, schedule: Schedule, alive: Tuple[bool, ...]) -> List[tuple]:
+        """
+        Every living enemy swings at the player.
+
+        Returns:
+            list: (total damage, player schedule after stacks are added, p) rows.
+        """
+        key = (schedule, alive)
+        cached = self._retaliations.get(key)
+        if cached is not None:
+            return cached
+
+        outcomes = {(0, schedule): 1.0}
+        for table, standing in zip(self.enemy_tables, alive):
+            if not standing:
+                continue
+            merged = defaultdict(float)
+            for (total, sched), p in outcomes.items():
+                for damage, poison, duration, q in table:
+                    merged[(total + damage, _add_stack(sched, poison, duration) if poison else sched)] += p * q
+            outcomes = merged
+
+        rows = [(total, sched, p) for (total, sched), p in outcomes.items()]
+        self._retaliations[key] = rows
+        return rows
+
+    def successors(self, state) -> List[tuple]:
+        player_hp, player_schedule, enemies = state
+        successors = defaultdict(float)
+
+        for alive, ticked, p in self.strike(enemies):
+            cleared = not any(hp > 0 for hp, _ in ticked)
+            for damage, schedule, q in self.retaliation(player_schedule, alive):
+                # advance_turn ticks the player's stacks after the retaliation
+                hp = player_hp - damage
+                if schedule:
+                    hp, schedule = hp - schedule[0], schedule[1:]
+                # HP never rises, so any drop to 0 during the turn is a loss
+                if hp <= 0 or player_hp - damage <= 0:
+                    successors[LOSS] += p * q
+                elif cleared:
+                    successors[WIN] += p * q
+                else:
+                    successors[(hp, schedule, ticked)] += p * q
+
+        return list(successors.items())
+
+
+@lru_cache(maxsize=256)
+def _solve(player_table, enemy_tables, initial, max_turns: int, prune: float) -> EncounterOdds:
+    chain = _Chain(player_table, enemy_tables)
+    mass = np.zeros(3)
+    mass[chain.state_id(initial)] = 1.0
+    win = loss = dropped = 0.0
+    turns = {}
+
+    for turn in range(1, max_turns + 1):
+        # Prune negligible states so long fights don't fan out indefinitely
+        negligible = mass < prune
+        dropped += mass[negligible].sum()
+        mass[negligible] = 0.0
+        live = np.flatnonzero(mass)
+        if live.size == 0:
+            break
+
+        for idx in live.tolist():
+            if not chain.expanded[idx]:
+                chain.expand(idx)
+        chain.flush()
+
+        mass = np.bincount(chain.dst, weights=mass[chain.src] * chain.prob, minlength=len(chain.states))
+        won, lost = mass[0], mass[1]
+        mass[:2] = 0.0
+        win += won
+        loss += lost
+        if won or lost:
+            turns[turn] = float(won + lost)
+
+    return EncounterOdds(
+        win=float(win),
+        loss=float(loss),
+        unresolved=float(dropped + mass.sum()),
+        turns=turns,
+    )
+
+
+def encounter_odds(player, enemies: list, max_turns: int = 200, prune: float = 1e-12) -> EncounterOdds:
+    """
+    Exact odds of `player` beating `enemies` with repeated Game.attack turns:
+    the player strikes the first living enemy, every living enemy retaliates
+    with a half=True swing, then stacking effects tick on everyone alive.
+
+    Results are cached per line-up, so identical rooms are solved once.
+
+    Args:
+        player: Player instance (health, weapon, skill, buffs and effects are used).
+        enemies (list): Enemies in the order MapRoom.visible_enemies returns them.
+        max_turns (int): Mass still fighting after this many turns is unresolved.
+        prune (float): States below this probability are dropped as unresolved.
+
+    Returns:
+        EncounterOdds: Win/loss probabilities and the distribution of fight length.
+    """
+    living = [e for e in enemies if e.is_alive()]
+    if player.health <= 0:
+        return EncounterOdds(win=0.0, loss=1.0, unresolved=0.0, turns={0: 1.0})
+    if not living:
+        return EncounterOdds(win=1.0, loss=0.0, unresolved=0.0, turns={0: 1.0})
+
+    roll_mod = player.skill + player.buffs.get("attack_bonus", 0)
+    player_table = attack_outcomes(player, roll_mod=roll_mod)
+    enemy_tables = tuple(attack_outcomes(e, roll_mod=0, half=True) for e in living)
+    initial = (
+        player.health,
+        _initial_schedule(player),
+        tuple((e.health, _initial_schedule(e)) for e in living),
+    )
+    return _solve(player_table, enemy_tables, initial, max_turns, prune)
+
+
+def room_odds(player, room: MapRoom, **kwargs) -> EncounterOdds:
+    """
+    Encounter odds for fighting everything alive in `room`. Reads the zone
+    lists directly so a shared prototype room is never given a RoomIndex.
+    """
+    enemies = [enemy for zone in room.zones.values() for enemy in zone.enemies if enemy.is_alive()]
+    return encounter_odds(player, enemies, **kwargs)
+
+
+def map_odds(player, rooms: Dict[str, MapRoom], **kwargs) -> Dict[str, EncounterOdds]:
+    """Encounter odds for every room of a map, e.g. from map_generator.generate_test_map."""
+    return {room_id: room_odds(player, room, **kwargs) for room_id, room in rooms.items()}
@@ -1,11 +1,35 @@
 # enemy.py
+# NOTE: health, stealth, size and current_zone live on the object until the
+# enemy joins an ActorStore (actor_store.py); after that they read and write
+# the store's columns, so the object is just a view onto its row. Deaths and
+# zone moves are reported to the room's index (map_utils.RoomIndex), which
+# keeps the room's live-enemy set and keyword lookups current.
 import random
 
+from status_effects import StatusEffects
+
+# Attributes that make up an enemy's state (see state()/from_state())
+STATE_FIELDS = (
+    "name", "health", "attack_min", "attack_max", "evasion", "defense", "traits",
+    "size", "stealth", "perception", "status_effects", "attack_modes", "current_zone",
+    "current_attack_mode", "current_attack_traits", "speed", "kind",
+)
+
+
 class Enemy:
+    __slots__ = (
+        "name", "_health", "attack_min", "attack_max", "evasion", "defense", "traits",
+        "_size", "_stealth", "perception", "status_effects", "attack_modes", "_current_zone",
+        "current_attack_mode", "current_attack_traits", "speed", "kind", "_store", "_slot", "_index",
+    )
+
     def __init__(self, name, health, attack_min, attack_max,
                  evasion=0, defense=0, traits=None,
                  size=5, stealth=0, perception=0,
-                 attack_modes=None):
+                 attack_modes=None, speed=10, kind=None):
+        self._store = None
+        self._slot = None
+        self._index = None
         self.name = name
         self.health = health
         self.attack_min = attack_min
@@ -16,9 +40,107 @@ class Enemy:
         self.size = size
         self.stealth = stealth
         self.perception = perception
-        self.status_effects = []
+        self.status_effects = StatusEffects()
         self.attack_modes = attack_modes
         self.current_zone = "center"
+        self.speed = speed  # initiative: higher acts more often
+        self.kind = kind  # enemy_data archetype, if spawned from one
+
+    @property
+    def health(self):
+        if self._store is None:
+            return self._health
+        return int(self._store.health[self._slot])
+
+    @health.setter
+    def health(self, value):
+        index = self._index
+        was_alive = index is not None and self.is_alive()
+        if self._store is None:
+            self._health = value
+        else:
+            self._store.health[self._slot] = value
+            self._store.alive[self._slot] = value > 0
+        if index is not None and was_alive != (value > 0):
+            index.enemy_alive_changed(self, value > 0)
+
+    @property
+    def stealth(self):
+        return self._stealth if self._store is None else int(self._store.stealth[self._slot])
+
+    @stealth.setter
+    def stealth(self, value):
+        if self._store is None:
+            self._stealth = value
+        else:
+            self._store.stealth[self._slot] = value
+        if self._index is not None:
+            self._index.enemy_changed(self)
+
+    @property
+    def size(self):
+        return self._size if self._store is None else int(self._store.size[self._slot])
+
+    @size.setter
+    def size(self, value):
+        if self._store is None:
+            self._size = value
+        else:
+            self._store.size[self._slot] = value
+        if self._index is not None:
+            self._index.enemy_changed(self)
+
+    @property
+    def current_zone(self):
+        if self._store is None:
+            return self._current_zone
+        return self._store.zone_names[self._store.zone[self._slot]]
+
+    @current_zone.setter
+    def current_zone(self, value):
+        if self._store is None:
+            self._current_zone = value
+        else:
+            self._store.zone[self._slot] = self._store.zone_index(value)
+        if self._index is not None:
+            self._index.enemy_moved(self, value)
 
     def is_alive(self):
-        return self.health > 0
\ No newline at end of file
+        if self._store is None:
+            return self._health > 0
+        return bool(self._store.alive[self._slot])
+
+    def attack(self, rng=random):
+        from enemy_utils import perform_attack
+        return perform_attack(self, rng)
+
+    def state(self) -> dict:
+        """
+        Plain-data copy of the enemy's attributes. Status effects are copied;
+        traits and attack modes are static and shared.
+        """
+        state = {}
+        for name in STATE_FIELDS:
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:  # current_attack_* are only set once it has attacked
+                pass
+        state["status_effects"] = [dict(effect) for effect in self.status_effects]
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Enemy":
+        """Build a detached enemy from state() output."""
+        enemy = cls.__new__(cls)
+        enemy._store = enemy._slot = enemy._index = None
+        enemy.kind = None
+        for name, value in state.items():
+            setattr(enemy, name, value)
+        enemy.status_effects = StatusEffects(state.get("status_effects", ()))
+        if enemy.kind is not None:
+            # Share the archetype's attack modes again (e.g. after a snapshot round trip)
+            from enemy_data import ARCHETYPES
+            archetype = ARCHETYPES.get(enemy.kind)
+            if archetype is not None and archetype.attack_modes == enemy.attack_modes:
+                enemy.attack_modes = archetype.attack_modes
+        return enemy
@@ -1,157 +1,264 @@
-#enemy_data.py
+# enemy_data.py
+# NOTE: Enemy archetypes. Each type's stats, traits and attack modes are built
+# once into an Archetype shared by every enemy of that type (flyweight), along
+# with the cumulative weights used to pick an attack mode; spawning an enemy
+# only allocates its own mutable state (health, effects, position).
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Dict, Optional, Tuple
+
 from enemy import Enemy
 
 
-def make_goblin():
-    return Enemy("Goblin", 20, 4, 8, evasion=15)
+@dataclass(frozen=True)
+class Archetype:
+    kind: str
+    name: str
+    health: int
+    attack_min: int
+    attack_max: int
+    evasion: int = 0
+    defense: int = 0
+    traits: Dict = field(default_factory=dict)
+    size: int = 5
+    stealth: int = 0
+    perception: int = 0
+    speed: int = 10
+    attack_modes: Optional[Tuple[dict, ...]] = None  # shared by every enemy of this type; never edit
+    cum_weights: Tuple[float, ...] = ()  # running totals of the modes' weights, for rng.choices
+
+    def spawn(self, into: Optional[Enemy] = None) -> Enemy:
+        """
+        A fresh enemy of this type.
+
+        Args:
+            into (Optional[Enemy]): A detached enemy (no store, no room) to
+                reinitialise instead of allocating a new one (see enemy_utils.EnemyPool).
+        """
+        enemy = Enemy.__new__(Enemy) if into is None else into
+        if into is not None:
+            # Set by its last attack; a new enemy has neither until it attacks
+            for name in ("current_attack_mode", "current_attack_traits"):
+                if hasattr(into, name):
+                    delattr(into, name)
+        Enemy.__init__(enemy, self.name, self.health, self.attack_min, self.attack_max,
+                       evasion=self.evasion, defense=self.defense, traits=self.traits,
+                       size=self.size, stealth=self.stealth, perception=self.perception,
+                       attack_modes=self.attack_modes, speed=self.speed, kind=self.kind)
+        return enemy
+
+
+# Registered archetypes by kind (the kind is what enemies and snapshots carry)
+ARCHETYPES: Dict[str, Archetype] = {}
+
+
+def register_archetype(kind: str, name: str, health: int, attack_min: int = 0, attack_max: int = 0,
+                       attack_modes=None, **stats) -> Archetype:
+    """
+    Compile an enemy type and add it to ARCHETYPES.
+
+    Args:
+        kind (str): Registry key, e.g. "goblin".
+        name (str): Display name of its enemies.
+        health (int): Starting health.
+        attack_min (int): Damage range used when it has no attack modes.
+        attack_max (int): See attack_min.
+        attack_modes (list): Attack mode dicts (name, damage_min, damage_max, traits, weight).
+        **stats: Any other Enemy argument (evasion, defense, traits, size, stealth, perception, speed).
+
+    Returns:
+        Archetype: The registered archetype.
+    """
+    modes = tuple(attack_modes) if attack_modes else None
+    cum_weights = tuple(accumulate(mode.get("weight", 1) for mode in modes)) if modes else ()
+    archetype = ARCHETYPES[kind] = Archetype(kind, name, health, attack_min, attack_max,
+                                             attack_modes=modes, cum_weights=cum_weights, **stats)
+    return archetype
+
+
+def get_archetype(kind: str) -> Archetype:
+    return ARCHETYPES[kind]
+
 
+def spawn(kind: str) -> Enemy:
+    """A new enemy of a registered type."""
+    return ARCHETYPES[kind].spawn()
+
+
+# Enemy types
+
+register_archetype("goblin", "Goblin", 20, 4, 8, evasion=15)
+
+register_archetype(
+    "spider",
+    name="Giant Spider",
+    health=25,
+    attack_min=0,
+    attack_max=0,
+    defense=6,
+    attack_modes=[
+        {
+            "name": "Venomous Bite",
+            "damage_min": 2,
+            "damage_max": 4,
+            "traits": {"poison_on_hit": {"damage": 2, "duration": 4, "chance": 1.0}},
+            "weight": 3
+        },
+        {
+            "name": "Web Wrap",
+            "damage_min": 0,
+            "damage_max": 0,
+            "traits": {"maim": {"chance": 0.5}},
+            "weight": 1
+        }
+    ]
+)
+
+register_archetype(
+    "scyther",
+    name="Scyther Drone",
+    health=40,
+    attack_min=0,
+    attack_max=0,
+    defense=10,
+    attack_modes=[
+        {
+            "name": "Mono-blade Slash",
+            "damage_min": 6,
+            "damage_max": 10,
+            "traits": {"bleed": {"chance": 1.0}},
+            "weight": 3
+        },
+        {
+            "name": "Charge Ram",
+            "damage_min": 4,
+            "damage_max": 8,
+            "traits": {"maim": {"chance": 0.5}},
+            "weight": 1
+        }
+    ]
+)
+
+register_archetype(
+    "chitin_bug",
+    name="Chitin Bug",
+    health=30,
+    attack_min=0,
+    attack_max=0,
+    defense=8,
+    attack_modes=[
+        {
+            "name": "Mandible Clamp",
+            "damage_min": 3,
+            "damage_max": 5,
+            "traits": {"bleed": {"chance": 0.7}},
+            "weight": 2
+        },
+        {
+            "name": "Acid Spit",
+            "damage_min": 2,
+            "damage_max": 4,
+            "traits": {"poison_on_hit": {"damage": 2, "duration": 2, "chance": 1.0}},
+            "weight": 3
+        }
+    ]
+)
+
+register_archetype(
+    "psylink_aberrant",
+    name="Psylink Aberrant",
+    health=28,
+    attack_min=0,
+    attack_max=0,
+    defense=5,
+    attack_modes=[
+        {
+            "name": "Mind Shatter",
+            "damage_min": 5,
+            "damage_max": 8,
+            "traits": {"blind": {"duration": 2}},
+            "weight": 2
+        },
+        {
+            "name": "Neural Lash",
+            "damage_min": 3,
+            "damage_max": 6,
+            "traits": {"maim": {"chance": 1.0}},
+            "weight": 1
+        }
+    ]
+)
+
+register_archetype(
+    "burned_thrall",
+    name="Burned Thrall",
+    health=20,
+    attack_min=0,
+    attack_max=0,
+    defense=4,
+    attack_modes=[
+        {
+            "name": "Charred Swipe",
+            "damage_min": 2,
+            "damage_max": 5,
+            "traits": {},
+            "weight": 3
+        },
+        {
+            "name": "Molten Touch",
+            "damage_min": 3,
+            "damage_max": 6,
+            "traits": {"burn": {"damage": 1, "duration": 3}},
+            "weight": 2
+        }
+    ]
+)
+
+register_archetype(
+    "ancient_mech_core",
+    name="Ancient Mech Core",
+    health=60,
+    attack_min=0,
+    attack_max=0,
+    defense=12,
+    attack_modes=[
+        {
+            "name": "Pulse Beam",
+            "damage_min": 8,
+            "damage_max": 12,
+            "traits": {},
+            "weight": 3
+        },
+        {
+            "name": "Neural Feedback",
+            "damage_min": 0,
+            "damage_max": 0,
+            "traits": {"blind": {"duration": 2}, "maim": {"chance": 1.0}},
+            "weight": 1
+        }
+    ]
+)
+
+
+# Factories for each type (as used by map generators and tests)
+
+def make_goblin():
+    return ARCHETYPES["goblin"].spawn()
 
 def make_spider():
-    return Enemy(
-        name="Giant Spider",
-        health=25,
-        attack_min=0,
-        attack_max=0,
-        defense=6,
-        attack_modes=[
-            {
-                "name": "Venomous Bite",
-                "damage_min": 2,
-                "damage_max": 4,
-                "traits": {"poison_on_hit": {"damage": 2, "duration": 4, "chance": 1.0}},
-                "weight": 3
-            },
-            {
-                "name": "Web Wrap",
-                "damage_min": 0,
-                "damage_max": 0,
-                "traits": {"maim": {"chance": 0.5}},
-                "weight": 1
-            }
-        ]
-    )
+    return ARCHETYPES["spider"].spawn()
 
 def make_scyther():
-    return Enemy(
-        name="Scyther Drone",
-        health=40,
-        attack_min=0,
-        attack_max=0,
-        defense=10,
-        attack_modes=[
-            {
-                "name": "Mono-blade Slash",
-                "damage_min": 6,
-                "damage_max": 10,
-                "traits": {"bleed": {"chance": 1.0}},
-                "weight": 3
-            },
-            {
-                "name": "Charge Ram",
-                "damage_min": 4,
-                "damage_max": 8,
-                "traits": {"maim": {"chance": 0.5}},
-                "weight": 1
-            }
-        ]
-    )
+    return ARCHETYPES["scyther"].spawn()
 
 def make_chitin_bug():
-    return Enemy(
-        name="Chitin Bug",
-        health=30,
-        attack_min=0,
-        attack_max=0,
-        defense=8,
-        attack_modes=[
-            {
-                "name": "Mandible Clamp",
-                "damage_min": 3,
-                "damage_max": 5,
-                "traits": {"bleed": {"chance": 0.7}},
-                "weight": 2
-            },
-            {
-                "name": "Acid Spit",
-                "damage_min": 2,
-                "damage_max": 4,
-                "traits": {"poison_on_hit": {"damage": 2, "duration": 2, "chance": 1.0}},
-                "weight": 3
-            }
-        ]
-    )
+    return ARCHETYPES["chitin_bug"].spawn()
 
 def make_psylink_aberrant():
-    return Enemy(
-        name="Psylink Aberrant",
-        health=28,
-        attack_min=0,
-        attack_max=0,
-        defense=5,
-        attack_modes=[
-            {
-                "name": "Mind Shatter",
-                "damage_min": 5,
-                "damage_max": 8,
-                "traits": {"blind": {"duration": 2}},
-                "weight": 2
-            },
-            {
-                "name": "Neural Lash",
-                "damage_min": 3,
-                "damage_max": 6,
-                "traits": {"maim": {"chance": 1.0}},
-                "weight": 1
-            }
-        ]
-    )
+    return ARCHETYPES["psylink_aberrant"].spawn()
 
 def make_burned_thrall():
-    return Enemy(
-        name="Burned Thrall",
-        health=20,
-        attack_min=0,
-        attack_max=0,
-        defense=4,
-        attack_modes=[
-            {
-                "name": "Charred Swipe",
-                "damage_min": 2,
-                "damage_max": 5,
-                "traits": {},
-                "weight": 3
-            },
-            {
-                "name": "Molten Touch",
-                "damage_min": 3,
-                "damage_max": 6,
-                "traits": {"burn": {"damage": 1, "duration": 3}},
-                "weight": 2
-            }
-        ]
-    )
+    return ARCHETYPES["burned_thrall"].spawn()
 
 def make_ancient_mech_core():
-    return Enemy(
-        name="Ancient Mech Core",
-        health=60,
-        attack_min=0,
-        attack_max=0,
-        defense=12,
-        attack_modes=[
-            {
-                "name": "Pulse Beam",
-                "damage_min": 8,
-                "damage_max": 12,
-                "traits": {},
-                "weight": 3
-            },
-            {
-                "name": "Neural Feedback",
-                "damage_min": 0,
-                "damage_max": 0,
-                "traits": {"blind": {"duration": 2}, "maim": {"chance": 1.0}},
-                "weight": 1
-            }
-        ]
-    )
\ No newline at end of file
+    return ARCHETYPES["ancient_mech_core"].spawn()
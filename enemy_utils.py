@@ -1,26 +1,126 @@
 # enemy_utils.py
 import random
+from typing import Dict, List, Optional, Sequence
+
 from enemy import Enemy
+from enemy_data import ARCHETYPES
+from maps import MapRoom
 
 def make_multiple_enemies(factory_func, count):
     """Create a list of enemies using the given factory function."""
     return [factory_func() for _ in range(count)]
 
-def perform_attack(enemy: Enemy) -> int:
+
+class EnemyPool:
+    """
+    Defeated enemies kept for reuse, per archetype. acquire() reinitialises a
+    pooled enemy in place (Archetype.spawn(into=...)) rather than allocating
+    one; enemies without an archetype are not pooled. Each Game owns one
+    (Game.pool), so pooled enemies never cross sessions.
+    """
+
+    def __init__(self, max_per_kind: int = 64):
+        self.max_per_kind = max_per_kind
+        self._free: Dict[str, List[Enemy]] = {}
+        self.reused = 0
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
+
+    def acquire(self, kind: str) -> Enemy:
+        """A fresh enemy of an archetype, recycled if one is pooled."""
+        archetype = ARCHETYPES[kind]
+        free = self._free.get(kind)
+        if not free:
+            return archetype.spawn()
+        enemy = free.pop()
+        self.reused += 1
+        return archetype.spawn(into=enemy)
+
+    def release(self, enemy: Enemy):
+        """Take back a detached enemy (out of every room and store) for reuse."""
+        if enemy.kind not in ARCHETYPES:
+            return
+        free = self._free.setdefault(enemy.kind, [])
+        if len(free) < self.max_per_kind:
+            free.append(enemy)
+
+
+def spawn_enemies(room: MapRoom, kind: str, count: int, zones: Optional[Sequence[str]] = None,
+                  rng=None, pool: Optional[EnemyPool] = None) -> List[Enemy]:
+    """
+    Create `count` enemies of an archetype in a room in one call.
+
+    Args:
+        room (MapRoom): Room to populate.
+        kind (str): Archetype key (see enemy_data.ARCHETYPES).
+        count (int): Number of enemies.
+        zones (Optional[Sequence[str]]): Zones to place them in; defaults to every zone of the room.
+        rng: If given, each enemy goes to a random zone (one rng.choice each);
+            otherwise zones are filled in turn.
+        pool (Optional[EnemyPool]): Where to recycle enemies from; without one they are all new.
+
+    Returns:
+        List[Enemy]: The new enemies, in the order they were placed.
+    """
+    archetype = ARCHETYPES[kind]
+    zones = list(zones) if zones is not None else list(room.zones)
+    enemies = []
+    for i in range(count):
+        enemy = pool.acquire(kind) if pool is not None else archetype.spawn()
+        room.add_enemy(enemy, rng.choice(zones) if rng is not None else zones[i % len(zones)])
+        enemies.append(enemy)
+    return enemies
+
+
+def reap_dead(room: MapRoom, pool: Optional[EnemyPool] = None) -> int:
+    """
+    Take a room's dead enemies out of its zones, actor store and index, and
+    hand them to a pool for reuse, so later zone scans skip them entirely.
+
+    Args:
+        room (MapRoom): Room to clear.
+        pool (Optional[EnemyPool]): Pool receiving the dead; without one they are dropped.
+
+    Returns:
+        int: Enemies removed.
+    """
+    reaped = 0
+    for zone in room.zones.values():
+        if all(enemy.is_alive() for enemy in zone.enemies):
+            continue
+        dead = [enemy for enemy in zone.enemies if not enemy.is_alive()]
+        zone.enemies[:] = [enemy for enemy in zone.enemies if enemy.is_alive()]
+        for enemy in dead:
+            if room.index is not None:
+                room.index.remove_enemy(enemy)
+            if enemy._store is not None:
+                enemy._store.remove(enemy)
+            if pool is not None:
+                pool.release(enemy)
+        reaped += len(dead)
+    return reaped
+
+def perform_attack(enemy: Enemy, rng=random) -> int:
     """
     Perform an enemy attack, either simple or from attack_modes.
     
     Modifies enemy's current attack state and returns damage dealt.
     """
     if not enemy.attack_modes:
-        damage = random.randint(enemy.attack_min, enemy.attack_max)
+        damage = rng.randint(enemy.attack_min, enemy.attack_max)
         enemy.current_attack_mode = None
         enemy.current_attack_traits = {}
         return damage
 
-    weights = [mode.get("weight", 1) for mode in enemy.attack_modes]
-    chosen = random.choices(enemy.attack_modes, weights=weights, k=1)[0]
-    damage = random.randint(chosen["damage_min"], chosen["damage_max"])
+    modes = enemy.attack_modes
+    archetype = ARCHETYPES.get(enemy.kind)
+    if archetype is not None and archetype.attack_modes is modes:
+        # Same draw as weights=..., from the archetype's precomputed running totals
+        chosen = rng.choices(modes, cum_weights=archetype.cum_weights, k=1)[0]
+    else:
+        chosen = rng.choices(modes, weights=[mode.get("weight", 1) for mode in modes], k=1)[0]
+    damage = rng.randint(chosen["damage_min"], chosen["damage_max"])
     enemy.current_attack_mode = chosen["name"]
     enemy.current_attack_traits = chosen.get("traits", {})
     return damage
\ No newline at end of file
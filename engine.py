@@ -1,15 +1,22 @@
 # engine.py
 # NOTE: Game loop and player interaction logic for room traversal, combat, and perception
 
+import random
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from player import Player
+from rng import GameRNG, Seed
 from maps import MapRoom
 from enemy import Enemy
+from enemy_utils import EnemyPool, reap_dead
+from map_utils import arrival_zone, start_zone
+from world import RoomTable, get_prototype
+from initiative_utils import InitiativeQueue
 from combat import resolve_attack
 from status_effects import process_effects
-from messaging import format_status_effect
+from visibility import VisibilityState, describe_view, is_detected, update_visibility_state, visible_features
+from events import Event, DeathEvent, MoveEvent, ArrivalEvent, RoomEvent, NoticeEvent
 from messaging import msg_game_over
 from messaging import format_zone_description
 import movement
@@ -17,21 +24,96 @@ import movement
 @dataclass
 class Game:
     player: Player
-    rooms: Dict[str, MapRoom]  # All known rooms keyed by room id
+    rooms: Dict[str, MapRoom]  # All known rooms keyed by room id (RoomTable/PagedRooms for shared or paged worlds)
     current_key: str           # ID of current room
     previous_key: Optional[str] = None
     turns: int = 0
     move_progress: int = 0
     target_direction: Optional[str] = None
     search_bonus_turns: int = 0
-    player_zone: str = "center"  # default starting zone
+    player_zone: Optional[str] = None  # zone key in the current room (None: the room's start zone)
+    rng: random.Random = field(default_factory=GameRNG, repr=False)  # source of all in-game randomness
+    initiative: InitiativeQueue = field(default_factory=InitiativeQueue, repr=False)  # player + enemies of the current room
+    routes: Optional["movement.RoutePlanner"] = field(default=None, repr=False)  # built by movement.route_planner
+    visibility: VisibilityState = field(default_factory=VisibilityState, repr=False)  # see update_visibility_state
+    pool: EnemyPool = field(default_factory=EnemyPool, repr=False)  # this game's defeated enemies, for reuse
+
+    def __post_init__(self):
+        if self.player_zone is None:
+            self.player_zone = start_zone(self.room)
+        if not self.initiative:
+            self.initiative.add(self.player)
+            for enemy in self.room.visible_enemies():
+                self.initiative.add(enemy)
+
+    def catch_up_room(self, room: MapRoom):
+        """
+        Bring an off-screen room up to the current turn. Only the current room
+        is ticked each turn, so on entry its enemies' effects are applied for
+        all the turns missed since, in one batched step per enemy.
+        """
+        elapsed = self.turns - room.last_turn
+        if elapsed > 0:
+            for enemy in room.visible_enemies():
+                if enemy.status_effects:
+                    enemy.status_effects.advance(enemy, elapsed)
+        room.last_turn = self.turns
+
+    def _enter_room(self, old_room: MapRoom):
+        """
+        Catch the new current room up, put the player in the doorway they came
+        through, then swap the previous room's enemies for its living ones in
+        the initiative queue. Newcomers are due with the player's next action,
+        after the player. The dead left behind are cleared out of the previous
+        room for reuse.
+        """
+        self.catch_up_room(self.room)
+        self.player_zone = arrival_zone(self.room, old_room.id)
+        for enemy in old_room.visible_enemies():
+            self.initiative.remove(enemy)
+        reap_dead(old_room, self.pool)
+        due = self.initiative.time_of(self.player)
+        for enemy in self.room.visible_enemies():
+            self.initiative.add(enemy, due)
 
-    def move_player_to_keyword(self, keyword: str) -> list[str]:
+    def _room_changed(self, room: MapRoom):
         """
-        Delegate player movement by keyword to movement.py and return messages.
+        Tell a paged map (room_pager.PagedRooms) that a room no longer matches
+        its seed version. Fighting is the only thing that changes a room; the
+        effect ticks and reaping that follow only touch rooms already marked.
         """
-        success, messages = movement.move_player_to_keyword(self, keyword)
-        return messages
+        mark_changed = getattr(self.rooms, "mark_changed", None)
+        if mark_changed is not None:
+            mark_changed(room.id)
+
+    def _enemy_phase(self) -> List[Event]:
+        """Let every enemy whose action comes before the player's next one act."""
+        events = []
+        queue = self.initiative
+        assert self.player in queue, "the player must be queued, or enemies would act forever"
+        while queue and queue.peek() is not self.player:
+            enemy = queue.pop_next_actor()
+            if enemy.is_alive():
+                events.append(resolve_attack(enemy, self.player, roll_mod=0, half=True, rng=self.rng))
+                queue.schedule_next_turn(enemy)
+        return events
+
+    def move_player_to_keyword(self, keyword: str) -> List[Event]:
+        """
+        Delegate player movement by keyword to movement.py and return its messages as events.
+        Crossing the current room takes a turn; if the target is in another room, the player
+        also starts moving through the first exit.
+        """
+        zone = self.player_zone
+        success, messages, exit_name = movement.move_player_to_keyword(self, keyword)
+        events = [NoticeEvent("text", {"text": message}) for message in messages]
+        if exit_name is not None:
+            events += self.move(exit_name)
+        elif self.player_zone != zone:
+            events += self.advance_turn()  # walking across the room takes a turn
+        else:
+            update_visibility_state(self)
+        return events
 
     def is_game_over(self) -> bool:
         return self.player.health <= 0
@@ -48,46 +130,18 @@ class Game:
 
     def describe_player_current_zone(self) -> dict:
         """
-        Generate a structured description of the player's current zone,
-        filtered to only include what the player can perceive.
+        Generate a structured description of the player's current zone, and of
+        the enemies they can see in other zones from it, filtered to only
+        include what the player can perceive (see visibility.VisibilityState).
 
         Returns:
             dict: Data structure describing visible features and enemies.
         """
-        zone = self.room.zones.get(self.player_zone)
-        if not zone:
-            return {
-                "zone_name": "Unknown",
-                "features": [],
-                "enemies": []
-            }
-
-        perception = self.get_effective_perception()
-
-        # Filter enemies by perception
-        visible_enemies = []
-        for enemy in zone.enemies:
-            if enemy.is_alive():
-                detection_score = perception - enemy.stealth + (enemy.size - 5)
-                if detection_score >= 0:
-                    visible_enemies.append({
-                        "name": enemy.name,
-                        "status": "alive"
-                    })
-
-        # Optionally, you can filter features here too if you add stealth or hidden flags
-            # Stub: Filter features based on visibility
-        visible_features = self.filter_visible_features(zone.features, perception)
-
-        return {
-            "zone_name": zone.display_name,
-            "features": visible_features,
-            "enemies": visible_enemies
-        }
+        return describe_view(update_visibility_state(self), self.player_zone)
 
     def filter_visible_features(self, features: list[str], perception: int) -> list[str]:
         """
-        Stub for filtering features based on player perception or other criteria.
+        Filter features by the player's perception (see visibility.FEATURE_THRESHOLDS).
 
         Args:
             features (list[str]): List of all features in the zone.
@@ -96,133 +150,191 @@ class Game:
         Returns:
             list[str]: Filtered list of features visible to the player.
         """
-        # TODO: Implement visibility logic for features here.
-        # For now, return all features unfiltered.
-        return features
+        return visible_features(features, perception)
 
     def is_enemy_visible(self, enemy: Enemy) -> bool:
         """Determine whether an enemy is currently visible to the player."""
-        perception = self.get_effective_perception()
-        detection_score = perception - enemy.stealth + (enemy.size - 5)
-        return detection_score >= 0
+        return is_detected(enemy, self.get_effective_perception())
 
-    def flee(self) -> List[str]:
+    def flee(self) -> List[Event]:
         """Attempt to flee to the previously visited room."""
         if not self.previous_key:
-            return ["You have nowhere to run!"]
+            return [NoticeEvent("no_escape")]
 
+        old_room = self.room
         self.current_key, self.previous_key = self.previous_key, self.current_key
-        lines = ["🏃 You flee back to the previous room."]
-        lines += self.advance_turn()
-        lines += self.look()
-        return lines
+        self._enter_room(old_room)
+        events = [NoticeEvent("flee")]
+        events += self.advance_turn()
+        events += self.look()
+        return events
 
-    def search(self) -> List[str]:
+    def search(self) -> List[Event]:
         """Activate temporary perception bonus."""
         self.search_bonus_turns = 2
-        return ["🔍 You carefully examine your surroundings. Perception increased temporarily."]
+        return [NoticeEvent("search")]
 
-    def move(self, direction: str) -> List[str]:
+    def move(self, direction: str) -> List[Event]:
         """Initiate or continue movement in a given direction."""
-        lines = []
+        events = []
 
         if self.target_direction is None:
             self.target_direction = direction
             self.move_progress = 1
-            lines.append(f"🚶 You start moving {direction.upper()}...")
+            events.append(MoveEvent(direction, self.move_progress))
         elif self.target_direction == direction:
             self.move_progress += 1
-            lines.append(f"🚶 You continue moving {direction.upper()}... ({self.move_progress}/3)")
+            events.append(MoveEvent(direction, self.move_progress))
         else:
             self.target_direction = direction
             self.move_progress = 1
-            lines.append(f"🔄 You change direction and start moving {direction.upper()}.")
+            events.append(MoveEvent(direction, self.move_progress, changed=True))
 
         if self.move_progress >= 3:
+            old_room = self.room
             self.previous_key = self.current_key
             self.current_key = self.room.exits[self.target_direction]
-            lines.append(f"➡️ You arrive at the {self.room.name}.")
+            self._enter_room(old_room)
+            events.append(ArrivalEvent(self.room))
             self.move_progress = 0
             self.target_direction = None
-            lines += self.look()
+            events += self.look()
 
-        lines += self.advance_turn()
-        return lines
+        events += self.advance_turn()
+        return events
 
     @property
     def room(self) -> MapRoom:
-        """Convenience accessor for the current room."""
+        """
+        Convenience accessor for the current room. Room tables with a write
+        barrier (RoomTable, PagedRooms) are asked to claim() it, since the
+        engine only ever mutates the current room.
+        """
+        claim = getattr(self.rooms, "claim", None)
+        if claim is not None:
+            return claim(self.current_key)
         return self.rooms[self.current_key]
 
-    def look(self) -> List[str]:
+    def look(self) -> List[Event]:
         """Describe the current room, its exits, and any visible enemies."""
         room = self.room
-        lines = [
-            f"📍 {room.name}",
-            room.description,
-            f"Exits: {room.exit_list()}",
-        ]
-        visible = room.visible_enemies()
-        if visible:
-            lines.append("Enemies here: " + ", ".join(e.name for e in visible))
-        return lines
-
-    def attack(self) -> List[str]:
+        return [RoomEvent(room, room.visible_enemies())]
+
+    def attack(self) -> List[Event]:
         """Resolve combat against visible enemies in the room."""
         enemies = self.room.visible_enemies()
 
         if not enemies:
-            lines = ["There is nothing to fight."]
-            lines += self.advance_turn()
-            return lines
-
-        lines = []
-
-        # Player attacks first visible enemy
-        target = enemies[0]
-        roll_mod = self.player.skill + self.player.buffs.get("attack_bonus", 0)
-        lines += resolve_attack(self.player, target, roll_mod=roll_mod, half=False, buffs=self.player.buffs)
-
-        # Enemies retaliate
-        for enemy in enemies:
-            if enemy.is_alive():
-                lines += resolve_attack(enemy, self.player, roll_mod=0, half=True)
-
-        lines.append(f"💖 Your health: {self.player.health}")
+            events = [NoticeEvent("nothing_to_fight")]
+            events += self.advance_turn()
+            return events
+
+        # Anyone due before the player acts first, then it is the player's turn
+        self._room_changed(self.room)
+        events = self._enemy_phase()
+        if self.player.health > 0:
+            self.initiative.pop_next_actor()
+
+            # Player attacks first visible enemy
+            target = enemies[0]
+            roll_mod = self.player.skill + self.player.buffs.get("attack_bonus", 0)
+            events.append(resolve_attack(self.player, target, roll_mod=roll_mod, half=False, buffs=self.player.buffs, rng=self.rng))
+            if not target.is_alive():
+                events.append(DeathEvent(target, self.turns))
+                self.initiative.remove(target)
+            self.initiative.schedule_next_turn(self.player)
+
+            # Enemies retaliate in initiative order until the player is next again
+            events += self._enemy_phase()
+
+        events.append(NoticeEvent("health", {"health": self.player.health}))
         if self.player.health <= 0:
-            lines.append("💀 You have been slain!")
+            events.append(DeathEvent(self.player, self.turns))
 
-        lines += self.advance_turn()
-        return lines
+        events += self.advance_turn()
+        return events
 
-    def advance_turn(self) -> List[str]:
+    def advance_turn(self) -> List[Event]:
         """Advance the game clock and apply status effects to all actors."""
         self.turns += 1
-        lines = []
+        events = []
 
         if self.search_bonus_turns > 0:
             self.search_bonus_turns -= 1
 
-        for event in process_effects(self.player):
-            lines.extend(format_status_effect(event))
+        player_alive = self.player.health > 0
+        events += process_effects(self.player)
+        if player_alive and self.player.health <= 0:
+            events.append(DeathEvent(self.player, self.turns))
 
-        for enemy in self.room.visible_enemies():
-            for event in process_effects(enemy):
-                lines.extend(format_status_effect(event))
+        room = self.room
+        for enemy in room.visible_enemies():
+            events += process_effects(enemy)
+            if not enemy.is_alive():
+                events.append(DeathEvent(enemy, self.turns))
+                self.initiative.remove(enemy)
+        room.last_turn = self.turns
+        update_visibility_state(self)
 
         if not self.room.visible_enemies():
-            lines.append("🧘 The room is quiet...")
+            events.append(NoticeEvent("quiet"))
+
+        return events
 
-        return lines
+def build_game(player_name: str, seed: Optional[Seed] = None) -> Game:
+    """
+    Construct the initial Game state on top of the shared world prototype.
 
-def build_game(player_name: str) -> Game:
-    """Construct the initial Game state from the generated map."""
-    from map_generator import generate_test_map
+    Args:
+        player_name (str): Name for the new Player.
+        seed (Optional[Seed]): Seed for the game's RNG. Replaying a seed with the
+            same commands reproduces the run exactly; when omitted a random seed
+            is chosen and kept as game.rng.seed_value.
+    """
     from player import Player
 
     player = Player(name=player_name)
-    rooms, starting_key = generate_test_map()
-    return Game(player=player, rooms=rooms, current_key=starting_key)
-
-
-#Todo move out all the player facing messages to messaging.py
\ No newline at end of file
+    world = get_prototype()
+    return Game(player=player, rooms=RoomTable(world), current_key=world.start_key, rng=GameRNG(seed))
+
+def build_procedural_game(player_name: str, seed: Seed, room_count: int = 100_000,
+                          max_resident: int = 64, store=None) -> Game:
+    """
+    Construct a Game on a procedural dungeon that is paged in on demand.
+
+    Args:
+        player_name (str): Name for the new Player.
+        seed (Seed): Seeds both the dungeon layout and the game's RNG.
+        room_count (int): Rooms in the dungeon.
+        max_resident (int): Most rooms kept in memory at once.
+        store: Where changed rooms go when evicted (room_pager.MemoryRoomStore by default).
+
+    The dead reaped from rooms the player leaves repopulate rooms paged in later.
+    """
+    from player import Player
+    from room_pager import PagedRooms, ProceduralSource
+
+    source = ProceduralSource(seed, room_count)
+    pool = EnemyPool()
+    rooms = PagedRooms(source, max_resident=max_resident, store=store, pool=pool)
+    return Game(player=Player(name=player_name), rooms=rooms, current_key=source.start_key, rng=GameRNG(seed), pool=pool)
+
+def run_command(game: Game, command: str) -> List[Event]:
+    """
+    Apply one text command from a front end (move via an exit name, a=attack,
+    r=flee, look, go <keyword>) and return the resulting events.
+    """
+    if command in game.room.exits:
+        return game.move(command)
+    elif command.startswith("go "):
+        return game.move_player_to_keyword(command[3:])
+    elif command == "a":
+        return game.attack()
+    elif command == "r":
+        return game.flee()
+    elif command == "look":
+        return game.look()
+    return [NoticeEvent("unknown_command")]
+
+
+#Todo move out all the player facing messages to messaging.py
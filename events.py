@@ -0,0 +1,79 @@
+# events.py
+# NOTE: Typed records produced by the engine. They carry raw data only; turning
+# them into player-facing text is messaging.py's job and happens on demand,
+# so headless callers never pay for string formatting.
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+
+@dataclass(slots=True)
+class StatusEvent:
+    """A status effect landing on or ticking on a target (poison, regen, blind...)."""
+    effect: str
+    target: Any
+    amount: int = 0
+    count: int = 1
+
+
+@dataclass(slots=True)
+class ExpireEvent:
+    target: Any
+    effect: str
+
+
+@dataclass(slots=True)
+class AttackEvent:
+    attacker: Any
+    target: Any
+    d1: int
+    d2: int
+    roll_mod: int
+    total: int
+    damage: int
+    multiplier: float
+    hit_type: str
+    attack_name: Optional[str] = None
+    status_events: List[StatusEvent] = field(default_factory=list)
+
+    @property
+    def roll(self) -> int:
+        return self.d1 + self.d2
+
+
+@dataclass(slots=True)
+class DeathEvent:
+    target: Any
+    turn: int = 0
+
+
+@dataclass(slots=True)
+class MoveEvent:
+    direction: str
+    progress: int
+    changed: bool = False
+
+
+@dataclass(slots=True)
+class ArrivalEvent:
+    room: Any
+
+
+@dataclass(slots=True)
+class RoomEvent:
+    """Result of looking around: the room and the enemies seen in it."""
+    room: Any
+    enemies: List[Any] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class NoticeEvent:
+    """Any other fixed message, identified by kind (see messaging.NOTICES)."""
+    kind: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+Event = Union[
+    AttackEvent, StatusEvent, ExpireEvent, DeathEvent,
+    MoveEvent, ArrivalEvent, RoomEvent, NoticeEvent,
+]
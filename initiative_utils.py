@@ -0,0 +1,91 @@
+# initiative_utils.py
+# NOTE: Global initiative queue from the "High Level game loop" design: a heap
+# of actors keyed by the time of their next action. Faster actors (higher
+# speed) get shorter delays between actions; ties go to whoever was queued
+# first, so equal-speed actors take turns round-robin. A Game only queues the
+# player and the enemies of the current room; off-screen rooms are not
+# scheduled and are caught up on entry (Game.catch_up_room).
+
+import heapq
+import itertools
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_SPEED = 10
+ACTION_TIME = 100  # delay between actions at DEFAULT_SPEED
+
+_REMOVED = object()  # placeholder for entries cancelled in place
+
+
+def action_delay(actor) -> int:
+    """Time between two actions of an actor, from its speed stat."""
+    speed = max(1, getattr(actor, "speed", DEFAULT_SPEED))
+    return max(1, ACTION_TIME * DEFAULT_SPEED // speed)
+
+
+class InitiativeQueue:
+    """
+    Heap of [time, sequence, actor] entries. Removing or rescheduling an actor
+    cancels its entry in place (O(1)) and pushes a new one (O(log n)); cancelled
+    entries are skipped when they reach the top.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self._heap: List[list] = []
+        self._entries: Dict[int, list] = {}  # id(actor) -> live heap entry
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, actor) -> bool:
+        return id(actor) in self._entries
+
+    def add(self, actor, time: Optional[int] = None):
+        """Queue an actor to act at `time` (default: now), replacing any existing entry."""
+        self.remove(actor)
+        entry = [self.now if time is None else time, next(self._sequence), actor]
+        self._entries[id(actor)] = entry
+        heapq.heappush(self._heap, entry)
+
+    def remove(self, actor):
+        """Take an actor out of the queue (e.g. on death); a no-op if it is not queued."""
+        entry = self._entries.pop(id(actor), None)
+        if entry is not None:
+            entry[2] = _REMOVED
+
+    def reschedule(self, actor, time: int):
+        self.add(actor, time)
+
+    def time_of(self, actor) -> Optional[int]:
+        entry = self._entries.get(id(actor))
+        return entry[0] if entry else None
+
+    def _prune(self):
+        heap = self._heap
+        while heap and heap[0][2] is _REMOVED:
+            heapq.heappop(heap)
+
+    def peek(self) -> Any:
+        """The actor that acts next, without removing it (None if the queue is empty)."""
+        self._prune()
+        return self._heap[0][2] if self._heap else None
+
+    def pop_next_actor(self) -> Any:
+        """Remove and return the next actor, advancing the clock to its action time."""
+        self._prune()
+        time, _, actor = heapq.heappop(self._heap)
+        del self._entries[id(actor)]
+        self.now = max(self.now, time)
+        return actor
+
+    def schedule_next_turn(self, actor):
+        """Queue an actor that just acted for its next action."""
+        self.add(actor, self.now + action_delay(actor))
+
+    def entries(self) -> List[Tuple[int, Any]]:
+        """(time, actor) pairs in the order they would act."""
+        return [(entry[0], entry[2]) for entry in sorted(self._entries.values())]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (actor for _, actor in self.entries())
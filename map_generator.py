@@ -1,5 +1,20 @@
+# map_generator.py
+# NOTE: The hand-written test map, plus a seeded procedural generator for large
+# dungeons. Every procedural room is a pure function of (seed, room index), so
+# any chunk (or single room) can be regenerated on its own, in any order.
+
+import hashlib
+import math
+import random
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
 from maps import MapRoom, Zone
+from rng import Seed
 from enemy_data import make_spider, make_goblin
+from enemy_utils import spawn_enemies
+
+if TYPE_CHECKING:
+    from enemy_utils import EnemyPool
 
 def generate_test_map():
     """
@@ -125,4 +140,193 @@ def generate_test_map():
         room1.id: room1,
         room2.id: room2,
         room3.id: room3
-    }, room1.id
\ No newline at end of file
+    }, room1.id
+
+
+# Procedural generation
+
+CHUNK_SIZE = 1024
+EXTRA_LINK_CHANCE = 0.25  # chance of a north/south exit off the west-edge spine
+
+ROOM_ADJECTIVES = ["Collapsed", "Flooded", "Dusty", "Scorched", "Silent", "Crumbling",
+                   "Overgrown", "Flickering", "Sealed", "Rusted", "Frozen", "Echoing"]
+ROOM_NOUNS = ["Chamber", "Cellar", "Gallery", "Vault", "Barracks", "Workshop",
+              "Shrine", "Corridor", "Armory", "Cistern", "Reactor Hall", "Archive"]
+ROOM_DESCRIPTIONS = [
+    "Dusty stonework with signs of age.",
+    "A watchful silence lingers here.",
+    "The ceiling has partially caved in.",
+    "Water drips steadily from cracked pipes.",
+    "Scorch marks streak the walls.",
+    "Old machinery hums faintly in the dark.",
+]
+# (display name, feature or None)
+ZONE_FEATURES = [
+    ("Crate Stack", "crates"), ("Broken Weapon Rack", "broken weapon rack"),
+    ("Rubble", "rubble"), ("Broken Pillar", None), ("Shadowy Corner", None),
+    ("South Alcove", None), ("Collapsed Shelving", "shelving"),
+    ("Rusted Console", "console"), ("Stagnant Pool", "pool"),
+]
+HIDDEN_ITEMS = ["old key", "medkit", "ration", "battery", "bandage"]
+HIDDEN_ITEM_CHANCE = 0.15
+# (archetype kind, weight); weaker enemies are more common
+ENEMY_TABLE = [
+    ("goblin", 6), ("spider", 5), ("burned_thrall", 4), ("chitin_bug", 3),
+    ("psylink_aberrant", 2), ("scyther", 1), ("ancient_mech_core", 0.5),
+]
+ENEMY_COUNT_WEIGHTS = [5, 4, 2]  # rooms with 0, 1 or 2 enemies
+
+_MASK = (1 << 64) - 1
+_NAME, _EDGE, _ROOM = 1, 2, 3  # hash salts
+
+
+def _mix(*values: int) -> int:
+    """splitmix64-style hash of non-negative ints; cheap, stateless and stable."""
+    h = 0x9E3779B97F4A7C15
+    for v in values:
+        h = ((h ^ v) + 0x9E3779B97F4A7C15) & _MASK
+        h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+        h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK
+        h ^= h >> 31
+    return h
+
+
+def seed_int(seed: Seed) -> int:
+    if isinstance(seed, int):
+        return seed & _MASK
+    return int.from_bytes(hashlib.blake2b(str(seed).encode(), digest_size=8).digest(), "big")
+
+
+def room_id(index: int) -> str:
+    return f"room_{index}"
+
+
+def room_index(room_key: str) -> int:
+    return int(room_key.rsplit("_", 1)[1])
+
+
+def room_name(seed: int, index: int) -> str:
+    h = _mix(seed, _NAME, index)
+    return f"{ROOM_ADJECTIVES[h % len(ROOM_ADJECTIVES)]} {ROOM_NOUNS[(h >> 16) % len(ROOM_NOUNS)]}"
+
+
+def grid_width(room_count: int) -> int:
+    return math.isqrt(room_count - 1) + 1 if room_count > 1 else 1
+
+
+def room_distance(a: int, b: int, room_count: int) -> int:
+    """Grid (Manhattan) distance between two rooms: a lower bound on the exits between them."""
+    width = grid_width(room_count)
+    return abs(a % width - b % width) + abs(a // width - b // width)
+
+
+def room_neighbors(seed: int, index: int, room_count: int) -> List[Tuple[str, int]]:
+    """
+    (direction, room index) of every exit. Rooms sit on a square grid; each
+    row is a west-east corridor, rows are joined along the west edge, and other
+    north-south links appear with EXTRA_LINK_CHANCE, so the map is connected.
+    """
+    width = grid_width(room_count)
+    x, y = index % width, index // width
+
+    def linked(a: int, b: int) -> bool:  # north-south link between a and the room below it
+        return a % width == 0 or _mix(seed, _EDGE, a, b) < EXTRA_LINK_CHANCE * 2**64
+
+    neighbors = []
+    if y > 0 and linked(index - width, index):
+        neighbors.append(("north", index - width))
+    if index + width < room_count and linked(index, index + width):
+        neighbors.append(("south", index + width))
+    if x + 1 < width and index + 1 < room_count:
+        neighbors.append(("east", index + 1))
+    if x > 0:
+        neighbors.append(("west", index - 1))
+    return neighbors
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(" ", "_")
+
+
+def _exits(seed: int, index: int, room_count: int) -> List[Tuple[str, int, str]]:
+    """(exit name, room index, room name) of every exit, in exit order."""
+    # Exits are named after the room they lead to, like the test map's doorways
+    neighbors = [(direction, j, room_name(seed, j)) for direction, j in room_neighbors(seed, index, room_count)]
+    slugs = [_slug(target) for _, _, target in neighbors]
+    return [(f"{slug}_doorway" if slugs.count(slug) == 1 else f"{direction}_{slug}_doorway", j, target)
+            for (direction, j, target), slug in zip(neighbors, slugs)]
+
+
+def room_exits(seed: Seed, index: int, room_count: int) -> Dict[str, str]:
+    """A room's exits (as in generate_room) without building the room."""
+    return {exit_name: room_id(j) for exit_name, j, _ in _exits(seed_int(seed), index, room_count)}
+
+
+def generate_room(seed: Seed, index: int, room_count: int, pool: Optional["EnemyPool"] = None) -> MapRoom:
+    """
+    Build one procedural room.
+
+    Args:
+        seed (Seed): Dungeon seed.
+        index (int): Room index, 0 .. room_count - 1.
+        room_count (int): Total rooms in the dungeon (fixes the grid layout).
+        pool (Optional[EnemyPool]): Recycle enemies from this pool; the room is the same either way.
+
+    Returns:
+        MapRoom: The room, with zones, adjacency, exits and enemies.
+    """
+    seed = seed_int(seed)
+    rng = random.Random(_mix(seed, _ROOM, index))
+    name = room_name(seed, index)
+
+    exits = {}
+    zones = {}
+    for exit_name, j, target in _exits(seed, index, room_count):
+        exits[exit_name] = room_id(j)
+        key = f"zone{len(zones) + 1}"
+        zones[key] = Zone(internal_name=key, display_name=f"{target} Doorway")
+
+    for display_name, feature in rng.sample(ZONE_FEATURES, rng.randint(1, 3)):
+        key = f"zone{len(zones) + 1}"
+        hidden = [rng.choice(HIDDEN_ITEMS)] if rng.random() < HIDDEN_ITEM_CHANCE else []
+        zones[key] = Zone(internal_name=key, display_name=display_name,
+                          features=[feature] if feature else [], hidden_items=hidden)
+
+    center = f"zone{len(zones) + 1}"
+    zones[center] = Zone(internal_name=center, display_name="Center")
+    adjacency = {key: [center] for key in zones if key != center}
+    adjacency[center] = [key for key in zones if key != center]
+
+    room = MapRoom(id=room_id(index), name=name, description="", exits=exits, zones=zones, zone_adjacency=adjacency)
+    kinds, weights = zip(*ENEMY_TABLE)
+    enemy_count = rng.choices(range(len(ENEMY_COUNT_WEIGHTS)), weights=ENEMY_COUNT_WEIGHTS)[0]
+    for kind in rng.choices(kinds, weights=weights, k=enemy_count):
+        spawn_enemies(room, kind, 1, rng=rng, pool=pool)  # one zone draw per enemy, as the layout expects
+    room.description = rng.choice(ROOM_DESCRIPTIONS)
+    return room
+
+
+def generate_chunk(seed: Seed, chunk: int, room_count: int, chunk_size: int = CHUNK_SIZE) -> Dict[str, MapRoom]:
+    """Rooms chunk * chunk_size up to the next chunk (or the end of the map), by id."""
+    start = chunk * chunk_size
+    rooms = (generate_room(seed, i, room_count) for i in range(start, min(start + chunk_size, room_count)))
+    return {room.id: room for room in rooms}
+
+
+def iter_chunks(seed: Seed, room_count: int, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, MapRoom]]:
+    """Generate a dungeon chunk by chunk, so only one chunk needs to be in memory."""
+    for chunk in range(-(-room_count // chunk_size)):
+        yield generate_chunk(seed, chunk, room_count, chunk_size)
+
+
+def generate_map(seed: Seed, room_count: int = 100) -> Tuple[Dict[str, MapRoom], str]:
+    """
+    Generate a whole procedural dungeon.
+
+    Returns:
+        tuple: (rooms by id, starting room id), like generate_test_map().
+    """
+    rooms = {}
+    for chunk in iter_chunks(seed, room_count):
+        rooms.update(chunk)
+    return rooms, room_id(0)
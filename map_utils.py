@@ -3,10 +3,184 @@
 # Focused on raw zone and adjacency data retrieval, agnostic of perception.
 # All player-facing messaging should be handled in messaging.py.
 
-from typing import List, Optional
+import itertools
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional
 from maps import MapRoom, Zone
 from enemy import Enemy
 
+if TYPE_CHECKING:
+    from visibility import ZoneSight
+
+KEYWORD_CACHE_SIZE = 64  # keyword answers remembered per room and kind of term
+
+
+class RoomIndex:
+    """
+    Derived lookups of one room, kept current as it changes: the set of
+    living enemies, and a keyword index in which each distinct (lowercased)
+    feature, living enemy name and zone display name maps to the zones
+    holding it. A keyword lookup scans only the distinct terms, not every
+    zone/feature/enemy, and its answer is kept in a small LRU (keywords are
+    raw player input) until the room changes.
+    It also holds each zone's visibility.ZoneSight, and notes the zones whose
+    sight changed for visibility.VisibilityState to pick up. Enemies report
+    deaths, zone moves and stealth/size changes through their property
+    setters, so nothing is rebuilt per query; other edits (features, zone
+    lists) call invalidate_index().
+    """
+
+    def __init__(self, room: MapRoom):
+        self.zone_order = {key: i for i, key in enumerate(room.zones)}
+        self.features: Dict[str, List[str]] = {}
+        self.enemies: Dict[str, Dict[str, int]] = {}  # name -> {zone: living count}
+        self.names: Dict[str, List[str]] = {}
+        self._enemy_zone: Dict[int, str] = {}  # id(enemy) -> zone it is indexed under
+        self._rank: Dict[int, tuple] = {}  # id(enemy) -> (zone position, arrival): visible_enemies order
+        self._arrivals = itertools.count()
+        self._living: Dict[int, Enemy] = {}
+        self._living_list: Optional[List[Enemy]] = []
+        self.sight: Dict[str, "ZoneSight"] = {}  # zone -> visibility.ZoneSight, built on demand
+        self.changed_zones: set = set()  # zones whose sight changed, drained by VisibilityState
+        self._feature_hits: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._enemy_hits: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._name_hits: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        for key, zone in room.zones.items():
+            self.names.setdefault(zone.display_name.lower(), []).append(key)
+            for feature in zone.features:
+                zones = self.features.setdefault(feature.lower(), [])
+                if key not in zones:
+                    zones.append(key)
+            for enemy in zone.enemies:
+                self.add_enemy(enemy, key)
+
+    def _first_zone(self, terms, keyword: str) -> Optional[str]:
+        best = None
+        for term, zones in terms.items():
+            if keyword in term:
+                for key in zones:
+                    if best is None or self.zone_order[key] < self.zone_order[best]:
+                        best = key
+        return best
+
+    def _lookup(self, hits: "OrderedDict[str, Optional[str]]", terms, keyword: str) -> Optional[str]:
+        keyword = keyword.lower()
+        if keyword in hits:
+            hits.move_to_end(keyword)
+            return hits[keyword]
+        key = hits[keyword] = self._first_zone(terms, keyword)
+        while len(hits) > KEYWORD_CACHE_SIZE:
+            hits.popitem(last=False)
+        return key
+
+    def zone_for_feature(self, keyword: str) -> Optional[str]:
+        return self._lookup(self._feature_hits, self.features, keyword)
+
+    def zone_for_enemy(self, keyword: str) -> Optional[str]:
+        return self._lookup(self._enemy_hits, self.enemies, keyword)
+
+    def zone_for_name(self, keyword: str) -> Optional[str]:
+        return self._lookup(self._name_hits, self.names, keyword)
+
+    def living(self) -> List[Enemy]:
+        """
+        Living enemies in zone order, then the order they joined their zone.
+        The list is rebuilt only after a death, revival or arrival, and is
+        shared between calls: callers must not modify it.
+        """
+        if self._living_list is None:
+            rank = self._rank
+            self._living_list = sorted(self._living.values(), key=lambda enemy: rank[id(enemy)])
+        return self._living_list
+
+    # Incremental updates
+
+    def add_enemy(self, enemy: Enemy, zone_key: str):
+        enemy._index = self
+        self._enemy_zone[id(enemy)] = zone_key
+        self._rank[id(enemy)] = (self.zone_order[zone_key], next(self._arrivals))
+        if enemy.is_alive():
+            self._set_living(enemy, True)
+            self._count(enemy.name, zone_key, 1)
+            self._sight_changed(zone_key)
+
+    def enemy_alive_changed(self, enemy: Enemy, alive: bool):
+        zone_key = self._enemy_zone.get(id(enemy))
+        if zone_key is not None:
+            self._set_living(enemy, alive)
+            self._count(enemy.name, zone_key, 1 if alive else -1)
+            self._sight_changed(zone_key)
+
+    def enemy_changed(self, enemy: Enemy):
+        """An enemy's stealth or size changed."""
+        zone_key = self._enemy_zone.get(id(enemy))
+        if zone_key is not None:
+            self._sight_changed(zone_key)
+
+    def remove_enemy(self, enemy: Enemy):
+        """Forget an enemy that left the room (see enemy_utils.reap_dead)."""
+        zone_key = self._enemy_zone.pop(id(enemy), None)
+        if zone_key is None:
+            return
+        del self._rank[id(enemy)]
+        enemy._index = None
+        if id(enemy) in self._living:
+            self._set_living(enemy, False)
+            self._count(enemy.name, zone_key, -1)
+        self._sight_changed(zone_key)
+
+    def _set_living(self, enemy: Enemy, alive: bool):
+        if alive:
+            self._living[id(enemy)] = enemy
+        else:
+            self._living.pop(id(enemy), None)
+        self._living_list = None
+
+    def _sight_changed(self, zone_key: str):
+        self.sight.pop(zone_key, None)
+        self.changed_zones.add(zone_key)
+
+    def enemy_moved(self, enemy: Enemy, zone_key: str):
+        old = self._enemy_zone.get(id(enemy))
+        if old is None or old == zone_key:
+            return
+        self._enemy_zone[id(enemy)] = zone_key
+        self._rank[id(enemy)] = (self.zone_order[zone_key], next(self._arrivals))
+        self._sight_changed(old)
+        self._sight_changed(zone_key)
+        if enemy.is_alive():
+            self._living_list = None
+            self._count(enemy.name, old, -1)
+            self._count(enemy.name, zone_key, 1)
+
+    def _count(self, name: str, zone_key: str, delta: int):
+        zones = self.enemies.setdefault(name.lower(), {})
+        count = zones.get(zone_key, 0) + delta
+        if count > 0:
+            zones[zone_key] = count
+        else:
+            zones.pop(zone_key, None)
+            if not zones:
+                del self.enemies[name.lower()]
+        self._enemy_hits.clear()
+
+
+def room_index(room: MapRoom) -> RoomIndex:
+    """The room's index (living enemies, keywords), built on first use."""
+    if room.index is None:
+        room.index = RoomIndex(room)
+    return room.index
+
+
+def invalidate_index(room: MapRoom):
+    """Drop the room's index and zone routes after edits they cannot track (features, zones, adjacency)."""
+    if room.index is not None:
+        for zone in room.zones.values():
+            for enemy in zone.enemies:
+                enemy._index = None
+        room.index = None
+    room.zone_routes = None
+
 def get_adjacent_zone_names(room: MapRoom, zone_name: str) -> List[str]:
     """
     Retrieve the internal names of zones adjacent to the specified zone within the room.
@@ -45,15 +219,12 @@ def find_zone_by_feature(room: MapRoom, feature_keyword: str) -> Optional[Zone]:
     Returns:
         Optional[Zone]: The first matching Zone or None if no match found.
     """
-    keyword = feature_keyword.lower()
-    for zone in room.zones.values():
-        if any(keyword in feat.lower() for feat in zone.features):
-            return zone
-    return None
+    key = room_index(room).zone_for_feature(feature_keyword)
+    return room.zones[key] if key is not None else None
 
 def find_zone_by_enemy_name(room: MapRoom, enemy_keyword: str) -> Optional[Zone]:
     """
-    Search all zones in the room to find the first containing an enemy whose name matches the keyword.
+    Find the first zone in the room holding a living enemy whose name matches the keyword.
 
     Args:
         room (MapRoom): The current room object.
@@ -62,18 +233,107 @@ def find_zone_by_enemy_name(room: MapRoom, enemy_keyword: str) -> Optional[Zone]
     Returns:
         Optional[Zone]: The first matching Zone or None if no match found.
     """
-    keyword = enemy_keyword.lower()
-    for zone in room.zones.values():
-        for enemy in zone.enemies:
-            if keyword in enemy.name.lower():
-                return zone
+    key = room_index(room).zone_for_enemy(enemy_keyword)
+    return room.zones[key] if key is not None else None
+
+def zone_path(room: MapRoom, start: str, goal: str) -> Optional[List[str]]:
+    """
+    Shortest walk between two zones of a room over zone_adjacency. The BFS
+    tree from each start zone is cached on the room (see invalidate_index).
+
+    Args:
+        room (MapRoom): The room to route through.
+        start (str): Internal name of the zone to start from. If it is not a zone
+            of the room (the player's position is unknown), the walk is just [goal].
+        goal (str): Internal name of the zone to reach.
+
+    Returns:
+        Optional[List[str]]: Zones entered on the way, ending with goal (empty if
+            start is goal), or None if goal cannot be reached.
+    """
+    if start == goal:
+        return []
+    if start not in room.zones:
+        return [goal] if goal in room.zones else None
+    parents = zone_tree(room, start)
+    if goal not in parents:
+        return None
+    path = []
+    while goal != start:
+        path.append(goal)
+        goal = parents[goal]
+    path.reverse()
+    return path
+
+def zone_tree(room: MapRoom, start: str) -> Dict[str, Optional[str]]:
+    """
+    BFS tree of the zones reachable from start: zone -> the zone it is reached
+    from (None for start), in BFS order. Cached on the room per start zone.
+    """
+    if room.zone_routes is None:
+        room.zone_routes = {}
+    parents = room.zone_routes.get(start)
+    if parents is None:
+        parents = {start: None}
+        frontier = [start]
+        for zone_name in frontier:
+            for neighbor in get_adjacent_zone_names(room, zone_name):
+                if neighbor not in parents:
+                    parents[neighbor] = zone_name
+                    frontier.append(neighbor)
+        room.zone_routes[start] = parents
+    return parents
+
+def zone_distances(room: MapRoom, start: str) -> Dict[str, int]:
+    """Steps from start to every zone reachable from it, nearest first."""
+    distances: Dict[str, int] = {}
+    for zone_name, parent in zone_tree(room, start).items():
+        distances[zone_name] = 0 if parent is None else distances[parent] + 1
+    return distances
+
+def doorway_zone(room: MapRoom, exit_name: str) -> Optional[str]:
+    """
+    The zone an exit leaves from: the doorway zone whose display name matches
+    the exit ("Guardpost Doorway" for "guardpost_doorway"). Exits whose names
+    carry a direction prefix because of a name clash pair up with same-named
+    doorways in order.
+    """
+    def leads(name: str, slug: str) -> bool:
+        return name == slug or name.endswith("_" + slug)
+
+    for key, zone in room.zones.items():
+        slug = zone.display_name.lower().replace(" ", "_")
+        if leads(exit_name, slug):
+            zones = [k for k, z in room.zones.items() if z.display_name.lower().replace(" ", "_") == slug]
+            exits = [name for name in room.exits if leads(name, slug)]
+            rank = exits.index(exit_name) if exit_name in exits else 0
+            return zones[min(rank, len(zones) - 1)]
     return None
 
+def start_zone(room: MapRoom) -> Optional[str]:
+    """Zone a player starts in when not coming through a doorway: the room's Center, else its first zone."""
+    for key, zone in room.zones.items():
+        if zone.display_name == "Center":
+            return key
+    return next(iter(room.zones), None)
+
+def arrival_zone(room: MapRoom, from_key: str) -> Optional[str]:
+    """
+    Zone a player arriving from room from_key stands in: the doorway of the
+    exit leading back there, or start_zone() if no doorway zone matches it.
+    """
+    for exit_name, target in room.exits.items():
+        if target == from_key:
+            zone = doorway_zone(room, exit_name)
+            if zone is not None:
+                return zone
+    return start_zone(room)
+
 def visible_enemies(room: MapRoom) -> List[Enemy]:
     """
-    Return all living enemies in all zones of the room.
+    Return all living enemies in all zones of the room (see MapRoom.visible_enemies).
     """
-    return [enemy for zone in room.zones.values() for enemy in zone.enemies if enemy.is_alive()]
+    return room.visible_enemies()
 
 def describe_room(room: MapRoom) -> str:
     """
@@ -2,10 +2,14 @@
 # NOTE: This module defines MapRoom and Zone, replacing the legacy Room class used in engine.py and map_generator.py
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from enemy import Enemy
 
+if TYPE_CHECKING:
+    from actor_store import ActorStore
+    from map_utils import RoomIndex
+
 @dataclass
 class Zone:
     internal_name: str
@@ -23,9 +27,40 @@ class MapRoom:
     exits: Dict[str, str]  # e.g. {'n': 'guard_post'}
     zones: Dict[str, Zone]  # e.g. {'center': Zone(...), 'west': Zone(...) }
     zone_adjacency: Dict[str, List[str]] = field(default_factory=dict)  # Add this line
-    
+    last_turn: int = 0  # game turn this room's enemies were last simulated up to
+    actors: Optional["ActorStore"] = field(default=None, init=False, repr=False, compare=False)  # set by ActorStore.add_room
+    index: Optional["RoomIndex"] = field(default=None, init=False, repr=False, compare=False)  # see map_utils.room_index
+    zone_routes: Optional[Dict[str, Dict[str, Optional[str]]]] = field(default=None, init=False, repr=False, compare=False)  # see map_utils.zone_path
+
     def visible_enemies(self) -> List[Enemy]:
-        return [enemy for zone in self.zones.values() for enemy in zone.enemies if enemy.is_alive()]
+        """Living enemies of the room, from its incrementally kept live set (read-only list)."""
+        index = self.index
+        if index is None:
+            from map_utils import room_index
+            index = room_index(self)
+        return index.living()
+
+    def add_enemy(self, enemy: Enemy, zone_name: str):
+        """Place an enemy in a zone (and in the room's actor store, if it has one)."""
+        # An enemy coming from another room is first dropped from that room's index and store
+        if enemy._index is not None and enemy._index is not self.index:
+            enemy._index.remove_enemy(enemy)
+        if enemy._store is not None:
+            enemy._store.remove(enemy)
+        enemy.current_zone = zone_name
+        self.zones[zone_name].enemies.append(enemy)
+        if self.actors is not None:
+            self.actors.add(enemy, zone_name)
+        if self.index is not None:
+            self.index.add_enemy(enemy, zone_name)
+
+    def move_enemy(self, enemy: Enemy, zone_name: str):
+        """Move an enemy of this room to another of its zones."""
+        if zone_name == enemy.current_zone:
+            return
+        self.zones[enemy.current_zone].enemies.remove(enemy)
+        self.zones[zone_name].enemies.append(enemy)
+        enemy.current_zone = zone_name
 
     def exit_list(self) -> str:
         return ", ".join(self.exits.keys())
@@ -36,4 +71,3 @@ class MapRoom:
 # TODO: 1. Add example procedural room templates for prototyping
 # TODO: 2. Add perception-based visibility toggles and mechanics
 # TODO: 4. Route all map and room descriptions through messaging.py
-# TODO: 3. Implement generate_map() that produces MapRoom instances
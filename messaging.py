@@ -1,88 +1,208 @@
 # messaging.py
-import random
+from combat_utils import classify_roll
+from events import (
+    AttackEvent,
+    StatusEvent,
+    ExpireEvent,
+    DeathEvent,
+    MoveEvent,
+    ArrivalEvent,
+    RoomEvent,
+    NoticeEvent,
+)
 
 def display_name(entity, capitalize=False):
     if hasattr(entity, "is_player") and entity.is_player:
         return "You" if capitalize else "you"
     return entity.name
 
-def format_attack_result(event):
-    attacker = event["attacker"]
-    target = event["target"]
+def format_attack_result(event: AttackEvent):
+    attacker = event.attacker
+    target = event.target
     atk_you = getattr(attacker, "is_player", False)
-    tgt_you = getattr(target, "is_player", False)
     lines = []
 
     attacker_name = display_name(attacker, capitalize=True)
     target_name = display_name(target)
 
-    attack_name = event.get("attack_name")
+    attack_name = event.attack_name
     if attack_name:
         lines.append(f"{attacker_name} uses {attack_name}!")
 
     verb_hit = "hit" if atk_you else "hits"
     verb_miss = "miss" if atk_you else "misses"
 
-    if event["hit_type"] == "miss":
+    if event.hit_type == "miss":
         lines.append(f"{attacker_name} {verb_miss} completely.")
-    elif event["hit_type"] == "critfail":
+    elif event.hit_type == "critfail":
         lines.append(f"{attacker_name} {verb_miss} and lose balance!")
     else:
-        dmg_line = f"{attacker_name} {verb_hit} {target_name} for {event['damage']} damage!"
+        dmg_line = f"{attacker_name} {verb_hit} {target_name} for {event.damage} damage!"
         lines.append(dmg_line)
 
-        if event.get("defeated"):
-            if tgt_you:
-                lines.append("You are defeated!")
-            else:
-                lines.append(random.choice([
-                    f"{target.name} is defeated!",
-                    f"You bring {target.name} down!",
-                    f"You land the killing blow on {target.name}!"
-                ]))
-
     # Status effects
-    for effect in event.get("status_events", []):
+    for effect in event.status_events:
         lines.extend(format_status_effect(effect))
 
     return lines
 
+def format_attack(event: AttackEvent):
+    roll_msg = format_roll(event.d1, event.d2, event.roll, event.roll_mod, event.total)
+    return [roll_msg] + format_attack_result(event)
+
 def format_status_effect(effect):
-    target = effect["target"]
+    target = effect.target
     tgt_you = getattr(target, "is_player", False)
     lines = []
 
-    if effect["type"] == "poison":
+    if isinstance(effect, ExpireEvent):
         if tgt_you:
-            lines.append(f"You suffer {effect['amount']} poison damage.")
+            lines.append(f"Your {effect.effect} has worn off.")
         else:
-            lines.append(f"{target.name} suffers {effect['amount']} poison damage.")
-    elif effect["type"] == "expire":
+            lines.append(f"{effect.effect.capitalize()} has worn off from {target.name}.")
+    elif effect.effect == "poison":
         if tgt_you:
-            lines.append(f"Your {effect['effect']} has worn off.")
+            lines.append(f"You suffer {effect.amount} poison damage.")
         else:
-            lines.append(f"{effect['effect'].capitalize()} has worn off from {target.name}.")
-    elif effect["type"] == "regen":
+            lines.append(f"{target.name} suffers {effect.amount} poison damage.")
+    elif effect.effect == "regen":
         if tgt_you:
-            lines.append(f"You regain {effect['amount']} health.")
+            lines.append(f"You regain {effect.amount} health.")
         else:
-            lines.append(f"{target.name} regenerates {effect['amount']} health.")
+            lines.append(f"{target.name} regenerates {effect.amount} health.")
+
+    return lines
+
+def format_death(event: DeathEvent):
+    target = event.target
+    if getattr(target, "is_player", False):
+        return ["💀 You have been slain!"]
+    # Vary the line by turn so a replayed game renders identically
+    variants = [
+        f"{target.name} is defeated!",
+        f"You bring {target.name} down!",
+        f"You land the killing blow on {target.name}!"
+    ]
+    return [variants[event.turn % len(variants)]]
+
+def format_move(event: MoveEvent):
+    direction = event.direction.upper()
+    if event.changed:
+        return [f"🔄 You change direction and start moving {direction}."]
+    if event.progress <= 1:
+        return [f"🚶 You start moving {direction}..."]
+    return [f"🚶 You continue moving {direction}... ({event.progress}/3)"]
+
+def format_arrival(event: ArrivalEvent):
+    return [f"➡️ You arrive at the {event.room.name}."]
+
+def format_room(event: RoomEvent):
+    room = event.room
+    lines = [
+        f"📍 {room.name}",
+        room.description,
+        f"Exits: {room.exit_list()}",
+    ]
+    if event.enemies:
+        lines.append("Enemies here: " + ", ".join(e.name for e in event.enemies))
+    return lines
+
+NOTICES = {
+    "no_escape": "You have nowhere to run!",
+    "flee": "🏃 You flee back to the previous room.",
+    "search": "🔍 You carefully examine your surroundings. Perception increased temporarily.",
+    "nothing_to_fight": "There is nothing to fight.",
+    "health": "💖 Your health: {health}",
+    "quiet": "🧘 The room is quiet...",
+    "unknown_command": "Unknown command.",
+    "text": "{text}",
+}
+
+def format_notice(event: NoticeEvent):
+    return [NOTICES[event.kind].format(**event.data)]
+
+# Text renderer per event type. Other front ends can pass their own table.
+TEXT_RENDERERS = {
+    AttackEvent: format_attack,
+    StatusEvent: format_status_effect,
+    ExpireEvent: format_status_effect,
+    DeathEvent: format_death,
+    MoveEvent: format_move,
+    ArrivalEvent: format_arrival,
+    RoomEvent: format_room,
+    NoticeEvent: format_notice,
+}
+
+def entity_ref(entity) -> str:
+    return "player" if getattr(entity, "is_player", False) else entity.name
+
+def status_to_dict(event):
+    if isinstance(event, ExpireEvent):
+        return [{"type": "expire", "effect": event.effect, "target": entity_ref(event.target)}]
+    return [{
+        "type": "status",
+        "effect": event.effect,
+        "target": entity_ref(event.target),
+        "amount": event.amount,
+        "count": event.count,
+    }]
+
+def attack_to_dict(event: AttackEvent):
+    return [{
+        "type": "attack",
+        "attacker": entity_ref(event.attacker),
+        "target": entity_ref(event.target),
+        "roll": [event.d1, event.d2],
+        "roll_mod": event.roll_mod,
+        "total": event.total,
+        "hit_type": event.hit_type,
+        "damage": event.damage,
+        "attack_name": event.attack_name,
+        "status": [d for effect in event.status_events for d in status_to_dict(effect)],
+    }]
 
+# JSON-ready renderer: one dict per event, for API clients
+JSON_RENDERERS = {
+    AttackEvent: attack_to_dict,
+    StatusEvent: status_to_dict,
+    ExpireEvent: status_to_dict,
+    DeathEvent: lambda e: [{"type": "death", "target": entity_ref(e.target)}],
+    MoveEvent: lambda e: [{"type": "move", "direction": e.direction, "progress": e.progress, "changed": e.changed}],
+    ArrivalEvent: lambda e: [{"type": "arrival", "room": e.room.id}],
+    RoomEvent: lambda e: [{"type": "room", "room": e.room.id, "enemies": [x.name for x in e.enemies]}],
+    NoticeEvent: lambda e: [{"type": "notice", "kind": e.kind, **e.data}],
+}
+
+def render_events(events, renderers=TEXT_RENDERERS) -> list:
+    """
+    Turn engine events into display lines. Nothing is formatted until this
+    is called, so callers that never display output pay nothing for it.
+
+    Args:
+        events (list): Event records returned by Game actions.
+        renderers (dict): Maps event type to a function returning lines.
+
+    Returns:
+        list: Rendered items in event order (lines for TEXT_RENDERERS,
+        dicts for JSON_RENDERERS).
+    """
+    lines = []
+    for event in events:
+        lines.extend(renderers[type(event)](event))
     return lines
 
 def describe_roll(roll: int) -> dict:
-    if roll <= 2:
-        return {"type": "critfail", "text": "💀 Critical Failure! You stumble badly."}
-    elif roll <= 5:
-        return {"type": "miss", "text": "❌ The attack misses completely."}
-    elif roll <= 7:
-        return {"type": "glancing", "text": "⚠️ Glancing Blow. You barely connect."}
-    elif roll <= 9:
-        return {"type": "hit", "text": "✅ A clean hit!"}
-    elif roll <= 13:
-        return {"type": "hit", "text": "✅ Hit!"}
+    kind = classify_roll(roll)
+    if kind == "critfail":
+        return {"type": kind, "text": "💀 Critical Failure! You stumble badly."}
+    elif kind == "miss":
+        return {"type": kind, "text": "❌ The attack misses completely."}
+    elif kind == "glancing":
+        return {"type": kind, "text": "⚠️ Glancing Blow. You barely connect."}
+    elif kind == "hit":
+        return {"type": kind, "text": "✅ A clean hit!" if roll <= 9 else "✅ Hit!"}
     else:
-        return {"type": "crit", "text": "💥 Critical Hit! Devastating strike!"}
+        return {"type": kind, "text": "💥 Critical Hit! Devastating strike!"}
 
 def format_roll(d1: int, d2: int, base: int, mod: int, total: int) -> str:
     symbols = "⚀⚁⚂⚃⚄⚅"
@@ -92,6 +212,23 @@ def format_roll(d1: int, d2: int, base: int, mod: int, total: int) -> str:
 def msg_game_over() -> str:
     return "💀 You have died."
 
+def msg_route_unknown(keyword: str) -> str:
+    return f"You don't know the way to '{keyword}'."
+
+def msg_route_blocked(keyword: str) -> str:
+    return f"There is no way to reach '{keyword}' from here."
+
+def msg_route_here(zone_name: str) -> str:
+    return f"You are already at the {zone_name}."
+
+def msg_route_zones(zone_names: list[str]) -> str:
+    via = f" past the {', '.join(zone_names[:-1])}" if len(zone_names) > 1 else ""
+    return f"🚶 You make your way{via} to the {zone_names[-1]}."
+
+def msg_route_rooms(room_name: str, rooms_away: int, exit_name: str) -> str:
+    rooms = "room" if rooms_away == 1 else "rooms"
+    return f"🧭 {room_name} is {rooms_away} {rooms} away. You head for the {exit_name.replace('_', ' ')}."
+
 def format_zone_description(data: dict) -> list[str]:
     """
     Format structured zone data into player-facing messages.
@@ -101,12 +238,14 @@ def format_zone_description(data: dict) -> list[str]:
             - 'zone_name' (str): Descriptive name of the zone.
             - 'features' (list[str]): Visible features in the zone.
             - 'enemies' (list[dict]): List of enemies with at least 'name' and 'status'.
+            - 'in_sight' (list[dict], optional): Other zones in view, each with
+              'zone_name' and 'enemies' (see visibility.describe_view).
 
     Returns:
         list[str]: Formatted message lines for display.
     """
     lines = [f"You move to the {data.get('zone_name', 'unknown area')}."]
-    
+
     features = data.get('features', [])
     if features:
         lines.append("You notice " + ", ".join(features) + ".")
@@ -119,4 +258,8 @@ def format_zone_description(data: dict) -> list[str]:
     else:
         lines.append("The area seems clear.")
 
-    return lines
\ No newline at end of file
+    for zone in data.get('in_sight', []):
+        enemy_names = ", ".join(e['name'] for e in zone['enemies'])
+        lines.append(f"Over by the {zone['zone_name']} you see {enemy_names}.")
+
+    return lines
@@ -1,4 +1,238 @@
 # movement.py
-def move_player_to_keyword(game, keyword):
-    # Temporary stub: always fail gracefully
-    return False, [f"Movement system not yet implemented; cannot move to '{keyword}'."]
\ No newline at end of file
+# NOTE: Keyword movement ("go rubble"). A keyword names a feature, an enemy the
+# player sees or a zone of some room, or a room itself; the nearest match wins, searching the
+# current room first and then outward through the exits. Routes are planned on
+# two levels: zones within a room (map_utils.zone_path, cached per room) and
+# rooms across the map (A* over exits, cached per game). Procedural maps give
+# the planner their grid distance and their exits straight from the seed, so
+# planning never has to page rooms in.
+
+import heapq
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from enemy import Enemy
+from maps import MapRoom
+from map_utils import doorway_zone, room_index, zone_path
+from messaging import (msg_route_unknown, msg_route_blocked, msg_route_here,
+                       msg_route_zones, msg_route_rooms)
+from visibility import update_visibility_state
+
+MAX_SEARCH_ROOMS = 64     # rooms looked at (nearest first) when resolving a keyword
+ROUTE_CACHE_SIZE = 1024   # room-to-room paths (and keyword targets) remembered per game
+
+
+class RoutePlanner:
+    """
+    Room-level routes of one map. Exits never change during a game, so a
+    shortest path stays valid until invalidate() is called (or the game gets a
+    new rooms table, which makes route_planner() build a new planner); every
+    suffix of a path found is cached too, since it is the shortest path from
+    that room on. Rooms tables may offer exits_of(key), neighbors_of(key),
+    distance(a, b) and peek(key) (see room_pager.PagedRooms) to plan without
+    loading rooms. Rooms other than the player's are only read: a room with no
+    index of its own (e.g. a shared prototype room of a RoomTable) is
+    scanned, never given one.
+    """
+
+    def __init__(self, rooms):
+        self.rooms = rooms
+        self._exits_of = getattr(rooms, "exits_of", None)
+        self._neighbors_of = getattr(rooms, "neighbors_of", None)
+        self._distance = getattr(rooms, "distance", None)
+        self._peek = getattr(rooms, "peek", None)
+        self._paths: "OrderedDict[Tuple[str, str], Optional[List[str]]]" = OrderedDict()
+        self._targets: "OrderedDict[Tuple[str, str], str]" = OrderedDict()  # (start room, keyword) -> room it was found in
+
+    def invalidate(self):
+        self._paths.clear()
+        self._targets.clear()
+
+    def exits(self, key: str) -> Dict[str, str]:
+        return self._exits_of(key) if self._exits_of is not None else self.rooms[key].exits
+
+    def neighbors(self, key: str):
+        return self._neighbors_of(key) if self._neighbors_of is not None else self.exits(key).values()
+
+    def peek(self, key: str) -> MapRoom:
+        return self._peek(key) if self._peek is not None else self.rooms[key]
+
+    def room_path(self, start: str, goal: str) -> Optional[List[str]]:
+        """Exit names to take from start to reach goal, or None if it is unreachable."""
+        key = (start, goal)
+        if key in self._paths:
+            self._paths.move_to_end(key)
+            return self._paths[key]
+        path = self._search(start, goal)
+        self._remember(start, goal, path)
+        if path:
+            room = start
+            for i, exit_name in enumerate(path[:-1]):
+                room = self.exits(room)[exit_name]
+                self._remember(room, goal, path[i + 1:])
+        return path
+
+    def _remember(self, start: str, goal: str, path: Optional[List[str]]):
+        self._paths[(start, goal)] = path
+        self._paths.move_to_end((start, goal))
+        while len(self._paths) > ROUTE_CACHE_SIZE:
+            self._paths.popitem(last=False)
+
+    def _remember_target(self, start: str, keyword: str, key: str):
+        self._targets[(start, keyword)] = key
+        self._targets.move_to_end((start, keyword))
+        while len(self._targets) > ROUTE_CACHE_SIZE:
+            self._targets.popitem(last=False)
+
+    def _search(self, start: str, goal: str) -> Optional[List[str]]:
+        if start == goal:
+            return []
+        distance = self._distance
+        estimate = (lambda key: distance(key, goal)) if distance is not None else (lambda key: 0)
+        cost = {start: 0}
+        came_from: Dict[str, str] = {}
+        frontier = [(estimate(start), 0, start)]  # (estimate, -steps, room): deeper first on ties
+        while frontier:
+            _, steps, key = heapq.heappop(frontier)
+            steps = -steps
+            if key == goal:
+                rooms = [key]
+                while key != start:
+                    key = came_from[key]
+                    rooms.append(key)
+                rooms.reverse()
+                return [_exit_to(self.exits(a), b) for a, b in zip(rooms, rooms[1:])]
+            if steps > cost[key]:
+                continue
+            for neighbor in self.neighbors(key):
+                if neighbor not in cost or steps + 1 < cost[neighbor]:
+                    cost[neighbor] = steps + 1
+                    came_from[neighbor] = key
+                    heapq.heappush(frontier, (steps + 1 + estimate(neighbor), -steps - 1, neighbor))
+        return None
+
+    def find(self, start: str, start_room: MapRoom, keyword: str,
+             seen: Sequence[Enemy] = ()) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        The nearest (room id, zone) matching keyword, searching breadth-first
+        from start. The zone is None when the keyword names a room. Enemies
+        only match if they are in `seen`, the ones the player currently sees
+        in start_room (see visibility.VisibilityState).
+        """
+        room_index(start_room)  # the player's room is the session's own: index it for next time
+        zone = _match(start_room, keyword, seen)
+        if zone is not None:
+            return start, zone
+        if keyword in self.rooms:
+            return keyword, None
+
+        # A room found before is re-checked first: the match may have died since
+        known = self._targets.get((start, keyword))
+        if known is not None:
+            zone = _match(self.peek(known), keyword)
+            if zone is not None:
+                self._targets.move_to_end((start, keyword))
+                return known, zone
+
+        seen = {start}
+        frontier = [start]
+        for key in frontier:
+            if key != start:
+                zone = _match(self.peek(key), keyword)
+                if zone is not None:
+                    self._remember_target(start, keyword, key)
+                    return key, zone
+            if len(seen) >= MAX_SEARCH_ROOMS:
+                continue
+            for neighbor in self.exits(key).values():
+                if neighbor not in seen and len(seen) < MAX_SEARCH_ROOMS:
+                    seen.add(neighbor)
+                    frontier.append(neighbor)
+        return None
+
+
+def _exit_to(exits: Dict[str, str], key: str) -> str:
+    return next(exit_name for exit_name, target in exits.items() if target == key)
+
+
+def _match(room: MapRoom, keyword: str, seen: Sequence[Enemy] = ()) -> Optional[str]:
+    """
+    Zone of room matching keyword by feature, enemy the player sees (from
+    `seen`, in zone order) or zone name; the room's first zone if it names
+    the room. Uses the room's index if it has one and scans the room
+    otherwise.
+    """
+    index = room.index
+    lowered = keyword.lower()
+    enemy_zone = next((enemy.current_zone for enemy in seen if lowered in enemy.name.lower()), None)
+    if index is not None:
+        zone = index.zone_for_feature(keyword) or enemy_zone or index.zone_for_name(keyword)
+    else:
+        zone = _scan(room, lowered) or enemy_zone or _scan_names(room, lowered)
+    if zone is None and lowered in room.name.lower():
+        zone = next(iter(room.zones), None)
+    return zone
+
+
+def _scan(room: MapRoom, keyword: str) -> Optional[str]:
+    """RoomIndex's feature answer for a room without an index, found without building one."""
+    return next((key for key, zone in room.zones.items() if any(keyword in f.lower() for f in zone.features)), None)
+
+
+def _scan_names(room: MapRoom, keyword: str) -> Optional[str]:
+    """RoomIndex's zone-name answer for a room without an index."""
+    return next((key for key, zone in room.zones.items() if keyword in zone.display_name.lower()), None)
+
+
+def route_planner(game) -> RoutePlanner:
+    """The game's route planner, rebuilt if the game's rooms table changed."""
+    if game.routes is None or game.routes.rooms is not game.rooms:
+        game.routes = RoutePlanner(game.rooms)
+    return game.routes
+
+
+def move_player_to_keyword(game, keyword) -> Tuple[bool, List[str], Optional[str]]:
+    """
+    Move the player toward whatever keyword names.
+
+    A target in the current room is reached by walking the zones (the caller
+    charges a turn for it); a target elsewhere puts the player at the doorway
+    of the first exit on the route, and the caller starts moving through it.
+    Enemies are only targets while the player sees them.
+
+    Args:
+        game (Game): The game whose player moves.
+        keyword (str): Feature, enemy, zone or room to go to.
+
+    Returns:
+        Tuple[bool, List[str], Optional[str]]: Whether a route was found, the
+            messages for the player, and the exit to take next (None when the
+            target is in the current room).
+    """
+    keyword = keyword.strip()
+    planner = route_planner(game)
+    room = game.room
+    seen = update_visibility_state(game).visible_enemies()
+    target = planner.find(game.current_key, room, keyword, seen) if keyword else None
+    if target is None:
+        return False, [msg_route_unknown(keyword)], None
+    room_key, zone = target
+
+    if room_key == game.current_key:
+        if zone is None:  # the keyword names the room the player is in
+            zone = game.player_zone
+        path = zone_path(room, game.player_zone, zone)
+        if path is None:
+            return False, [msg_route_blocked(keyword)], None
+        if not path:
+            return True, [msg_route_here(room.zones[zone].display_name)], None
+        game.player_zone = zone
+        return True, [msg_route_zones([room.zones[key].display_name for key in path])], None
+
+    exits = planner.room_path(game.current_key, room_key)
+    if exits is None:
+        return False, [msg_route_blocked(keyword)], None
+    doorway = doorway_zone(room, exits[0])
+    if doorway is not None:
+        game.player_zone = doorway
+    return True, [msg_route_rooms(planner.peek(room_key).name, len(exits), exits[0])], exits[0]
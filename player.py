@@ -1,7 +1,10 @@
 # player.py
 import math
+import random
 from collections import defaultdict
 
+from status_effects import StatusEffects
+
 class Player:
     def __init__(self, name):
         self.name = name
@@ -21,10 +24,11 @@ class Player:
         self.power = self.scaled_stat("STR", scale=1.5)
         self.skill = self.scaled_stat("DEX", scale=0.5)
         self.accuracy = self.scaled_stat("PER", scale=0.5)
+        self.speed = 10  # initiative: higher acts more often
 
         # Buffs, debuffs, and effects
         self.buffs = {}
-        self.status_effects = []
+        self.status_effects = StatusEffects()
 
         # Skills and XP tracking
         self.skills = defaultdict(int)
@@ -32,4 +36,8 @@ class Player:
 
     def scaled_stat(self, stat: str, scale: float = 1.0) -> int:
         val = self.stats.get(stat, 0)
-        return int(scale * (1 - math.exp(-val / 5)) * 10)
\ No newline at end of file
+        return int(scale * (1 - math.exp(-val / 5)) * 10)
+
+    def gain_xp_from_attack(self, success: bool, tags: list[str], rng=random):
+        from player_utils import gain_xp_from_attack
+        gain_xp_from_attack(self, success, tags, rng)
@@ -0,0 +1,48 @@
+# rng.py
+# NOTE: Per-game random streams. Every Game owns a GameRNG so runs can be
+# replayed from their seed and many games can run side by side without
+# sharing (or contending on) the global `random` state.
+
+import random
+from typing import List, Optional, Union
+
+Seed = Union[int, str]
+
+
+class GameRNG(random.Random):
+    """
+    random.Random that remembers its seed and can spawn independent child
+    streams. A child's seed is derived from the parent's seed and its spawn
+    index, so the whole tree of streams is reproducible from one root seed.
+    """
+
+    def __init__(self, seed: Optional[Seed] = None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**63)
+        self.seed_value = seed
+        self.spawned = 0
+        super().__init__(seed)
+
+    def spawn(self, count: int = 1) -> List["GameRNG"]:
+        """Create `count` new child streams, independent of this one."""
+        children = [GameRNG(f"{self.seed_value}/{self.spawned + i}") for i in range(count)]
+        self.spawned += count
+        return children
+
+    def __reduce__(self):
+        return _restore, (self.seed_value, self.spawned, self.getstate())
+
+    def __repr__(self) -> str:
+        return f"GameRNG(seed={self.seed_value!r})"
+
+
+def _restore(seed: Seed, spawned: int, state) -> GameRNG:
+    rng = GameRNG(seed)
+    rng.spawned = spawned
+    rng.setstate(state)
+    return rng
+
+
+def spawn_seeds(root_seed: Seed, count: int) -> List[str]:
+    """Seeds for `count` independent games, e.g. one per parallel worker task."""
+    return [rng.seed_value for rng in GameRNG(root_seed).spawn(count)]
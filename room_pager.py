@@ -0,0 +1,230 @@
+# room_pager.py
+# NOTE: Keeps only a bounded set of rooms in memory for big procedural maps.
+# PagedRooms sits behind Game.rooms: rooms are generated from the map seed (or
+# reloaded from a room store if the player changed them) when first needed,
+# and the least recently used ones are evicted once over budget, rooms marked
+# as changed being encoded into the store on the way out.
+
+import os
+from collections import OrderedDict
+from typing import Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+from map_generator import generate_room, room_distance, room_exits, room_id, room_index, room_neighbors, seed_int
+from maps import MapRoom
+from rng import Seed
+from snapshot import decode_room, encode_room
+
+
+class ProceduralSource:
+    """Regenerates rooms of a map_generator dungeon from its seed."""
+
+    def __init__(self, seed: Seed, room_count: int):
+        self.seed = seed
+        self.room_count = room_count
+        self._seed_int = seed_int(seed)
+
+    @property
+    def start_key(self) -> str:
+        return room_id(0)
+
+    def __contains__(self, key) -> bool:
+        try:
+            return room_id(room_index(key)) == key and 0 <= room_index(key) < self.room_count
+        except (AttributeError, IndexError, ValueError):
+            return False
+
+    def ids(self) -> Iterator[str]:
+        return (room_id(i) for i in range(self.room_count))
+
+    def load(self, key: str, pool=None) -> MapRoom:
+        """Generate a room, recycling its enemies from pool (an enemy_utils.EnemyPool) if given."""
+        if key not in self:
+            raise KeyError(key)
+        return generate_room(self.seed, room_index(key), self.room_count, pool)
+
+    def exits(self, key: str) -> Dict[str, str]:
+        """A room's exits, computed from the seed without generating the room."""
+        return room_exits(self.seed, room_index(key), self.room_count)
+
+    def neighbors(self, key: str) -> List[str]:
+        """Ids of the rooms a room's exits lead to (cheaper than exits(): no names)."""
+        return [room_id(j) for _, j in room_neighbors(self._seed_int, room_index(key), self.room_count)]
+
+    def distance(self, a: str, b: str) -> int:
+        return room_distance(room_index(a), room_index(b), self.room_count)
+
+
+class MemoryRoomStore:
+    """Encoded changed rooms kept in memory (a few hundred bytes each)."""
+
+    def __init__(self, rooms: Optional[Dict[str, bytes]] = None):
+        self._rooms: Dict[str, bytes] = dict(rooms or {})
+
+    def __contains__(self, key) -> bool:
+        return key in self._rooms
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._rooms.get(key)
+
+    def put(self, key: str, data: bytes):
+        self._rooms[key] = data
+
+    def items(self):
+        return self._rooms.items()
+
+
+class DirectoryRoomStore:
+    """Encoded changed rooms as one file each under a directory."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.room")
+
+    def __contains__(self, key) -> bool:
+        return os.path.exists(self._file(key))
+
+    def __len__(self) -> int:
+        return sum(1 for name in os.listdir(self.path) if name.endswith(".room"))
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._file(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        tmp = self._file(key) + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self._file(key))
+
+    def items(self):
+        for name in sorted(os.listdir(self.path)):
+            if name.endswith(".room"):
+                key = name[:-len(".room")]
+                yield key, self.get(key)
+
+
+class PagedRooms(MutableMapping):
+    """
+    Game.rooms for maps too big to keep resident. At most max_resident rooms
+    are in memory, in least-recently-used order. claim() is the write barrier
+    (Game.room goes through it): it pins the room, along with the one the
+    player just left, which the game is still updating, so neither is
+    evicted, and pages in its neighbours so the next move does not wait on
+    generation. Whoever changes a room's contents calls mark_changed(); only
+    marked rooms are encoded into the store when evicted, the rest are just
+    dropped and regenerated from the seed later, so walking through a room
+    leaves nothing behind. Rooms paged in from the seed take their enemies
+    from pool (the game's enemy_utils.EnemyPool) if one is given.
+    """
+
+    def __init__(self, source: ProceduralSource, max_resident: int = 64, store=None, pool=None):
+        self.source = source
+        self.pool = pool
+        self.max_resident = max(2, max_resident)
+        self.store = store if store is not None else MemoryRoomStore()
+        self._resident: "OrderedDict[str, MapRoom]" = OrderedDict()
+        self._changed: set = set()  # resident rooms that differ from the seed (or are already in the store)
+        self._pinned: Tuple[str, ...] = ()  # the player's room, then the one they came from
+        self.page_ins = 0
+        self.evictions = 0
+
+    def _page_in(self, key: str) -> MapRoom:
+        data = self.store.get(key)
+        if data is not None:
+            room = decode_room(data)
+            self._changed.add(key)
+        else:
+            room = self.source.load(key, self.pool)
+        self.page_ins += 1
+        self._resident[key] = room
+        self._evict()
+        return room
+
+    def _evict(self):
+        while len(self._resident) > self.max_resident:
+            key, room = self._resident.popitem(last=False)
+            if key in self._pinned:
+                self._resident[key] = room  # back to the hot end
+                continue
+            if key in self._changed:
+                self.store.put(key, encode_room(room))
+                self._changed.discard(key)
+            self.evictions += 1
+
+    def claim(self, key: str) -> MapRoom:
+        """Return a room for mutation; call mark_changed() once it differs from the seed."""
+        room = self[key]
+        if self._pinned[:1] != (key,):
+            # The player just arrived: pin the room, keep the one they left
+            # pinned while Game._enter_room finishes with it, and page in
+            # where they can go next
+            self._pinned = (key,) + self._pinned[:1]
+            for neighbor in room.exits.values():
+                if neighbor not in self._resident:
+                    self._page_in(neighbor)
+        return room
+
+    def mark_changed(self, key: str):
+        """Record that a resident room no longer matches its seed version, so eviction stores it."""
+        if key in self._resident:
+            self._changed.add(key)
+
+    def __getitem__(self, key: str) -> MapRoom:
+        room = self._resident.get(key)
+        if room is None:
+            return self._page_in(key)
+        self._resident.move_to_end(key)
+        return room
+
+    def __setitem__(self, key: str, room: MapRoom):
+        self._resident[key] = room
+        self._resident.move_to_end(key)
+        self._changed.add(key)
+        self._evict()
+
+    def __delitem__(self, key: str):
+        raise TypeError("rooms cannot be removed from a paged map")
+
+    def __iter__(self) -> Iterator[str]:
+        return self.source.ids()
+
+    def __len__(self) -> int:
+        return self.source.room_count
+
+    def __contains__(self, key) -> bool:
+        return key in self._resident or key in self.source
+
+    def peek(self, key: str) -> MapRoom:
+        """A room to read without making it resident (the route planner looks ahead with this)."""
+        room = self._resident.get(key)
+        if room is not None:
+            return room
+        data = self.store.get(key)
+        return decode_room(data) if data is not None else self.source.load(key)
+
+    def exits_of(self, key: str) -> Dict[str, str]:
+        room = self._resident.get(key)
+        return room.exits if room is not None else self.source.exits(key)
+
+    def neighbors_of(self, key: str) -> List[str]:
+        return self.source.neighbors(key)
+
+    def distance(self, a: str, b: str) -> int:
+        return self.source.distance(a, b)
+
+    @property
+    def resident(self) -> int:
+        return len(self._resident)
+
+    def changed_resident(self) -> List[MapRoom]:
+        """Resident rooms that differ from the seed (the rest of the changes are in the store)."""
+        return [room for key, room in self._resident.items() if key in self._changed]
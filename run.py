@@ -8,7 +8,12 @@ def run_console():
 
 def run_web():
     from web_ui import app
-    app.run(debug=True)
+    app.run(debug=True, threaded=True)
+
+
+def run_asgi():
+    import uvicorn
+    uvicorn.run("asgi_ui:app", host="127.0.0.1", port=8000)
 
 
 if __name__ == "__main__":
@@ -16,3 +21,5 @@ if __name__ == "__main__":
     run_console()
     # To launch the web interface instead, just comment this out and use:
     # run_web()
+    # or, for the WebSocket front end:
+    # run_asgi()
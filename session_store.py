@@ -0,0 +1,112 @@
+# session_store.py
+# NOTE: Holds many concurrent Game instances for the web front end, keyed by
+# session id, with a session cap (LRU eviction), idle TTL and a lock per
+# session so a threaded server can serve players side by side.
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from engine import Game
+
+
+@dataclass
+class GameSession:
+    game: Game
+    last_access: float
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    client_state: Optional[Dict[str, Any]] = None  # last state snapshot sent to the client
+
+
+class SessionStore:
+    """
+    Sessions are kept in an OrderedDict in least-recently-used order, so both
+    LRU eviction and the idle sweep only ever look at the front of the dict.
+    The store lock guards the dict itself; each session's own lock guards its
+    Game while a command runs, so different players never wait on each other.
+    """
+
+    def __init__(self, max_sessions: int = 1000, ttl: float = 30 * 60,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.clock = clock
+        self._sessions: "OrderedDict[str, GameSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+    def create(self, game: Game) -> str:
+        """Store a new game and return its session id, evicting if over the cap."""
+        session_id = secrets.token_urlsafe(16)
+        with self._lock:
+            now = self.clock()
+            self._evict_expired(now)
+            self._sessions[session_id] = GameSession(game=game, last_access=now)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id
+
+    def get(self, session_id: Optional[str]) -> Optional[GameSession]:
+        """Look up a live session and mark it as most recently used."""
+        if not session_id:
+            return None
+        with self._lock:
+            now = self.clock()
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            if now - session.last_access > self.ttl:
+                del self._sessions[session_id]
+                return None
+            session.last_access = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def discard(self, session_id: Optional[str]):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def evict_expired(self) -> int:
+        """Drop every session idle for longer than the TTL; returns how many."""
+        with self._lock:
+            return self._evict_expired(self.clock())
+
+    def _evict_expired(self, now: float) -> int:
+        evicted = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_access <= self.ttl:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+        return evicted
+
+    @contextmanager
+    def locked(self, session_id: Optional[str]) -> Iterator[Optional[GameSession]]:
+        """
+        Hold a session's lock for the duration of one command.
+
+        Yields:
+            Optional[GameSession]: The session, or None if it does not exist.
+        """
+        session = self.get(session_id)
+        if session is None:
+            yield None
+            return
+        with session.lock:
+            yield session
+
+    @contextmanager
+    def session(self, session_id: Optional[str]) -> Iterator[Optional[Game]]:
+        """Like locked(), but yields just the session's Game (or None)."""
+        with self.locked(session_id) as session:
+            yield session.game if session else None
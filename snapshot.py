@@ -0,0 +1,392 @@
+# snapshot.py
+# NOTE: Versioned, compact binary snapshots of a full Game (rooms, zones,
+# enemies and their effects, player stats/skills/XP, counters and RNG state),
+# so idle sessions can be spilled to disk and restored quickly.
+#
+# Layout: MAGIC | u16 format version | u8 flags | payload (zlib if FLAG_ZLIB)
+# Payload: string table (varint count, then varint length + UTF-8 each),
+# followed by one tagged value tree. Strings in the tree are table indexes,
+# so repeated names, effect types and attack-mode keys are stored once.
+# Games on a shared world prototype store only the rooms they have claimed
+# plus the prototype's name (format version 2; version 1 always stored all rooms).
+# Paged procedural games store their generator parameters and changed rooms
+# (version 3). encode_room/decode_room use the same format for single rooms.
+
+import struct
+import sys
+import zlib
+from array import array
+from collections import defaultdict
+from dataclasses import fields
+from typing import Dict, List
+
+from engine import Game
+from initiative_utils import InitiativeQueue
+from enemy import Enemy
+from enemy_utils import EnemyPool
+from maps import MapRoom, Zone
+from player import Player
+from rng import GameRNG
+from status_effects import StatusEffects
+from world import RoomTable, get_prototype
+
+MAGIC = b"CRWL"
+ROOM_MAGIC = b"CRWR"
+FORMAT_VERSION = 3
+SUPPORTED_VERSIONS = (1, 2, 3)
+FLAG_ZLIB = 1
+_HEADER = struct.Struct(">4sHB")
+_DOUBLE = struct.Struct(">d")
+
+# Value tags
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT, _BYTES, _TUPLE = range(10)
+
+
+class SnapshotError(ValueError):
+    """Raised for data that is not a snapshot this version can read."""
+
+
+# What damaged bytes can raise while being decoded and rebuilt (UnicodeDecodeError
+# is a ValueError); loads() and decode_room() turn all of these into SnapshotError.
+_CORRUPT = (IndexError, KeyError, TypeError, AttributeError, ValueError, OverflowError, struct.error, zlib.error)
+
+
+# Low-level encoding
+
+def _write_varint(out: bytearray, n: int):
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+class _Encoder:
+    def __init__(self):
+        self.out = bytearray()
+        self.strings: Dict[str, int] = {}
+
+    def value(self, v):
+        out = self.out
+        if v is None:
+            out.append(_NONE)
+        elif v is True:
+            out.append(_TRUE)
+        elif v is False:
+            out.append(_FALSE)
+        elif isinstance(v, int):
+            out.append(_INT)
+            _write_varint(out, (v << 1) if v >= 0 else ((-v << 1) - 1))  # zigzag
+        elif isinstance(v, float):
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(v)
+        elif isinstance(v, str):
+            out.append(_STR)
+            idx = self.strings.get(v)
+            if idx is None:
+                idx = self.strings[v] = len(self.strings)
+            _write_varint(out, idx)
+        elif isinstance(v, dict):
+            out.append(_DICT)
+            _write_varint(out, len(v))
+            for key, item in v.items():
+                self.value(key)
+                self.value(item)
+        elif isinstance(v, (list, tuple)):
+            out.append(_LIST if isinstance(v, list) else _TUPLE)
+            _write_varint(out, len(v))
+            for item in v:
+                self.value(item)
+        elif isinstance(v, (bytes, bytearray)):
+            out.append(_BYTES)
+            _write_varint(out, len(v))
+            out += v
+        else:
+            raise SnapshotError(f"cannot snapshot value of type {type(v).__name__}")
+
+    def payload(self) -> bytes:
+        table = bytearray()
+        _write_varint(table, len(self.strings))
+        for s in self.strings:  # dicts keep insertion order = index order
+            raw = s.encode()
+            _write_varint(table, len(raw))
+            table += raw
+        return bytes(table + self.out)
+
+
+class _Decoder:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+        self.strings: List[str] = []
+        for _ in range(self.varint()):
+            n = self.varint()
+            self.strings.append(data[self.pos:self.pos + n].decode())
+            self.pos += n
+
+    def varint(self) -> int:
+        data, pos = self.data, self.pos
+        result = shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                self.pos = pos
+                return result
+            shift += 7
+
+    def value(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == _STR:
+            return self.strings[self.varint()]
+        if tag == _INT:
+            n = self.varint()
+            return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+        if tag == _DICT:
+            return {self.value(): self.value() for _ in range(self.varint())}
+        if tag == _LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _FLOAT:
+            v = _DOUBLE.unpack_from(self.data, self.pos)[0]
+            self.pos += 8
+            return v
+        if tag == _TUPLE:
+            return tuple(self.value() for _ in range(self.varint()))
+        if tag == _BYTES:
+            n = self.varint()
+            v = bytes(self.data[self.pos:self.pos + n])
+            self.pos += n
+            return v
+        raise SnapshotError(f"unknown value tag {tag}")
+
+
+# Game <-> plain data
+
+_GAME_SKIP = {"player", "rooms", "rng", "initiative", "routes", "visibility", "pool"}
+
+
+def _rng_to_data(rng) -> dict:
+    version, internal, gauss = rng.getstate()
+    words = array("I", internal)
+    if sys.byteorder != "little":
+        words.byteswap()
+    return {
+        "seed": getattr(rng, "seed_value", None),
+        "spawned": getattr(rng, "spawned", 0),
+        "version": version,
+        "state": words.tobytes(),
+        "gauss": gauss,
+    }
+
+
+def _rng_from_data(data: dict) -> GameRNG:
+    rng = GameRNG(data["seed"] if data["seed"] is not None else 0)
+    rng.seed_value = data["seed"]
+    rng.spawned = data["spawned"]
+    words = array("I")
+    words.frombytes(data["state"])
+    if sys.byteorder != "little":
+        words.byteswap()
+    rng.setstate((data["version"], tuple(words), data["gauss"]))
+    return rng
+
+
+def _initiative_to_data(game: Game) -> dict:
+    # Queued enemies are all in the current room; refer to them by zone and slot
+    refs = {id(game.player): None}
+    for zone_key, zone in game.room.zones.items():
+        for i, enemy in enumerate(zone.enemies):
+            refs[id(enemy)] = (zone_key, i)
+    return {
+        "now": game.initiative.now,
+        "queue": [(refs[id(actor)], time) for time, actor in game.initiative.entries()],
+    }
+
+
+def _initiative_from_data(game: Game, data: dict) -> InitiativeQueue:
+    queue = InitiativeQueue()
+    queue.now = data["now"]
+    for ref, time in data["queue"]:
+        queue.add(game.player if ref is None else game.room.zones[ref[0]].enemies[ref[1]], time)
+    return queue
+
+
+def _room_to_data(room: MapRoom) -> dict:
+    room_data = {f.name: getattr(room, f.name) for f in fields(MapRoom) if f.init and f.name != "zones"}
+    room_data["zones"] = [
+        (key, {
+            **{f.name: getattr(zone, f.name) for f in fields(Zone) if f.name != "enemies"},
+            "enemies": [enemy.state() for enemy in zone.enemies],
+        })
+        for key, zone in room.zones.items()
+    ]
+    return room_data
+
+
+def _room_from_data(room_data: dict) -> MapRoom:
+    zones = {}
+    for key, zone_data in room_data.pop("zones"):
+        enemies = [Enemy.from_state(e) for e in zone_data.pop("enemies")]
+        zones[key] = Zone(enemies=enemies, **zone_data)
+    return MapRoom(zones=zones, **room_data)
+
+
+def _game_to_data(game: Game) -> dict:
+    from room_pager import PagedRooms
+
+    shared = isinstance(game.rooms, RoomTable)
+    paged = isinstance(game.rooms, PagedRooms)
+    if shared:
+        rooms = game.rooms.overlay.values()
+    elif paged:
+        rooms = game.rooms.changed_resident()
+    else:
+        rooms = game.rooms.values()
+
+    player = dict(vars(game.player))
+    player["skills"] = dict(player["skills"])
+    player["skill_xp"] = dict(player["skill_xp"])
+    player["status_effects"] = [dict(effect) for effect in player["status_effects"]]
+
+    return {
+        "game": {f.name: getattr(game, f.name) for f in fields(Game) if f.name not in _GAME_SKIP},
+        "player": player,
+        "world": game.rooms.prototype.name if shared else None,
+        "rooms": [_room_to_data(room) for room in rooms],
+        "rng": _rng_to_data(game.rng),
+        "initiative": _initiative_to_data(game),
+        **(_paged_to_data(game.rooms) if paged else {}),
+    }
+
+
+def _paged_to_data(rooms) -> dict:
+    """
+    A paged map's seed and room store. A memory store is copied in; a
+    directory store is referenced by path, not read, so a restored game pages
+    from whatever the directory holds by then.
+    """
+    from room_pager import DirectoryRoomStore
+
+    source, store = rooms.source, rooms.store
+    data = {"paged": {"seed": source.seed, "room_count": source.room_count, "max_resident": rooms.max_resident}}
+    if isinstance(store, DirectoryRoomStore):
+        data["store_path"] = store.path
+    else:
+        data["spilled"] = dict(store.items())
+    return data
+
+
+def _game_from_data(data: dict) -> Game:
+    pool = EnemyPool()
+    rooms = {}
+    for room_data in data["rooms"]:
+        room = _room_from_data(room_data)
+        rooms[room.id] = room
+    if data.get("world") is not None:
+        rooms = RoomTable(get_prototype(data["world"]), overlay=rooms)
+    elif "paged" in data:
+        from room_pager import DirectoryRoomStore, MemoryRoomStore, PagedRooms, ProceduralSource
+        paged = data["paged"]
+        if "store_path" in data:
+            store = DirectoryRoomStore(data["store_path"])
+        else:
+            store = MemoryRoomStore(data["spilled"])
+        table = PagedRooms(ProceduralSource(paged["seed"], paged["room_count"]),
+                           max_resident=paged["max_resident"], store=store, pool=pool)
+        for room in rooms.values():
+            table[room.id] = room
+        rooms = table
+
+    player = Player.__new__(Player)
+    player.__dict__.update(data["player"])
+    player.skills = defaultdict(int, player.skills)
+    player.skill_xp = defaultdict(int, player.skill_xp)
+    player.status_effects = StatusEffects(player.status_effects)
+
+    game = Game(player=player, rooms=rooms, rng=_rng_from_data(data["rng"]), pool=pool, **data["game"])
+    if "initiative" in data:  # older snapshots get a fresh queue from Game.__post_init__
+        game.initiative = _initiative_from_data(game, data["initiative"])
+    return game
+
+
+def _pack(magic: bytes, value, compress: bool) -> bytes:
+    encoder = _Encoder()
+    encoder.value(value)
+    payload = encoder.payload()
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 6)
+        flags |= FLAG_ZLIB
+    return _HEADER.pack(magic, FORMAT_VERSION, flags) + payload
+
+
+def _unpack(expected_magic: bytes, data: bytes):
+    if len(data) < _HEADER.size:
+        raise SnapshotError("snapshot is truncated")
+    magic, version, flags = _HEADER.unpack_from(data)
+    if magic != expected_magic:
+        raise SnapshotError("not a game snapshot" if expected_magic == MAGIC else "not a room snapshot")
+    if version not in SUPPORTED_VERSIONS:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+    payload = data[_HEADER.size:]
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return _Decoder(payload).value()
+
+
+# Public API
+
+def dumps(game: Game, compress: bool = True) -> bytes:
+    """
+    Encode a Game as a snapshot.
+
+    Args:
+        game (Game): Game to encode. It is not modified.
+        compress (bool): zlib-compress the payload (smaller, slightly slower).
+
+    Returns:
+        bytes: Snapshot data readable by loads().
+    """
+    return _pack(MAGIC, _game_to_data(game), compress)
+
+
+def loads(data: bytes) -> Game:
+    """Rebuild a Game from snapshot bytes produced by dumps()."""
+    try:
+        return _game_from_data(_unpack(MAGIC, data))
+    except SnapshotError:
+        raise
+    except _CORRUPT as exc:
+        raise SnapshotError("corrupt snapshot") from exc
+
+
+def encode_room(room: MapRoom, compress: bool = True) -> bytes:
+    """Encode a single room (zones, enemies and their effects)."""
+    return _pack(ROOM_MAGIC, _room_to_data(room), compress)
+
+
+def decode_room(data: bytes) -> MapRoom:
+    """Rebuild a room from encode_room() output; the room is not attached to any store."""
+    try:
+        return _room_from_data(_unpack(ROOM_MAGIC, data))
+    except SnapshotError:
+        raise
+    except _CORRUPT as exc:
+        raise SnapshotError("corrupt room snapshot") from exc
+
+
+def save(game: Game, path: str, compress: bool = True):
+    with open(path, "wb") as f:
+        f.write(dumps(game, compress))
+
+
+def load(path: str) -> Game:
+    with open(path, "rb") as f:
+        return loads(f.read())
@@ -0,0 +1,101 @@
+# state_api.py
+# NOTE: Client-facing view of a Game for the JSON API. Builds a plain-data
+# snapshot of what a client displays and diffs it against the last snapshot
+# that client received. Versions count the replies whose state changed, so
+# moves and searches that take no turn still get a new version.
+
+from typing import Any, Dict, Optional, Tuple
+
+from visibility import update_visibility_state
+
+
+def _effects(entity) -> list:
+    return [dict(effect) for effect in entity.status_effects]
+
+
+def snapshot(game) -> Dict[str, Any]:
+    """
+    Capture the client-visible state: player, current room and the enemies
+    the player currently sees in it (line of sight and perception, see
+    visibility.VisibilityState); undetected enemies are left out entirely.
+    Enemies are keyed "<zone>.<index>" by their slot in the zone.
+    """
+    room = game.room
+    player = game.player
+    seen = {id(enemy) for enemy in update_visibility_state(game).visible_enemies()}
+    enemies = {}
+    for zone_name, zone in room.zones.items():
+        for i, enemy in enumerate(zone.enemies):
+            if id(enemy) in seen:
+                enemies[f"{zone_name}.{i}"] = {
+                    "name": enemy.name,
+                    "health": enemy.health,
+                    "zone": zone_name,
+                    "status_effects": _effects(enemy),
+                }
+
+    return {
+        "player": {
+            "name": player.name,
+            "health": player.health,
+            "max_health": player.max_health,
+            "zone": game.player_zone,
+            "status_effects": _effects(player),
+        },
+        "room": {
+            "id": room.id,
+            "name": room.name,
+            "description": room.description,
+            "exits": list(room.exits),
+        },
+        "enemies": enemies,
+        "game_over": game.is_game_over(),
+    }
+
+
+def diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recursive dict diff. Clients merge it into their copy: nested dicts merge,
+    other values replace, and None deletes the key.
+    """
+    changes = {}
+    for key, value in new.items():
+        if key not in old:
+            changes[key] = value
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            nested = diff(old[key], value)
+            if nested:
+                changes[key] = nested
+        elif old[key] != value:
+            changes[key] = value
+    for key in old.keys() - new.keys():
+        changes[key] = None
+    return changes
+
+
+def state_update(game, last: Optional[Dict[str, Any]], since: Optional[int]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the state part of an API reply.
+
+    Args:
+        game: The session's Game.
+        last (Optional[dict]): The last {"version", "state"} sent to this client.
+        since (Optional[int]): Version the client says it holds.
+
+    Returns:
+        tuple: (reply, new record to keep as `last`). The reply holds a delta
+        when the client is on the last sent version, otherwise the full state.
+        The version goes up by one whenever the state differs from `last`.
+    """
+    state = snapshot(game)
+    if last is None:
+        version = 0
+    elif state != last["state"]:
+        version = last["version"] + 1
+    else:
+        version = last["version"]
+    if last is not None and since is not None and since == last["version"]:
+        reply = {"version": version, "since": since, "changes": diff(last["state"], state)}
+    else:
+        reply = {"version": version, "full": state}
+    return reply, {"version": version, "state": state}
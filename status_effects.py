@@ -1,65 +1,176 @@
 # status_effects.py
-from typing import List
-from collections import defaultdict
+# NOTE: Each actor's status_effects is a StatusEffects container. Stacking
+# effects are kept as per-type running totals and expirations sit on a timing
+# wheel keyed by the actor's tick count, so a tick only touches the stack
+# totals, the per-tick effects (regen/blind/maim) and whatever expires now.
+from typing import Dict, Iterable, Iterator, List
+
+from events import Event, StatusEvent, ExpireEvent
 
 STACKING_EFFECTS = {"poison", "burn", "bleed"}  # Example set, adjust as needed
+PER_TICK_EFFECTS = {"regen", "blind", "maim"}  # report (or heal) on every tick
+
+
+class StatusEffects:
+    """
+    Active effect dicts of one actor, in the order they were applied.
+
+    Behaves like the list it replaces for appending and reading: iterating
+    yields the effect dicts, and for effects with a duration a copy whose
+    "duration" is the ticks remaining. An effect with duration d ticks
+    max(d, 1) more times, including the tick it expires on; effects without a
+    duration never expire. Effect dicts are never modified, by the container
+    or by its owner after they are appended.
+    """
+
+    __slots__ = ("_effects", "_expiry", "_next_id", "_ticks", "_stacks", "_per_tick", "_wheel")
+
+    def __init__(self, effects: Iterable[dict] = ()):
+        self._effects: Dict[int, dict] = {}      # id -> effect, in application order
+        self._expiry: Dict[int, int] = {}        # id -> tick it expires on
+        self._next_id = 0
+        self._ticks = 0
+        self._stacks: Dict[str, list] = {}       # stacking type -> [total damage, {id: damage}]
+        self._per_tick: Dict[int, dict] = {}     # id -> regen/blind/maim effect
+        self._wheel: Dict[int, List[int]] = {}   # tick -> ids expiring on it
+        for effect in effects:
+            self.append(effect)
 
-def process_effects(target) -> List[dict]:
-    events = []
-    expired = []
-
-    stack_groups = defaultdict(list)
-    for effect in target.status_effects:
-        if effect["type"] in STACKING_EFFECTS:
-            stack_groups[effect["type"]].append(effect)
-
-    for effect_type, stack in stack_groups.items():
-        total_damage = sum(e.get("damage", 1) for e in stack)
-        count = len(stack)
-        target.health -= total_damage
-        events.append({
-            "type": effect_type,
-            "target": target,
-            "amount": total_damage,
-            "count": count
-        })
-        for e in stack:
-            if "duration" in e:
-                e["duration"] -= 1
-                if e["duration"] <= 0:
-                    expired.append(e)
-
-    for effect in target.status_effects:
-        if effect["type"] in STACKING_EFFECTS:
-            continue
-
-        if effect["type"] == "regen":
-            heal = effect.get("heal", 3)
-            target.health += heal
-            events.append({
-                "type": "regen",
-                "target": target,
-                "amount": heal
-            })
-
-        elif effect["type"] in {"blind", "maim"}:
-            events.append({
-                "type": effect["type"],
-                "target": target
-            })
+    def append(self, effect: dict):
+        effect_id = self._next_id
+        self._next_id += 1
+        self._effects[effect_id] = effect
+
+        effect_type = effect["type"]
+        if effect_type in STACKING_EFFECTS:
+            damage = effect.get("damage", 1)
+            stack = self._stacks.get(effect_type)
+            if stack is None:
+                self._stacks[effect_type] = [damage, {effect_id: damage}]
+            else:
+                stack[0] += damage
+                stack[1][effect_id] = damage
+        elif effect_type in PER_TICK_EFFECTS:
+            self._per_tick[effect_id] = effect
 
         if "duration" in effect:
-            effect["duration"] -= 1
-            if effect["duration"] <= 0:
-                expired.append(effect)
-
-    # Track expired effects
-    for e in expired:
-        target.status_effects.remove(e)
-        events.append({
-            "type": "expire",
-            "target": target,
-            "effect": e["type"]
-        })
-
-    return events
+            expiry = self._expiry[effect_id] = self._ticks + max(effect["duration"], 1)
+            bucket = self._wheel.get(expiry)
+            if bucket is None:
+                self._wheel[expiry] = [effect_id]
+            else:
+                bucket.append(effect_id)
+
+    def clear(self):
+        self.__init__()
+
+    def __iter__(self) -> Iterator[dict]:
+        expiry, ticks = self._expiry, self._ticks
+        for effect_id, effect in self._effects.items():
+            if effect_id in expiry:
+                yield {**effect, "duration": expiry[effect_id] - ticks}
+            else:
+                yield effect
+
+    def __len__(self) -> int:
+        return len(self._effects)
+
+    def __bool__(self) -> bool:
+        return bool(self._effects)
+
+    def __repr__(self) -> str:
+        return f"StatusEffects({list(self)!r})"
+
+    def tick(self, target) -> List[Event]:
+        """Apply one turn of every effect to target and expire the ones that run out."""
+        self._ticks += 1
+        events = []
+
+        # Stacks report in order of their oldest surviving effect
+        stacks = self._stacks
+        order = list(stacks) if len(stacks) < 2 else sorted(stacks, key=lambda t: next(iter(stacks[t][1])))
+        for effect_type in order:
+            total_damage, members = stacks[effect_type]
+            target.health -= total_damage
+            events.append(StatusEvent(effect_type, target, amount=total_damage, count=len(members)))
+
+        for effect in self._per_tick.values():
+            if effect["type"] == "regen":
+                heal = effect.get("heal", 3)
+                target.health += heal
+                events.append(StatusEvent("regen", target, amount=heal))
+            else:
+                events.append(StatusEvent(effect["type"], target))
+
+        expiring = self._wheel.pop(self._ticks, None)
+        if expiring:
+            for effect_type in self._expire(expiring, order):
+                events.append(ExpireEvent(target, effect_type))
+
+        return events
+
+    def _expire(self, expiring: List[int], order: List[str]) -> List[str]:
+        """Drop the given effects; returns their types in expiry-event order."""
+        # Stacking effects expire first, grouped by stack, then the rest in application order
+        stacks = self._stacks
+        rank = {effect_type: i for i, effect_type in enumerate(order)}
+        last = len(rank)
+        expiring.sort(key=lambda i: (rank.get(self._effects[i]["type"], last), i))
+        expired = []
+        for effect_id in expiring:
+            effect = self._effects.pop(effect_id)
+            del self._expiry[effect_id]
+            effect_type = effect["type"]
+            if effect_type in STACKING_EFFECTS:
+                stack = stacks[effect_type]
+                stack[0] -= stack[1].pop(effect_id)
+                if not stack[1]:
+                    del stacks[effect_type]
+            else:
+                self._per_tick.pop(effect_id, None)
+            expired.append(effect_type)
+        return expired
+
+    def advance(self, target, turns: int) -> int:
+        """
+        Apply `turns` ticks in one step, without events. Between two expiry
+        ticks health changes by a fixed amount per tick, so this costs one
+        step per expiry bucket rather than per turn. Like the per-turn loop,
+        which only ticks living actors, it stops after the tick that leaves
+        target at 0 health or below.
+
+        Returns:
+            int: Ticks actually applied.
+        """
+        health = target.health
+        if turns <= 0 or health <= 0:
+            return 0
+        start = self._ticks
+        end = start + turns
+        if not self._effects:
+            self._ticks = end
+            return turns
+
+        for change in sorted(t for t in self._wheel if t <= end) + [end]:
+            steps = change - self._ticks
+            if steps <= 0:
+                continue
+            per_tick = -sum(stack[0] for stack in self._stacks.values())
+            per_tick += sum(e.get("heal", 3) for e in self._per_tick.values() if e["type"] == "regen")
+            if per_tick < 0 and health + steps * per_tick <= 0:
+                steps = -(-health // -per_tick)  # ticks until health reaches 0 or below
+            health += steps * per_tick
+            self._ticks += steps
+            expiring = self._wheel.pop(self._ticks, None)
+            if expiring:
+                self._expire(expiring, list(self._stacks))
+            if health <= 0:
+                break
+
+        target.health = health
+        return self._ticks - start
+
+
+def process_effects(target) -> List[Event]:
+    """Advance target's status effects by one turn and return what happened."""
+    return target.status_effects.tick(target)
@@ -0,0 +1,27 @@
+# test_combat_sim.py
+# NOTE: The simulator's fixed turn order only matches Game.attack while every
+# actor shares one speed.
+import pytest
+
+from combat_sim import simulate_fights
+from enemy_data import ARCHETYPES, spawn
+from player import Player
+
+
+def test_every_archetype_moves_at_player_speed():
+    player = Player("Sim")
+    assert ARCHETYPES
+    assert {kind: archetype.speed for kind, archetype in ARCHETYPES.items()} == \
+        {kind: player.speed for kind in ARCHETYPES}
+
+
+def test_mixed_speeds_are_rejected():
+    player = Player("Sim")
+    player.speed += 5
+    with pytest.raises(ValueError):
+        simulate_fights(player, lambda: spawn("goblin"), n=10, seed=1)
+
+
+def test_equal_speed_fight_runs():
+    result = simulate_fights(Player("Sim"), lambda: spawn("goblin"), n=50, seed=1)
+    assert result.wins + result.losses + result.timeouts == result.fights == 50
@@ -0,0 +1,92 @@
+# test_enemy_utils.py
+# NOTE: Bulk spawning, the per-game enemy pool and reaping the dead.
+import random
+
+from engine import build_game, run_command
+from enemy_data import spawn
+from enemy_utils import EnemyPool, reap_dead, spawn_enemies
+from item_data import get_basic_weapons
+
+
+def _room():
+    game = build_game("Spawner", seed=1)
+    return game, game.room
+
+
+def test_spawn_fills_zones_in_turn():
+    _, room = _room()
+    zones = ["zone2", "zone3"]
+    enemies = spawn_enemies(room, "goblin", 5, zones=zones)
+    assert [enemy.current_zone for enemy in enemies] == ["zone2", "zone3", "zone2", "zone3", "zone2"]
+    assert all(enemy.kind == "goblin" and enemy in room.zones[enemy.current_zone].enemies for enemy in enemies)
+    assert all(enemy in room.visible_enemies() for enemy in enemies)
+    assert all(enemy._store is room.actors for enemy in enemies)
+
+
+def test_spawn_with_rng_picks_random_zones():
+    _, room = _room()
+    zones = list(room.zones)
+    enemies = spawn_enemies(room, "spider", 20, rng=random.Random(4))
+    expected = random.Random(4)
+    assert [enemy.current_zone for enemy in enemies] == [expected.choice(zones) for _ in range(20)]
+
+
+def test_acquire_reuses_a_released_enemy_fully_reset():
+    pool = EnemyPool()
+    used = spawn("spider")
+    used.attack(random.Random(1))
+    used.status_effects.append({"type": "poison", "damage": 2, "duration": 3})
+    used.current_zone = "zone4"
+    used.health = 0
+    pool.release(used)
+
+    enemy = pool.acquire("spider")
+    assert enemy is used
+    assert pool.reused == 1 and len(pool) == 0
+    assert enemy.state() == spawn("spider").state()
+    assert not enemy.status_effects
+    assert enemy._store is None and enemy._index is None
+
+
+def test_release_is_capped_per_kind():
+    pool = EnemyPool(max_per_kind=2)
+    for _ in range(5):
+        pool.release(spawn("goblin"))
+    assert len(pool) == 2
+    assert pool.acquire("spider").kind == "spider"  # nothing pooled for it: a new one
+    assert pool.reused == 0
+
+
+def test_reap_dead_clears_zone_lists_index_and_store():
+    _, room = _room()
+    enemies = spawn_enemies(room, "goblin", 3, zones=["zone2"])
+    store, index = room.actors, room.index
+    dead = enemies[1]
+    row = dead._slot
+    dead.health = 0
+
+    pool = EnemyPool()
+    assert reap_dead(room, pool) == 1
+    assert dead not in room.zones["zone2"].enemies
+    assert id(dead) not in index._enemy_zone and dead not in index.living()
+    assert dead._index is None and dead._store is None
+    assert store.actors[row] is None and row in store._free
+    assert len(pool) == 1
+
+    replacement = spawn_enemies(room, "goblin", 1, zones=["zone3"], pool=pool)[0]
+    assert replacement is dead
+    assert replacement._slot == row and replacement in room.visible_enemies()
+
+
+def test_game_pools_the_dead_of_rooms_it_leaves():
+    game = build_game("Spawner", seed=1)
+    other = build_game("Other", seed=1)
+    game.player.weapon = get_basic_weapons()["knife"]
+    game.player.health = 10 ** 6
+    while game.room.visible_enemies():
+        run_command(game, "a")
+    for _ in range(3):
+        run_command(game, "guardpost_doorway")
+    assert len(game.pool) == 1
+    assert len(other.pool) == 0
+    assert all(enemy.is_alive() for zone in game.rooms["entrance_hall"].zones.values() for enemy in zone.enemies)
@@ -0,0 +1,20 @@
+# test_initiative.py
+# NOTE: Game.attack runs the player's turn from the initiative queue.
+import pytest
+
+from engine import build_game
+
+
+def test_player_killed_before_their_turn_does_not_swing():
+    game = build_game("Fighter", seed=1)
+    game.player.health = 0
+    events = game.attack()
+    assert not [event for event in events if getattr(event, "attacker", None) is game.player]
+    assert game.player in game.initiative
+
+
+def test_enemy_phase_needs_the_player_queued():
+    game = build_game("Fighter", seed=1)
+    game.initiative.remove(game.player)
+    with pytest.raises(AssertionError):
+        game.attack()
@@ -0,0 +1,37 @@
+# test_map_utils.py
+# NOTE: RoomIndex bookkeeping when enemies change rooms.
+from engine import build_game
+from map_utils import KEYWORD_CACHE_SIZE, room_index
+
+
+def test_enemy_added_to_another_room_leaves_old_index():
+    game = build_game("Mover", seed=1)
+    old_room, new_room = game.room, game.rooms.claim("guard_post")
+    enemy = old_room.visible_enemies()[0]
+    old_index = old_room.index
+
+    old_room.zones[enemy.current_zone].enemies.remove(enemy)
+    new_room.add_enemy(enemy, next(iter(new_room.zones)))
+
+    assert enemy._index is new_room.index
+    assert enemy._store is new_room.actors
+    assert enemy not in old_index.living()
+    assert old_index.zone_for_enemy(enemy.name.split()[-1]) is None
+    assert enemy in new_room.visible_enemies()
+
+    old_living = list(old_room.visible_enemies())
+    enemy.health = 0
+    assert enemy not in new_room.visible_enemies()
+    assert old_room.visible_enemies() == old_living
+
+
+def test_keyword_answers_are_bounded():
+    game = build_game("Mover", seed=1)
+    index = room_index(game.room)
+    for i in range(KEYWORD_CACHE_SIZE + 50):
+        assert index.zone_for_feature(f"nothing {i}") is None
+        index.zone_for_enemy(f"nobody {i}")
+        index.zone_for_name(f"nowhere {i}")
+    assert index.zone_for_enemy("spider") == "zone5"
+    assert all(len(hits) == KEYWORD_CACHE_SIZE
+               for hits in (index._feature_hits, index._enemy_hits, index._name_hits))
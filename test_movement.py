@@ -0,0 +1,61 @@
+# test_movement.py
+# NOTE: Keyword movement keeps the player on a real zone, only targets enemies
+# the player sees, and leaves the shared world prototype untouched.
+from engine import build_game, build_procedural_game, run_command
+from messaging import render_events
+from movement import ROUTE_CACHE_SIZE, route_planner
+
+
+def test_player_starts_on_a_zone_of_the_room():
+    for game in (build_game("Walker", seed=1), build_procedural_game("Walker", seed=1, room_count=1000)):
+        assert game.player_zone in game.room.zones
+
+
+def test_arrival_puts_player_in_the_doorway_back():
+    game = build_game("Walker", seed=1)
+    for command in ("go guard post", "guardpost_doorway", "guardpost_doorway"):
+        run_command(game, command)
+    assert game.current_key == "guard_post"
+    assert game.room.zones[game.player_zone].display_name == "Entrance Hall Doorway"
+    assert game.describe_player_current_zone()["zone_name"] == "Entrance Hall Doorway"
+
+
+def test_going_to_the_current_room_stays_put():
+    game = build_game("Walker", seed=1)
+    zone = game.player_zone
+    events = run_command(game, "go entrance_hall")
+    assert game.player_zone == zone and game.turns == 0
+    assert "blocked" not in render_events(events)[0].lower()
+
+
+def test_crossing_the_room_takes_a_turn():
+    game = build_game("Walker", seed=1)
+    run_command(game, "go crates")
+    assert game.room.zones[game.player_zone].display_name == "Crate Stack"
+    assert game.turns == 1
+
+
+def test_hidden_and_distant_enemies_are_not_targets():
+    game = build_game("Walker", seed=1)
+    zone = game.player_zone
+    game.room.visible_enemies()[0].stealth = 20
+    run_command(game, "go spider")
+    run_command(game, "go goblin")  # in the next room, out of sight
+    assert game.player_zone == zone and game.target_direction is None
+
+
+def test_planning_leaves_prototype_rooms_unindexed():
+    game = build_game("Walker", seed=1)
+    run_command(game, "go rubble")
+    prototype = game.rooms.prototype.rooms
+    assert all(room.index is None for room in prototype.values())
+    assert all(enemy._index is None for room in prototype.values()
+               for zone in room.zones.values() for enemy in zone.enemies)
+
+
+def test_keyword_targets_are_bounded():
+    game = build_procedural_game("Walker", seed=1, room_count=10_000)
+    planner = route_planner(game)
+    for i in range(ROUTE_CACHE_SIZE + 50):
+        planner._remember_target(f"room_{i}", "rubble", "room_0")
+    assert len(planner._targets) == ROUTE_CACHE_SIZE
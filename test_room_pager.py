@@ -0,0 +1,77 @@
+# test_room_pager.py
+# NOTE: PagedRooms only spills rooms the player really changed, and snapshots
+# of a directory-backed map reference the directory instead of copying it.
+import random
+
+import snapshot
+from engine import build_procedural_game, run_command
+from item_data import get_basic_weapons
+from room_pager import DirectoryRoomStore
+
+
+def _clear_room(game):
+    while game.room.visible_enemies():
+        run_command(game, "a")
+
+
+def _walk(game, rng, moves, fight=False):
+    for _ in range(moves):
+        if fight:
+            _clear_room(game)
+        exit_name = rng.choice(sorted(game.room.exits))
+        for _ in range(3):
+            run_command(game, exit_name)
+
+
+def _tough_game(**kwargs):
+    game = build_procedural_game("Walker", seed=11, room_count=10_000, **kwargs)
+    game.player.health = 10 ** 6
+    game.player.weapon = get_basic_weapons()["knife"]
+    return game
+
+
+def test_walking_through_rooms_stores_nothing():
+    game = _tough_game(max_resident=16)
+    _walk(game, random.Random(3), 200)
+    assert game.rooms.evictions > 20
+    assert len(game.rooms.store) == 0
+    assert game.rooms.changed_resident() == []
+
+
+def test_cleared_rooms_are_stored_and_stay_cleared():
+    game = _tough_game(max_resident=4)
+    rng = random.Random(3)
+    cleared = []
+    for _ in range(10):
+        if game.room.visible_enemies():
+            _clear_room(game)
+            cleared.append(game.current_key)
+        _walk(game, rng, 3)
+    assert cleared
+    assert len(game.rooms.store) <= len(set(cleared))
+    for key in cleared:
+        assert not game.rooms[key].visible_enemies()
+
+
+def test_room_left_is_reaped_before_it_can_be_evicted():
+    game = _tough_game(max_resident=2)
+    rng = random.Random(3)
+    while not game.room.visible_enemies():
+        _walk(game, rng, 1)
+    fought = game.current_key
+    _clear_room(game)
+    _walk(game, rng, 5)
+    assert fought in game.rooms.store
+    assert not [enemy for zone in game.rooms[fought].zones.values() for enemy in zone.enemies]
+    assert len(game.pool) > 0
+
+
+def test_snapshot_references_directory_store(tmp_path):
+    game = _tough_game(max_resident=4, store=DirectoryRoomStore(str(tmp_path)))
+    _walk(game, random.Random(1), 30, fight=True)
+    assert len(game.rooms.store) > 0
+    data = snapshot.dumps(game)
+    assert all(room_file.read_bytes() not in data for room_file in tmp_path.iterdir())
+    restored = snapshot.loads(data)
+    assert restored.rooms.store.path == str(tmp_path)
+    assert restored.current_key == game.current_key
@@ -0,0 +1,135 @@
+# test_status_effects.py
+# NOTE: Checks the timing-wheel StatusEffects against the list scan it
+# replaced. _reference_process_effects is that scan, kept verbatim, run on a
+# plain list of effect dicts side by side with the container.
+import random
+from collections import defaultdict
+
+from events import ExpireEvent, StatusEvent
+from status_effects import STACKING_EFFECTS, StatusEffects, process_effects
+
+
+def _reference_process_effects(target):
+    events = []
+    expired = []
+
+    stack_groups = defaultdict(list)
+    for effect in target.status_effects:
+        if effect["type"] in STACKING_EFFECTS:
+            stack_groups[effect["type"]].append(effect)
+
+    for effect_type, stack in stack_groups.items():
+        total_damage = sum(e.get("damage", 1) for e in stack)
+        count = len(stack)
+        target.health -= total_damage
+        events.append(StatusEvent(effect_type, target, amount=total_damage, count=count))
+        for e in stack:
+            if "duration" in e:
+                e["duration"] -= 1
+                if e["duration"] <= 0:
+                    expired.append(e)
+
+    for effect in target.status_effects:
+        if effect["type"] in STACKING_EFFECTS:
+            continue
+
+        if effect["type"] == "regen":
+            heal = effect.get("heal", 3)
+            target.health += heal
+            events.append(StatusEvent("regen", target, amount=heal))
+
+        elif effect["type"] in {"blind", "maim"}:
+            events.append(StatusEvent(effect["type"], target))
+
+        if "duration" in effect:
+            effect["duration"] -= 1
+            if effect["duration"] <= 0:
+                expired.append(effect)
+
+    for e in expired:
+        target.status_effects.remove(e)
+        events.append(ExpireEvent(target, e["type"]))
+
+    return events
+
+
+class _Actor:
+    def __init__(self, status_effects):
+        self.name = "dummy"
+        self.health = 10_000
+        self.status_effects = status_effects
+
+
+def _summary(events):
+    return [(type(e).__name__, e.effect, getattr(e, "amount", None), getattr(e, "count", None)) for e in events]
+
+
+def _assert_same_tick(old: _Actor, new: _Actor):
+    assert _summary(_reference_process_effects(old)) == _summary(process_effects(new))
+    assert old.health == new.health
+    assert old.status_effects == list(new.status_effects)
+
+
+def test_stacked_dots_match_list_scan_over_many_ticks():
+    old, new = _Actor([]), _Actor(StatusEffects())
+    for tick in range(300):
+        if tick % 7 == 0:
+            for effect in ({"type": "poison", "damage": 2, "duration": 5}, {"type": "poison", "duration": 11},
+                           {"type": "burn", "damage": 3, "duration": 3}, {"type": "bleed", "duration": 8},
+                           {"type": "bleed", "damage": 2, "duration": 1}):
+                old.status_effects.append(dict(effect))
+                new.status_effects.append(dict(effect))
+        if tick == 50:  # a stack member that never expires
+            old.status_effects.append({"type": "burn", "damage": 1})
+            new.status_effects.append({"type": "burn", "damage": 1})
+        _assert_same_tick(old, new)
+
+
+def test_random_effects_match_list_scan():
+    rng = random.Random(13)
+    kinds = ["poison", "burn", "bleed", "regen", "blind", "maim", "stun"]
+    for _ in range(500):
+        old, new = _Actor([]), _Actor(StatusEffects())
+        for _ in range(40):
+            for _ in range(rng.randint(0, 3)):
+                effect = {"type": rng.choice(kinds)}
+                if rng.random() < 0.8:
+                    effect["duration"] = rng.randint(-1, 6)
+                if rng.random() < 0.5:
+                    effect["damage"] = rng.randint(1, 4)
+                if rng.random() < 0.3:
+                    effect["heal"] = rng.randint(1, 4)
+                old.status_effects.append(dict(effect))
+                new.status_effects.append(dict(effect))
+            _assert_same_tick(old, new)
+
+
+def test_advance_matches_repeated_ticks():
+    rng = random.Random(5)
+    for _ in range(300):
+        effects = [{"type": rng.choice(["poison", "burn", "bleed", "regen"]), "damage": rng.randint(1, 3),
+                    "duration": rng.randint(1, 20)} for _ in range(rng.randint(1, 6))]
+        turns = rng.randint(1, 30)
+        ticked, advanced = _Actor(StatusEffects(effects)), _Actor(StatusEffects(effects))
+        ticked.health = advanced.health = rng.randint(1, 60)
+        applied = 0
+        while applied < turns and ticked.health > 0:
+            process_effects(ticked)
+            applied += 1
+        assert advanced.status_effects.advance(advanced, turns) == applied
+        assert advanced.health == ticked.health
+        assert list(advanced.status_effects) == list(ticked.status_effects)
+
+
+def test_iterating_leaves_effect_dicts_untouched():
+    poison = {"type": "poison", "damage": 2, "duration": 4}
+    regen = {"type": "regen"}
+    effects = StatusEffects([poison, regen])
+    actor = _Actor(effects)
+    process_effects(actor)
+    assert list(effects) == [{"type": "poison", "damage": 2, "duration": 3}, regen]
+    assert poison == {"type": "poison", "damage": 2, "duration": 4}
+    for _ in range(3):
+        process_effects(actor)
+    assert list(effects) == [regen]
+    assert poison["duration"] == 4
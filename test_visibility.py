@@ -0,0 +1,50 @@
+# test_visibility.py
+# NOTE: The per-turn VisibilityState is what the zone description and the
+# JSON state report as seen.
+import state_api
+from engine import build_game, run_command
+
+
+def test_zone_description_lists_enemies_in_sight():
+    game = build_game("Watcher", seed=1)
+    view = game.describe_player_current_zone()
+    assert view["zone_name"] == "Center"
+    assert view["enemies"] == []
+    assert view["in_sight"] == [{"zone_name": "Guardpost Doorway",
+                                 "enemies": [{"name": "Giant Spider", "status": "alive"}]}]
+
+    run_command(game, "go spider")
+    view = game.describe_player_current_zone()
+    assert view["zone_name"] == "Guardpost Doorway"
+    assert [enemy["name"] for enemy in view["enemies"]] == ["Giant Spider"]
+    assert view["in_sight"] == []
+
+
+def test_sight_falls_off_with_zone_distance():
+    game = build_game("Watcher", seed=1)
+    game.describe_player_current_zone()
+    perception = game.get_effective_perception()
+    levels = game.visibility.levels
+    assert levels[game.player_zone] == perception
+    assert all(level < perception for key, level in levels.items() if key != game.player_zone)
+
+
+def test_state_api_leaves_out_enemies_out_of_sight():
+    game = build_game("Watcher", seed=1)
+    spider = game.room.visible_enemies()[0]
+    assert state_api.snapshot(game)["enemies"]["zone5.0"]["name"] == "Giant Spider"
+    spider.stealth = 20
+    assert "zone5.0" not in state_api.snapshot(game)["enemies"]
+
+
+def test_state_version_follows_changes_not_turns():
+    game = build_game("Watcher", seed=1)
+    reply, last = state_api.state_update(game, None, None)
+    assert reply["version"] == 0 and "full" in reply
+    reply, last = state_api.state_update(game, last, 0)
+    assert reply == {"version": 0, "since": 0, "changes": {}}
+
+    game.player.health -= 1  # changed without a turn passing
+    reply, last = state_api.state_update(game, last, 0)
+    assert reply["version"] == 1 and game.turns == 0
+    assert reply["changes"] == {"player": {"health": game.player.health}}
@@ -1,31 +1,48 @@
+from engine import build_game
+from item_data import get_basic_weapons
+from map_generator import generate_test_map
+from maps import MapRoom, Zone
+from messaging import render_events
+
+
 def test_generate_test_map_structure():
     rooms, start = generate_test_map()
     assert isinstance(rooms[start], MapRoom)
-    assert "center" in rooms[start].zones
-    assert isinstance(rooms[start].zones["center"], Zone)
+    centers = [zone for zone in rooms[start].zones.values() if zone.display_name == "Center"]
+    assert centers and isinstance(centers[0], Zone)
 
 def test_room_access_and_look():
     game = build_game("TestGuy")
-    look_lines = game.look()
+    look_lines = render_events(game.look())
     assert any("Entrance Hall" in line for line in look_lines)
     assert any("Exits:" in line for line in look_lines)
 
 def test_enemy_visibility_and_attack():
-    game = build_game("TestGuy")
+    game = build_game("TestGuy", seed=1)
+    game.player.weapon = get_basic_weapons()["knife"]
     enemies = game.room.visible_enemies()
     assert enemies, "Expected at least one visible enemy in starting room"
-    result = game.attack()
+    result = render_events(game.attack())
     assert any("damage" in line or "hit" in line for line in result)
 
 def test_movement_between_rooms():
     game = build_game("TestGuy")
-    result = game.move("e")
+    for _ in range(3):  # moving through an exit takes three turns
+        result = render_events(game.move("guardpost_doorway"))
     assert any("arrive" in line for line in result), "Expected arrival message"
     assert game.room.id == "guard_post"
 
 def test_flee_to_previous_room():
     game = build_game("TestGuy")
-    game.move("e")
-    result = game.flee()
+    for _ in range(3):
+        game.move("guardpost_doorway")
+    result = render_events(game.flee())
     assert game.room.id == "entrance_hall"
     assert any("flee" in line for line in result)
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_"):
+            check()
+            print(f"{name}: ok")
@@ -0,0 +1,220 @@
+# visibility.py
+# NOTE: What the player can perceive. An enemy is detected when
+# perception - stealth + (size - 5) >= 0, i.e. when perception reaches its
+# detection threshold (stealth - size + 5). Each zone's living enemies and
+# features are kept sorted by threshold, so "visible at perception P" is a
+# bisect; the sorted lists live in the room's index (map_utils.RoomIndex) and
+# are dropped when an enemy in the room dies, moves or changes stealth/size.
+# Line of sight spreads from the player's zone through zone_adjacency, losing
+# SIGHT_FALLOFF perception per step; VisibilityState keeps the result and
+# redoes only the zones whose sight level or contents changed.
+
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+from maps import MapRoom, Zone
+from enemy import Enemy
+from map_utils import room_index, zone_distances
+
+# Minimum perception to notice a feature; features not listed are always seen
+FEATURE_THRESHOLDS: Dict[str, int] = {}
+ALWAYS = float("-inf")
+SIGHT_FALLOFF = 2  # perception lost per zone between the player and what they look at
+
+
+def detection_threshold(enemy: Enemy) -> int:
+    """Lowest perception at which the enemy is detected."""
+    return enemy.stealth - enemy.size + 5
+
+
+def is_detected(enemy: Enemy, perception: int) -> bool:
+    return perception >= detection_threshold(enemy)
+
+
+def feature_threshold(feature: str) -> float:
+    return FEATURE_THRESHOLDS.get(feature, ALWAYS)
+
+
+def visible_features(features: List[str], perception: int) -> List[str]:
+    """Features (in their given order) noticed at this perception."""
+    return [feature for feature in features if feature_threshold(feature) <= perception]
+
+
+class ZoneSight:
+    """
+    A zone's living enemies and its features sorted by detection threshold,
+    with the answers for each perception already asked for. Results keep the
+    zone's own order.
+    """
+
+    __slots__ = ("_enemy_thresholds", "_enemies", "_feature_thresholds", "_features", "_seen")
+
+    def __init__(self, zone: Zone):
+        enemies = sorted((detection_threshold(enemy), i, enemy)
+                         for i, enemy in enumerate(zone.enemies) if enemy.is_alive())
+        self._enemy_thresholds = [threshold for threshold, _, _ in enemies]
+        self._enemies = [(i, enemy) for _, i, enemy in enemies]
+        features = sorted((feature_threshold(feature), i, feature) for i, feature in enumerate(zone.features))
+        self._feature_thresholds = [threshold for threshold, _, _ in features]
+        self._features = [(i, feature) for _, i, feature in features]
+        self._seen: Dict[int, Tuple[List[Enemy], List[str]]] = {}
+
+    def at(self, perception: int) -> Tuple[List[Enemy], List[str]]:
+        """(enemies, features) visible at this perception."""
+        seen = self._seen.get(perception)
+        if seen is None:
+            enemies = sorted(self._enemies[:bisect_right(self._enemy_thresholds, perception)], key=_position)
+            features = sorted(self._features[:bisect_right(self._feature_thresholds, perception)], key=_position)
+            seen = self._seen[perception] = ([enemy for _, enemy in enemies], [feature for _, feature in features])
+        return seen
+
+
+def _position(pair) -> int:
+    return pair[0]
+
+
+def zone_sight(room: MapRoom, zone_key: str) -> ZoneSight:
+    """The cached ZoneSight of one of the room's zones."""
+    sight = room_index(room).sight
+    zone_sight = sight.get(zone_key)
+    if zone_sight is None:
+        zone_sight = sight[zone_key] = ZoneSight(room.zones[zone_key])
+    return zone_sight
+
+
+def describe_zone(room: MapRoom, zone_key: str, perception: int) -> Dict[str, Any]:
+    """
+    What the player perceives of one zone of the room: its name and the
+    features and living enemies visible at this perception.
+
+    Args:
+        room (MapRoom): The room the zone belongs to.
+        zone_key (str): Internal name of the zone.
+        perception (int): Player's effective perception.
+
+    Returns:
+        dict: zone_name, features and enemies ({"name", "status"} each).
+    """
+    zone = room.zones.get(zone_key)
+    if not zone:
+        return {
+            "zone_name": "Unknown",
+            "features": [],
+            "enemies": []
+        }
+    enemies, features = zone_sight(room, zone_key).at(perception)
+    return {
+        "zone_name": zone.display_name,
+        "features": list(features),
+        "enemies": [{"name": enemy.name, "status": "alive"} for enemy in enemies]
+    }
+
+
+def sight_levels(room: MapRoom, origin: str, perception: int) -> Dict[str, int]:
+    """
+    Perception reaching each zone in line of sight from origin: perception
+    minus SIGHT_FALLOFF per step, for zones it reaches with 0 or more (origin
+    is always seen). If origin is not a zone of the room (the player's
+    position there is unknown), every zone is seen at full perception.
+    """
+    if origin not in room.zones:
+        return {key: perception for key in room.zones}
+    levels = {}
+    for key, distance in zone_distances(room, origin).items():
+        level = perception - SIGHT_FALLOFF * distance
+        if level < 0 and distance:
+            break  # distances only grow from here
+        levels[key] = level
+    return levels
+
+
+class VisibilityState:
+    """
+    What the player sees of the current room: the perception level reaching
+    each zone in sight, and the enemies visible in each. update() recomputes
+    only zones whose level changed (the player moved or their perception
+    changed) or whose contents changed (drained from the room index), and
+    keeps Zone.visible in step.
+    """
+
+    def __init__(self):
+        self.room: Optional[MapRoom] = None
+        self.origin: Optional[str] = None
+        self.perception: Optional[int] = None
+        self.levels: Dict[str, int] = {}
+        self.enemies: Dict[str, List[Enemy]] = {}  # zone -> visible enemies, for zones in sight
+
+    def reset(self):
+        if self.room is not None:
+            for key in self.levels:
+                self.room.zones[key].visible = False
+        self.__init__()
+
+    def update(self, room: MapRoom, origin: str, perception: int) -> List[str]:
+        """
+        Bring the state up to date.
+
+        Returns:
+            List[str]: Zones whose visible contents were recomputed.
+        """
+        index = room_index(room)
+        if room is not self.room:
+            self.reset()
+            self.room = room
+            for zone in room.zones.values():
+                zone.visible = False
+            index.changed_zones.clear()
+
+        changed = set()
+        if origin != self.origin or perception != self.perception:
+            levels = sight_levels(room, origin, perception)
+            for key in self.levels.keys() - levels.keys():
+                room.zones[key].visible = False
+                del self.enemies[key]
+            changed = {key for key, level in levels.items() if self.levels.get(key) != level}
+            self.levels, self.origin, self.perception = levels, origin, perception
+
+        if index.changed_zones:
+            changed |= index.changed_zones & self.levels.keys()
+            index.changed_zones.clear()
+
+        for key in changed:
+            room.zones[key].visible = True
+            self.enemies[key] = zone_sight(room, key).at(self.levels[key])[0]
+        return sorted(changed, key=index.zone_order.get)
+
+    def visible_enemies(self) -> List[Enemy]:
+        """Enemies in sight, in zone order."""
+        enemies = self.enemies
+        return [enemy for key in self.room.zones if key in enemies for enemy in enemies[key]] if self.room else []
+
+
+def describe_view(state: VisibilityState, zone_key: str) -> Dict[str, Any]:
+    """
+    describe_zone() of the player's zone, plus the enemies seen in the other
+    zones in line of sight.
+
+    Args:
+        state (VisibilityState): Up-to-date visibility of the player's room.
+        zone_key (str): Internal name of the player's zone.
+
+    Returns:
+        dict: describe_zone() output with "in_sight", a list of
+            {"zone_name", "enemies"} for visible zones holding visible enemies, in zone order.
+    """
+    room = state.room
+    view = describe_zone(room, zone_key, state.perception)
+    view["in_sight"] = [
+        {"zone_name": zone.display_name,
+         "enemies": [{"name": enemy.name, "status": "alive"} for enemy in state.enemies[key]]}
+        for key, zone in room.zones.items()
+        if zone.visible and key != zone_key and state.enemies.get(key)
+    ]
+    return view
+
+
+def update_visibility_state(game) -> VisibilityState:
+    """Refresh game.visibility for the player's current room, zone and perception."""
+    state = game.visibility
+    state.update(game.room, game.player_zone, game.get_effective_perception())
+    return state
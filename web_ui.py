@@ -1,46 +1,47 @@
 # web_ui.py
 
-from flask import Flask, render_template_string, request
-from engine import build_game
+from flask import Flask, jsonify, make_response, render_template_string, request
+from engine import build_game, run_command
+from events import NoticeEvent
+from messaging import JSON_RENDERERS, render_events
+from session_store import SessionStore
+from state_api import state_update
 
 app = Flask(__name__)
-game = None
+sessions = SessionStore()
+SESSION_COOKIE = "crawler_session"
 
 
 @app.route("/", methods=["GET", "POST"])
 def home():
-    global game
+    session_id = request.cookies.get(SESSION_COOKIE)
     output = []
 
     if request.method == "POST":
         cmd = request.form.get("command", "").strip().lower()
         if cmd == "start":
             name = request.form.get("name", "Adventurer")
-            game = build_game(name)
-            output = game.look()
-        elif game:
-            if cmd in ["n", "e", "s", "w"]:
-                output = game.move(cmd)
-            elif cmd == "a":
-                output = game.attack()
-            elif cmd == "r":
-                output = game.flee()
-            elif cmd == "look":
-                output = game.look()
-            elif cmd == "quit":
-                output = ["Thanks for playing!"]
-                game = None
-            else:
-                output = ["Unknown command."]
-
-    return render_template_string("""
+            sessions.discard(session_id)
+            session_id = sessions.create(build_game(name))
+            with sessions.session(session_id) as game:
+                output = render_events(game.look())
+        else:
+            with sessions.session(session_id) as game:
+                if game and cmd == "quit":
+                    output = ["Thanks for playing!"]
+                    sessions.discard(session_id)
+                elif game:
+                    output = render_events(run_command(game, cmd))
+
+    playing = session_id in sessions
+    response = make_response(render_template_string("""
     <h1>🧱 Dungeon Crawler</h1>
     <form method="post">
         {% if not game %}
             <input name="name" placeholder="Enter your name" required>
             <button name="command" value="start">Start</button>
         {% else %}
-            <input name="command" placeholder="Enter command (n/e/s/w/a/r/look/quit)">
+            <input name="command" placeholder="Enter command (exit name/a/r/look/go <place>/quit)">
             <button type="submit">Go</button>
         {% endif %}
     </form>
@@ -49,4 +50,51 @@ def home():
     </pre>
     """,
                                   output=output,
-                                  game=game)
+                                  game=playing))
+    if playing:
+        response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="Lax")
+    else:
+        response.delete_cookie(SESSION_COOKIE)
+    return response
+
+
+@app.route("/api/command", methods=["POST"])
+def api_command():
+    """
+    JSON API. Body: {"command": ..., "since": <version>, "name": <for start>}.
+    Replies with the command's events and a state delta against `since`.
+    """
+    payload = request.get_json(silent=True) or {}
+    cmd = str(payload.get("command", "")).strip().lower()
+    session_id = request.cookies.get(SESSION_COOKIE)
+
+    if cmd == "start":
+        sessions.discard(session_id)
+        session_id = sessions.create(build_game(str(payload.get("name") or "Adventurer")))
+
+    with sessions.locked(session_id) as session:
+        if session is None:
+            return jsonify({"error": "No game in progress."}), 404
+        if cmd == "quit":
+            sessions.discard(session_id)
+            response = jsonify({"events": render_events([NoticeEvent("text", {"text": "Thanks for playing!"})], JSON_RENDERERS)})
+            response.delete_cookie(SESSION_COOKIE)
+            return response
+
+        events = session.game.look() if cmd == "start" else run_command(session.game, cmd)
+        state, session.client_state = state_update(session.game, session.client_state, payload.get("since"))
+
+    response = jsonify({"events": render_events(events, JSON_RENDERERS), "state": state})
+    response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="Lax")
+    return response
+
+
+@app.route("/api/state")
+def api_state():
+    """Current state, as a delta when ?since= matches the last version sent."""
+    since = request.args.get("since", type=int)
+    with sessions.locked(request.cookies.get(SESSION_COOKIE)) as session:
+        if session is None:
+            return jsonify({"error": "No game in progress."}), 404
+        state, session.client_state = state_update(session.game, session.client_state, since)
+    return jsonify({"state": state})
@@ -0,0 +1,119 @@
+# world.py
+# NOTE: Shared world prototypes. A map is generated once per process and shared
+# by every Game; each Game holds a RoomTable overlay that copies a room the
+# first time the player enters it, so untouched rooms cost nothing per session.
+# Enemies of prototype rooms and of each table's claimed rooms live in their
+# own ActorStore.
+
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, Mapping, MutableMapping, Tuple
+
+from actor_store import ActorStore
+from enemy import Enemy
+from maps import MapRoom
+
+
+@dataclass(frozen=True)
+class WorldPrototype:
+    name: str
+    rooms: Mapping[str, MapRoom]  # read-only view; never handed out for mutation
+    start_key: str
+
+
+def _test_map() -> Tuple[Dict[str, MapRoom], str]:
+    from map_generator import generate_test_map
+    return generate_test_map()
+
+
+# Map generators that can back a prototype, by name (the name is what snapshots store)
+GENERATORS: Dict[str, Callable[[], Tuple[Dict[str, MapRoom], str]]] = {
+    "test_map": _test_map,
+}
+
+
+@lru_cache(maxsize=None)
+def get_prototype(name: str = "test_map") -> WorldPrototype:
+    """Generate (once per process) and return the named world prototype."""
+    rooms, start_key = GENERATORS[name]()
+    actors = ActorStore()
+    for room in rooms.values():
+        actors.add_room(room)
+    return WorldPrototype(name=name, rooms=MappingProxyType(rooms), start_key=start_key)
+
+
+def copy_room(room: MapRoom) -> MapRoom:
+    """
+    Copy everything a session can change (zones, their lists, enemies and
+    their effects). Exits, adjacency and enemy traits/attack modes are static
+    and stay shared with the prototype. The copy is not attached to any
+    ActorStore.
+    """
+    zones = {
+        key: replace(
+            zone,
+            features=list(zone.features),
+            enemies=[Enemy.from_state(enemy.state()) for enemy in zone.enemies],
+            hidden_items=list(zone.hidden_items),
+        )
+        for key, zone in room.zones.items()
+    }
+    return replace(room, zones=zones)
+
+
+class RoomTable(MutableMapping):
+    """
+    Game.rooms backed by a shared prototype. Lookups return the session's own
+    copy of a room if it has one and the shared prototype room otherwise, so
+    rooms read this way must be treated as read-only. claim() is the write
+    barrier: Game.room goes through it, which makes the current room (the only
+    one the engine mutates) private to the session. Claimed rooms share the
+    table's ActorStore.
+    """
+
+    def __init__(self, prototype: WorldPrototype, overlay: Dict[str, MapRoom] = None):
+        self.prototype = prototype
+        self.overlay: Dict[str, MapRoom] = {}
+        self.actors = ActorStore(capacity=16)
+        for room_id, room in (overlay or {}).items():
+            self[room_id] = room
+
+    def claim(self, room_id: str) -> MapRoom:
+        """Return this session's private copy of a room, copying it on first use."""
+        room = self.overlay.get(room_id)
+        if room is None:
+            room = self[room_id] = copy_room(self.prototype.rooms[room_id])
+        return room
+
+    def is_claimed(self, room_id: str) -> bool:
+        return room_id in self.overlay
+
+    def __getitem__(self, room_id: str) -> MapRoom:
+        room = self.overlay.get(room_id)
+        return room if room is not None else self.prototype.rooms[room_id]
+
+    def __setitem__(self, room_id: str, room: MapRoom):
+        if room.actors is None:
+            self.actors.add_room(room)
+        self.overlay[room_id] = room
+
+    def __delitem__(self, room_id: str):
+        if room_id in self.prototype.rooms:
+            raise TypeError(f"cannot remove prototype room '{room_id}'")
+        del self.overlay[room_id]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.prototype.rooms
+        for room_id in self.overlay:
+            if room_id not in self.prototype.rooms:
+                yield room_id
+
+    def __len__(self) -> int:
+        return len(self.prototype.rooms) + sum(1 for room_id in self.overlay if room_id not in self.prototype.rooms)
+
+    def __contains__(self, room_id) -> bool:
+        return room_id in self.overlay or room_id in self.prototype.rooms
+
+    def __repr__(self) -> str:
+        return f"RoomTable({self.prototype.name!r}, claimed={list(self.overlay)})"